@@ -30,7 +30,7 @@ async def send_message(
     실행 중인 LangGraph에 메시지 전송
     채팅방이 생성되어 LangGraph가 실행 중인 상태에서 호출
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:  # 메시지 전송 처리 시작
         print(f"메시지 전송: conversation_id={conversation_id}, member_id={request.member_id}")
@@ -42,7 +42,7 @@ async def send_message(
             message_text=request.message_text
         )
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         processing_time = int((end_time - start_time) * 1000)  # 처리 시간 계산 (밀리초)
         
         print(f"메시지 응답 생성 완료, 메시지 처리 시간: {processing_time}ms")
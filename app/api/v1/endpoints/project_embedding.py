@@ -121,7 +121,7 @@ async def store_batch_projects(
         BatchEmbeddingResponse: 배치 처리 결과
     """
     import time
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         batch_id = batch_data.batch_id or str(uuid.uuid4())
@@ -173,7 +173,7 @@ async def store_batch_projects(
                 failed_count += 1
         
         # 처리 시간 계산
-        end_time = time.time()
+        end_time = time.perf_counter()
         processing_time_ms = (end_time - start_time) * 1000
         
         # 전체 상태 결정
@@ -195,7 +195,7 @@ async def store_batch_projects(
         )
         
     except Exception as e:
-        end_time = time.time()
+        end_time = time.perf_counter()
         processing_time_ms = (end_time - start_time) * 1000
         
         print(f"배치 프로젝트 저장 실패: {str(e)}")
@@ -211,8 +211,8 @@ async def get_user_vectordb_stats(
      개인정보 보호: 해당 사용자의 데이터만 접근 가능
     """
     try:
-        from app.utils.session_vectordb_builder import session_vectordb_builder
-        stats = session_vectordb_builder.get_user_session_stats(member_id)
+        from app.utils.session_vectordb_builder import get_session_vectordb_builder
+        stats = get_session_vectordb_builder().get_user_session_stats(member_id)
         return {
             "status": "success",
             "member_id": member_id,
@@ -268,8 +268,8 @@ async def search_user_sessions(
                 "timestamp": datetime.utcnow().isoformat()
             }
         
-        from app.utils.session_vectordb_builder import session_vectordb_builder
-        results = session_vectordb_builder.search_user_sessions(member_id, query, k)
+        from app.utils.session_vectordb_builder import get_session_vectordb_builder
+        results = get_session_vectordb_builder().search_user_sessions(member_id, query, k)
         
         return {
             "status": "success",
@@ -0,0 +1,32 @@
+# app/config/openai_config.py
+"""
+* @className : OpenAIConfig
+* @description : OpenAI 호출 설정 모듈
+*                응답 생성 노드가 매 요청마다 환경변수를 읽고 파싱하지 않도록
+*                import 시점에 한 번 만든 불변 설정 객체를 제공합니다.
+*
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config.settings import settings
+
+
+@dataclass(frozen=True, slots=True)
+class OpenAIConfig:
+    api_key: Optional[str]
+    model: str
+    max_tokens: int
+    temperature: float
+    history_token_budget: int
+    history_max_turns: int
+
+
+OPENAI_CONFIG = OpenAIConfig(
+    api_key=settings.openai_api_key,
+    model=settings.openai_model,
+    max_tokens=settings.openai_max_tokens,
+    temperature=settings.openai_temperature,
+    history_token_budget=settings.openai_history_token_budget,
+    history_max_turns=settings.openai_history_max_turns,
+)
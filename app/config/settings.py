@@ -15,6 +15,8 @@ class Settings(BaseSettings):
     openai_model: str = "gpt-3.5-turbo"
     openai_max_tokens: int = 1000
     openai_temperature: float = 0.7
+    openai_history_token_budget: int = 3000  # 이전 대화 히스토리에 사용할 최대 토큰 수
+    openai_history_max_turns: int = 10  # 이전 대화 히스토리에 포함할 최대 턴 수 (user+assistant 1쌍 = 1턴)
     
     # ChromaDB 설정
     chroma_host: str = "chromadb-1.chromadb"  # k8s 내부 접근
@@ -6,6 +6,7 @@
 *                서비스 컨테이너와 주요 컴포넌트 인스턴스를 제공합니다.
 *
 """
+import os
 from functools import lru_cache
 from typing import Annotated
 from fastapi import Depends
@@ -13,6 +14,9 @@ from fastapi import Depends
 from app.services.chat_service import ChatService
 from app.services.conversation_history_manager import ConversationHistoryManager
 from app.services.chroma_service import ChromaService
+from app.config.openai_config import OPENAI_CONFIG
+from app.services.response_semantic_cache import ResponseSemanticCache
+from app.services.embedding_service import EmbeddingService
 
 class ServiceContainer:
     """
@@ -25,6 +29,9 @@ class ServiceContainer:
         self._history_manager = None
         self._chroma_service = None
         self._career_vectordb_service = None
+        self._response_cache = None
+        self._embedding_service = None
+        self._openai_client = None
         print("ServiceContainer 초기화")
     
     @property
@@ -35,6 +42,40 @@ class ServiceContainer:
             self._history_manager = ConversationHistoryManager(max_messages=20)
         return self._history_manager
     
+    @property
+    def response_cache(self) -> ResponseSemanticCache:
+        """ResponseSemanticCache 싱글톤"""
+        if self._response_cache is None:
+            print("ResponseSemanticCache 싱글톤 생성")
+            self._response_cache = ResponseSemanticCache(max_entries=64, threshold=0.92, ttl_seconds=1800)
+        return self._response_cache
+    
+    @property
+    def embedding_service(self) -> EmbeddingService:
+        """EmbeddingService 싱글톤"""
+        if self._embedding_service is None:
+            print("EmbeddingService 싱글톤 생성")
+            self._embedding_service = EmbeddingService(
+                model=os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+            )
+        return self._embedding_service
+    
+    @property
+    def openai_client(self):
+        """AsyncOpenAI 싱글톤 - 요청마다 클라이언트를 만들지 않고 커넥션 풀 공유"""
+        if self._openai_client is None:
+            print("AsyncOpenAI 클라이언트 싱글톤 생성")
+            import httpx
+            from openai import AsyncOpenAI
+            self._openai_client = AsyncOpenAI(
+                api_key=OPENAI_CONFIG.api_key,
+                max_retries=2,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_keepalive_connections=32, max_connections=100)
+                )
+            )
+        return self._openai_client
+    
     @property  
     def chat_service(self) -> ChatService:
         """ChatService 싱글톤"""
@@ -3,6 +3,18 @@ from langchain.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 import json
 import logging
+from functools import lru_cache
+
+import orjson
+
+
+def _dump_user_profile(user_data: Dict[str, Any]) -> str:
+    """사용자 프로필을 프롬프트용 JSON 문자열로 직렬화 (orjson 우선, 지원하지 않는 타입이 있으면 json으로 대체)"""
+    try:
+        return orjson.dumps(user_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    except TypeError:  # orjson.JSONEncodeError 포함
+        return json.dumps(user_data, ensure_ascii=False, indent=2)
+
 
 class IntentAnalysisAgent:
     """
@@ -40,6 +52,35 @@ class IntentAnalysisAgent:
         # 커리어 검색 키워드 추출
         return self._perform_unified_analysis(user_question, user_data, chat_history)
     
+    async def aanalyze_intent_and_context(self, 
+                                        user_question: str, 
+                                        user_data: Dict[str, Any], 
+                                        chat_history: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+         사용자 의도 종합 분석 (비동기)
+        
+        analyze_intent_and_context와 동일한 분석을 수행하되 LLM 호출을
+        await 하므로 다른 I/O 작업과 동시에 실행할 수 있습니다.
+        
+        Args:
+            user_question: 사용자 질문
+            user_data: 사용자 프로필 정보
+            chat_history: 과거 대화 내역
+            
+        Returns:
+            Dict: 의도 분석 결과 (career_history 키워드 포함)
+        """
+        
+        self.logger.info("의도 분석 시작 (비동기)")
+        
+        messages = self._build_analysis_messages(user_question, user_data, chat_history)
+        try:
+            response = await self.llm.ainvoke(messages)
+        except Exception as e:
+            self.logger.error(f"키워드 추출 분석 실패: {e}")
+            raise e
+        return self._parse_analysis_response(response)
+    
     def _perform_unified_analysis(self, user_question: str, user_data: Dict[str, Any], chat_history: List[Dict[str, str]]) -> Dict[str, Any]:
         """
          통합 의도 분석 수행
@@ -56,6 +97,18 @@ class IntentAnalysisAgent:
             Dict: career_history 키워드 배열을 포함한 분석 결과
         """
         
+        messages = self._build_analysis_messages(user_question, user_data, chat_history)
+        try:
+            # LLM 호출
+            response = self.llm.invoke(messages)
+        except Exception as e:
+            self.logger.error(f"키워드 추출 분석 실패: {e}")
+            raise e
+        return self._parse_analysis_response(response)
+    
+    def _build_analysis_messages(self, user_question: str, user_data: Dict[str, Any], chat_history: List[Dict[str, str]]) -> list:
+        """의도 분석 LLM 호출용 프롬프트 메시지 구성"""
+        
         # 과거 대화내역 요약
         chat_summary = self._summarize_chat_history(chat_history)
         
@@ -84,17 +137,22 @@ class IntentAnalysisAgent:
 """)
         ])
         
+        return prompt.format_messages(
+            question=user_question,
+            user_profile=_dump_user_profile(user_data),
+            chat_summary=chat_summary
+        )
+    
+    def _parse_analysis_response(self, response: Any) -> Dict[str, Any]:
+        """의도 분석 LLM 응답을 JSON으로 파싱하고 필수 필드를 검증"""
         try:
-            # LLM 호출
-            response = self.llm.invoke(prompt.format_messages(
-                question=user_question,
-                user_profile=json.dumps(user_data, ensure_ascii=False, indent=2),
-                chat_summary=chat_summary
-            ))
-            
             # JSON 파싱 시도
             content = response.content.strip()
             
+            # JSON 객체가 없는 순수 텍스트 응답은 코드 블록 처리 없이 바로 실패 처리
+            if '{' not in content:
+                raise json.JSONDecodeError("응답에 JSON 객체가 없음", content, 0)
+            
             # 마크다운 코드 블록 제거
             if content.startswith('```'):
                 lines = content.split('\n')
@@ -161,3 +219,9 @@ class IntentAnalysisAgent:
                 chat_items.append(f"- {content}...")
         
         return "\n".join(chat_items) if chat_items else "과거 대화내역 없음"
+
+
+@lru_cache()
+def get_intent_analysis_agent() -> IntentAnalysisAgent:
+    """IntentAnalysisAgent 싱글톤 - 요청 간 상태가 없으므로 프로세스 전체에서 하나만 생성"""
+    return IntentAnalysisAgent()
@@ -8,14 +8,83 @@
 """
 
 from typing import Dict, Any, Optional, List, Union
+import io
 import logging
 from datetime import datetime
+from functools import lru_cache
+from cachetools import LRUCache
 import openai
 import os
 import json
-import markdown
 import re
 
+
+@lru_cache(maxsize=1024)
+def _display_key(key: str) -> str:
+    """JSON 키를 표시용 제목으로 변환 (언더스코어 → 공백, 타이틀 케이스) - 같은 키는 반복 변환하지 않음"""
+    return key.replace('_', ' ').title()
+
+
+# 값이 비어 있음을 뜻하는 문자열 표기 (_format_value에서 '정보 없음'으로 통일)
+_EMPTY_VALUE_MARKERS = frozenset(('*정보 없음*', '정보 없음', 'N/A', 'n/a', 'null', 'undefined'))
+
+# 마크다운 들여쓰기 문자열 (중첩 단계마다 새로 만들지 않도록 미리 생성, 더 깊은 단계만 즉석 생성)
+_MARKDOWN_INDENTS = tuple("  " * depth for depth in range(8))
+
+
+# 커리어 사례 메타데이터 → 한국어 표기 (사례마다 딕셔너리를 새로 만들지 않도록 모듈 상수로 유지)
+_EXPERIENCE_LEVEL_KR = {
+    'junior': '주니어',
+    'mid-level': '중급',
+    'senior': '시니어',
+    'expert': '전문가'
+}
+_CAREER_CONTINUITY_KR = {
+    'continuous': '연속적',
+    'with_gaps': '단절 있음'
+}
+
+# 컨텍스트 섹션의 고정 머리말/활용 가이드 - 매 요청 문자열을 이어 붙이지 않고 한 번만 만들어 재사용
+_CAREER_SECTION_HEADER = (
+    " **실제 사내 커리어 사례 참고 자료**:\n"
+    "저희 회사 구성원들의 실제 커리어 경험입니다. 상담할 때 자연스럽게 참고해주세요.\n\n"
+)
+_CAREER_SECTION_GUIDE = (
+    "\n**� 사례 활용 가이드:**\n"
+    "- 상담할 때 '저희 회사에서 비슷한 경험을 한 분이 있는데요...' 같이 자연스럽게 언급\n"
+    "- 구체적인 Employee ID나 상세 정보를 자연스럽게 대화에 녹여서 설명\n"
+    "- 사용자 상황과 유사한 사례를 찾아서 경험과 조언을 공유하는 방식으로 활용\n"
+    "- 딱딱한 사례 나열보다는 '그분 같은 경우에는...' 식으로 편안하게 설명\n"
+    "- 성장 과정, 어려웠던 점, 극복 방법 등을 스토리텔링 방식으로 전달\n"
+)
+_PAST_CONVERSATIONS_HEADER = (
+    "**과거 모든 채팅 세션의 관련 대화내역**:\n"
+    "이전 세션들에서 관련성이 높은 대화 내용들입니다. 사용자의 과거 질문과 상담 이력을 참고하여 연속성 있는 상담을 제공하세요.\n\n"
+)
+_PAST_CONVERSATIONS_GUIDE = (
+    "\n** 과거 대화 활용 가이드:**\n"
+    "- 사용자가 '이전에', '전에', '과거에' 등의 표현을 사용하면 위 과거 대화 내용을 구체적으로 언급\n"
+    "- '이전에 비슷한 질문을 해주셨었는데요...' 식으로 자연스럽게 연결\n"
+    "- 과거 상담 내용과 현재 질문을 연결하여 발전적인 조언 제공\n"
+    "- 사용자의 성장 과정이나 관심사의 변화를 파악하여 개인화된 상담 진행\n"
+    "- 과거 대화 요약과 주요 내용을 바탕으로 구체적이고 맥락 있는 답변 제공\n"
+)
+_NEWS_SECTION_HEADER = (
+    "**최신 업계 뉴스 및 트렌드 정보**:\n"
+    "업계 최신 소식과 채용 트렌드 정보입니다. 사용자 질문과 관련된 경우 자연스럽게 활용해주세요.\n\n"
+)
+_NEWS_SECTION_GUIDE = (
+    "\n** 뉴스 활용 가이드:**\n"
+    "- 업계 트렌드나 채용 시장 질문 시 '최근 뉴스를 보니까...' 식으로 자연스럽게 인용\n"
+    "- 출처와 발행일을 간단히 언급하여 신뢰성 확보 ('3월 테크뉴스에 따르면...')\n"
+    "- 뉴스 내용을 단순 나열하지 말고 사용자 상황에 맞는 실용적 조언과 연결\n"
+    "- AI, 금융, 반도체, 제조 등 도메인별 전문 정보 제공\n"
+    "- 채용 트렌드, 연봉 정보, 필요 기술 등을 구체적으로 활용\n"
+    "- **최신/트렌드 질문 시**: 뉴스 데이터를 가장 우선적으로 활용하여 현재 상황 설명\n"
+    "- **구체적 인용**: '○○ 뉴스에서 보도된 바에 따르면...' 식으로 정확한 출처 명시\n"
+)
+
+
 class ResponseFormattingAgent:
     """
     LLM 기반 적응적 응답 포맷팅 에이전트
@@ -28,6 +97,7 @@ class ResponseFormattingAgent:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.client = None  # OpenAI 클라이언트를 지연 초기화
+        self._md_cache: LRUCache = LRUCache(maxsize=256)  # _dict_to_markdown 결과 캐시 (최근 사용한 프로필 재사용)
         
         self.system_prompt = """
 G.Navi AI 커리어 컨설팅 시스템의 친근한 커리어 코치로 활동하세요.
@@ -135,56 +205,100 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
 
     def _dict_to_markdown(self, data: Union[Dict, List, Any], depth: int = 0, show_empty: bool = True) -> str:
         """dict, list 등의 JSON 타입을 사람이 읽기 쉬운 마크다운으로 변환"""
-        indent = "  " * depth
+        if not isinstance(data, (dict, list)):
+            return self._format_value(data, show_empty)
+        
+        # 중첩 단계마다 문자열을 합치지 않고 하나의 줄 목록에 모은 뒤 마지막에 한 번만 결합
+        markdown_lines: List[str] = []
+        self._append_markdown_lines(data, depth, show_empty, markdown_lines, {})
+        return "\n".join(markdown_lines)
+    
+    def _append_markdown_lines(self, data: Union[Dict, List], depth: int, show_empty: bool,
+                               out: List[str], rendered: Dict[tuple, tuple]) -> None:
+        """
+        _dict_to_markdown의 재귀 본체 - 변환된 줄을 out에 바로 추가
+        
+        rendered: 한 번의 변환 안에서 (객체 id, 깊이) → (줄 목록, 시작, 끝) 위치를 기록하여
+                  같은 하위 구조가 여러 번 참조되면 다시 순회하지 않고 기존 줄을 복사
+        """
+        memo_key = (id(data), depth)
+        previous = rendered.get(memo_key)
+        if previous is not None:
+            source, begin, end = previous
+            out.extend(source[begin:end])
+            return
+        
+        begin = len(out)
+        self._render_markdown_lines(data, depth, show_empty, out, rendered)
+        rendered[memo_key] = (out, begin, len(out))
+    
+    def _render_markdown_lines(self, data: Union[Dict, List], depth: int, show_empty: bool,
+                               out: List[str], rendered: Dict[tuple, tuple]) -> None:
+        """dict/list 한 단계를 마크다운 줄로 변환 (중첩 구조는 _append_markdown_lines로 재귀)"""
+        indent = _MARKDOWN_INDENTS[depth] if depth < len(_MARKDOWN_INDENTS) else "  " * depth
+        start = len(out)
         
         if isinstance(data, dict):
-            if not data:
-                return "*(내용 없음)*" if show_empty else ""
-            
-            markdown_lines = []
             for key, value in data.items():
                 # 키 정리 (언더스코어를 공백으로 변환하고 타이틀 케이스 적용)
-                display_key = key.replace('_', ' ').title()
+                display_key = _display_key(key)
                 
                 if isinstance(value, (dict, list)):
-                    nested_content = self._dict_to_markdown(value, depth + 1, show_empty)
-                    if nested_content.strip() or show_empty:  # show_empty가 True면 빈 내용도 표시
-                        markdown_lines.append(f"{indent}- **{display_key}:**")
-                        markdown_lines.append(nested_content)
+                    header_index = len(out)
+                    out.append(f"{indent}- **{display_key}:**")
+                    self._append_markdown_lines(value, depth + 1, show_empty, out, rendered)
+                    if len(out) == header_index + 1:  # 중첩 내용이 없으면 제목도 제거 (show_empty가 False인 경우)
+                        out.pop()
                 else:
                     formatted_value = self._format_value(value, show_empty)
                     if formatted_value or show_empty:  # show_empty가 True면 빈 값도 표시
-                        markdown_lines.append(f"{indent}- **{display_key}:** {formatted_value}")
+                        out.append(f"{indent}- **{display_key}:** {formatted_value}")
             
-            return "\n".join(markdown_lines) if markdown_lines else ("*(내용 없음)*" if show_empty else "")
+            if len(out) == start and show_empty:
+                out.append("*(내용 없음)*")
+            return
         
-        elif isinstance(data, list):
-            if not data:
-                return "*(빈 목록)*" if show_empty else ""
-            
-            markdown_lines = []
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    nested_content = self._dict_to_markdown(item, depth + 1, show_empty)
-                    if nested_content.strip() or show_empty:  # show_empty가 True면 빈 내용도 표시
-                        # 딕셔너리 리스트의 경우 더 깔끔하게 표시
-                        if isinstance(item, dict) and len(item) <= 3 and not show_empty:
-                            # 간단한 딕셔너리는 한 줄로 표시 (show_empty가 False일 때만)
-                            summary = self._create_dict_summary(item)
-                            if summary:
-                                markdown_lines.append(f"{indent}{len([x for x in markdown_lines if x.strip()]) + 1}. {summary}")
-                        else:
-                            markdown_lines.append(f"{indent}{len([x for x in markdown_lines if x.strip()]) + 1}. ")
-                            markdown_lines.append(nested_content)
+        # 리스트 번호는 이 단계에서 추가한 항목 수 기준 (중첩 블록은 하나의 항목으로 계산)
+        item_count = 0
+        for item in data:
+            if isinstance(item, (dict, list)):
+                if isinstance(item, dict) and len(item) <= 3 and not show_empty:
+                    # 간단한 딕셔너리는 한 줄로 표시 (show_empty가 False일 때만, 표시할 내용이 있는 경우)
+                    nested_lines: List[str] = []
+                    self._append_markdown_lines(item, depth + 1, show_empty, nested_lines, rendered)
+                    if nested_lines:
+                        summary = self._create_dict_summary(item)
+                        if summary:
+                            item_count += 1
+                            out.append(f"{indent}{item_count}. {summary}")
                 else:
-                    formatted_item = self._format_value(item, show_empty)
-                    if formatted_item or show_empty:  # show_empty가 True면 빈 값도 표시
-                        markdown_lines.append(f"{indent}{len([x for x in markdown_lines if x.strip()]) + 1}. {formatted_item}")
-            
-            return "\n".join(markdown_lines) if markdown_lines else ("*(빈 목록)*" if show_empty else "")
+                    header_index = len(out)
+                    out.append(f"{indent}{item_count + 1}. ")
+                    self._append_markdown_lines(item, depth + 1, show_empty, out, rendered)
+                    if len(out) == header_index + 1:  # 중첩 내용이 없으면 번호 줄도 제거
+                        out.pop()
+                    else:
+                        item_count += 2
+            else:
+                formatted_item = self._format_value(item, show_empty)
+                if formatted_item or show_empty:  # show_empty가 True면 빈 값도 표시
+                    item_count += 1
+                    out.append(f"{indent}{item_count}. {formatted_item}")
         
-        else:
-            return self._format_value(data, show_empty)
+        if len(out) == start and show_empty:
+            out.append("*(빈 목록)*")
+    
+    def _dict_to_markdown_cached(self, data: Union[Dict, List, Any], show_empty: bool = True) -> str:
+        """동일한 데이터에 대한 _dict_to_markdown 결과를 재사용 (최근 사용한 256개, 초과 시 가장 오래 쓰지 않은 항목부터 제거)"""
+        # 마크다운 출력이 키 순서에 의존하므로 sort_keys 없이 직렬화하여 키로 사용
+        key = (show_empty, json.dumps(data, ensure_ascii=False, default=str))
+        hit = self._md_cache.get(key)
+        if hit is not None:
+            return hit
+        
+        result = self._dict_to_markdown(data, show_empty=show_empty)
+        self._md_cache[key] = result
+        return result
     
     def _create_dict_summary(self, data: dict) -> str:
         """딕셔너리를 간단한 요약 문자열로 변환"""
@@ -194,7 +308,7 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
         # 모든 필드 포함
         items = []
         for key, value in data.items():
-            display_key = key.replace('_', ' ').title()
+            display_key = _display_key(key)
             formatted_value = self._format_value(value)
             if formatted_value:
                 items.append(f"{display_key}: {formatted_value}")
@@ -203,21 +317,11 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
     
     def _format_value(self, value: Any, show_empty: bool = True) -> str:
         """값을 사용자 친화적으로 포맷팅"""
-        if value is None:
-            return "*정보 없음*" if show_empty else ""
-        elif isinstance(value, bool):
-            return "예" if value else "아니오"
-        elif isinstance(value, (int, float)):
-            # 특별한 숫자 값들 처리
-            if value == 1.0 and isinstance(value, float):
-                return "100%"  # confidence_score 같은 경우
-            return f"{value:,}"
-        elif isinstance(value, str):
-            # 빈 문자열 처리
-            if not value.strip():
-                return "*정보 없음*" if show_empty else ""
-            # 특정 패턴들 처리
-            if value.strip() in ['*정보 없음*', '정보 없음', 'N/A', 'n/a', 'null', 'undefined']:
+        # 대부분의 값이 문자열이므로 문자열 여부를 먼저 확인
+        if isinstance(value, str):
+            # 빈 문자열 및 '정보 없음' 류 값 처리 (strip은 한 번만 수행)
+            stripped = value.strip()
+            if not stripped or stripped in _EMPTY_VALUE_MARKERS:
                 return "*정보 없음*" if show_empty else ""
             
             # 이스케이프 문자 처리
@@ -227,6 +331,15 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
             if len(processed_value) > 100:
                 return f"{processed_value[:100]}..."
             return processed_value
+        elif value is None:
+            return "*정보 없음*" if show_empty else ""
+        elif isinstance(value, bool):
+            return "예" if value else "아니오"
+        elif isinstance(value, (int, float)):
+            # 특별한 숫자 값들 처리
+            if value == 1.0 and isinstance(value, float):
+                return "100%"  # confidence_score 같은 경우
+            return f"{value:,}"
         else:
             return str(value) if str(value) != 'None' else ("*정보 없음*" if show_empty else "")
 
@@ -378,7 +491,7 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
         # 사용자 프로필
         # 새로운 JSON 구조: {name: "", projects: [...]}
         if user_data and isinstance(user_data, dict) and any(user_data.values()):
-            user_profile_md = self._dict_to_markdown(user_data, show_empty=False)
+            user_profile_md = self._dict_to_markdown_cached(user_data, show_empty=False)
             if user_profile_md.strip():
                 context_sections.append(f"""
 사용자 프로필:
@@ -399,8 +512,7 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
         # 커리어 사례
         career_cases_to_use = career_cases if career_cases else []
         if career_cases_to_use:
-            career_section = " **실제 사내 커리어 사례 참고 자료**:\n"
-            career_section += "저희 회사 구성원들의 실제 커리어 경험입니다. 상담할 때 자연스럽게 참고해주세요.\n\n"
+            career_parts = [_CAREER_SECTION_HEADER]  # 조각을 모아 마지막에 한 번만 결합
             
             added_cases = 0
             for i, case in enumerate(career_cases_to_use[:5]):  # 최대 5개 사례 표시
@@ -416,22 +528,18 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
                             employee_id = metadata.get('employee_id', '')
                             employee_name = metadata.get('name', '')
                     
-                    career_section += f"\n### **사례 {added_cases}: {employee_name if employee_name else '익명'} {f'({employee_id})' if employee_id else ''}**\n{case_md}\n"
+                    career_parts.append(f"\n### **사례 {added_cases}: {employee_name if employee_name else '익명'} {f'({employee_id})' if employee_id else ''}**\n{case_md}\n")
             
             # 실제로 추가된 사례가 있는 경우만 컨텍스트에 포함
             if added_cases > 0:
-                career_section += "\n**� 사례 활용 가이드:**\n"
-                career_section += "- 상담할 때 '저희 회사에서 비슷한 경험을 한 분이 있는데요...' 같이 자연스럽게 언급\n"
-                career_section += "- 구체적인 Employee ID나 상세 정보를 자연스럽게 대화에 녹여서 설명\n"
-                career_section += "- 사용자 상황과 유사한 사례를 찾아서 경험과 조언을 공유하는 방식으로 활용\n"
-                career_section += "- 딱딱한 사례 나열보다는 '그분 같은 경우에는...' 식으로 편안하게 설명\n"
-                career_section += "- 성장 과정, 어려웠던 점, 극복 방법 등을 스토리텔링 방식으로 전달\n"
-                context_sections.append(career_section)
+                career_parts.append(_CAREER_SECTION_GUIDE)
+                context_sections.append("".join(career_parts))
         
         # 교육과정 정보 - 새로 추가
         if education_courses:
             try:
-                education_section = "**교육과정 정보 (URL 포함)**:\n"
+                education_section = io.StringIO()  # 과정 수 × 필드 수만큼 누적되므로 버퍼에 기록
+                education_section.write("**교육과정 정보 (URL 포함)**:\n")
                 
                 # 교육과정 데이터가 딕셔너리이고 recommended_courses가 있는 경우
                 if isinstance(education_courses, dict) and 'recommended_courses' in education_courses:
@@ -443,9 +551,9 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
                             source = course.get('source', '알 수 없음')
                             duration = course.get('duration_hours', course.get('인정학습시간', '정보 없음'))
                             
-                            education_section += f"\n=== {i+1}. {course_name} ===\n"
-                            education_section += f"출처: {source}\n"
-                            education_section += f"학습시간: {duration}시간\n"
+                            education_section.write(f"\n=== {i+1}. {course_name} ===\n")
+                            education_section.write(f"출처: {source}\n")
+                            education_section.write(f"학습시간: {duration}시간\n")
                             
                             # mySUNI 과정의 경우 추가 상세 정보 제공
                             if source == 'mysuni':
@@ -457,18 +565,18 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
                                 skills = course.get('skillset', course.get('직무', []))
                                 
                                 if category:
-                                    education_section += f"카테고리: {category}\n"
+                                    education_section.write(f"카테고리: {category}\n")
                                 if channel:
-                                    education_section += f"채널: {channel}\n"
+                                    education_section.write(f"채널: {channel}\n")
                                 if difficulty:
-                                    education_section += f"난이도: {difficulty}\n"
+                                    education_section.write(f"난이도: {difficulty}\n")
                                 if rating:
-                                    education_section += f"평점: {rating}/5.0\n"
+                                    education_section.write(f"평점: {rating}/5.0\n")
                                 if enrollments:
-                                    education_section += f"이수자수: {enrollments}명\n"
+                                    education_section.write(f"이수자수: {enrollments}명\n")
                                 if skills and isinstance(skills, list) and skills:
                                     skills_str = ', '.join(skills[:3])  # 최대 3개만 표시
-                                    education_section += f"관련 스킬: {skills_str}\n"
+                                    education_section.write(f"관련 스킬: {skills_str}\n")
                             
                             # College 과정의 경우 추가 정보
                             elif source == 'college':
@@ -477,20 +585,20 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
                                 standard_course = course.get('표준과정', '')
                                 
                                 if department:
-                                    education_section += f"학부: {department}\n"
+                                    education_section.write(f"학부: {department}\n")
                                 if course_type:
-                                    education_section += f"교육유형: {course_type}\n"
+                                    education_section.write(f"교육유형: {course_type}\n")
                                 if standard_course:
-                                    education_section += f"표준과정: {standard_course}\n"
+                                    education_section.write(f"표준과정: {standard_course}\n")
                             
                             # URL 정보 - 학습하기 형태로 변경
                             if url and url.strip() and url != '정보 없음':
-                                education_section += f"실제URL: {url}\n"
-                                education_section += f"---\n**[학습하기]({url})**\n"
+                                education_section.write(f"실제URL: {url}\n")
+                                education_section.write(f"---\n**[학습하기]({url})**\n")
                             else:
-                                education_section += f"URL: 정보 없음 (텍스트만: {course_name})\n"
+                                education_section.write(f"URL: 정보 없음 (텍스트만: {course_name})\n")
                             
-                            education_section += "\n"
+                            education_section.write("\n")
                 
                 # 교육과정 데이터가 리스트인 경우
                 elif isinstance(education_courses, list):
@@ -501,9 +609,9 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
                             source = course.get('source', '알 수 없음')
                             duration = course.get('duration_hours', course.get('인정학습시간', '정보 없음'))
                             
-                            education_section += f"\n=== {i+1}. {course_name} ===\n"
-                            education_section += f"출처: {source}\n"
-                            education_section += f"학습시간: {duration}시간\n"
+                            education_section.write(f"\n=== {i+1}. {course_name} ===\n")
+                            education_section.write(f"출처: {source}\n")
+                            education_section.write(f"학습시간: {duration}시간\n")
                             
                             # 추가 상세 정보 제공 (mySUNI/College 구분)
                             if source == 'mysuni':
@@ -514,47 +622,47 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
                                 skills = course.get('skillset', course.get('직무', []))
                                 
                                 if category:
-                                    education_section += f"카테고리: {category}\n"
+                                    education_section.write(f"카테고리: {category}\n")
                                 if difficulty:
-                                    education_section += f"난이도: {difficulty}\n"
+                                    education_section.write(f"난이도: {difficulty}\n")
                                 if rating:
-                                    education_section += f"평점: {rating}/5.0\n"
+                                    education_section.write(f"평점: {rating}/5.0\n")
                                 if enrollments:
-                                    education_section += f"이수자수: {enrollments}명\n"
+                                    education_section.write(f"이수자수: {enrollments}명\n")
                                 if skills and isinstance(skills, list) and skills:
                                     skills_str = ', '.join(skills[:3])
-                                    education_section += f"관련 스킬: {skills_str}\n"
+                                    education_section.write(f"관련 스킬: {skills_str}\n")
                             
                             elif source == 'college':
                                 department = course.get('department', course.get('학부', ''))
                                 course_type = course.get('course_type', course.get('교육유형', ''))
                                 
                                 if department:
-                                    education_section += f"학부: {department}\n"
+                                    education_section.write(f"학부: {department}\n")
                                 if course_type:
-                                    education_section += f"교육유형: {course_type}\n"
+                                    education_section.write(f"교육유형: {course_type}\n")
                             
                             # URL 정보 - 학습하기 형태로 변경
                             if url and url.strip() and url != '정보 없음':
-                                education_section += f"실제URL: {url}\n"
-                                education_section += f"---\n**[학습하기]({url})**\n"
+                                education_section.write(f"실제URL: {url}\n")
+                                education_section.write(f"---\n**[학습하기]({url})**\n")
                             else:
-                                education_section += f"URL: 정보 없음 (텍스트만: {course_name})\n"
+                                education_section.write(f"URL: 정보 없음 (텍스트만: {course_name})\n")
                             
-                            education_section += "\n"
+                            education_section.write("\n")
                 
                 # 기타 형태의 데이터
                 else:
-                    education_section += f"{str(education_courses)[:300]}...\n"
+                    education_section.write(f"{str(education_courses)[:300]}...\n")
                 
-                education_section += "\n 교육과정 추천 가이드:\n"
-                education_section += "- 상담 시 '이런 과정이 도움이 될 것 같아요' 식으로 자연스럽게 추천\n"
-                education_section += "- 평점이나 이수자수 같은 정보도 '꽤 평점이 좋더라구요' 식으로 편안하게 언급\n"
-                education_section += "- URL이 있는 과정은 [학습하기] 링크로 안내\n"
-                education_section += "- 사용자 상황에 맞는 과정을 골라서 추천하되 너무 많지 않게 (2-3개 정도)\n"
-                education_section += "- 실제 URL만 사용하고 임의로 생성하지 않기"
+                education_section.write("\n 교육과정 추천 가이드:\n")
+                education_section.write("- 상담 시 '이런 과정이 도움이 될 것 같아요' 식으로 자연스럽게 추천\n")
+                education_section.write("- 평점이나 이수자수 같은 정보도 '꽤 평점이 좋더라구요' 식으로 편안하게 언급\n")
+                education_section.write("- URL이 있는 과정은 [학습하기] 링크로 안내\n")
+                education_section.write("- 사용자 상황에 맞는 과정을 골라서 추천하되 너무 많지 않게 (2-3개 정도)\n")
+                education_section.write("- 실제 URL만 사용하고 임의로 생성하지 않기")
                 
-                context_sections.append(education_section)
+                context_sections.append(education_section.getvalue())
                 
             except Exception as e:
                 self.logger.warning(f"교육과정 정보 처리 실패: {e}")
@@ -563,8 +671,7 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
         
         # 🗃️ 새로운 과거 모든 채팅 세션의 대화내역 추가 (VectorDB에서 검색된 내용)
         if past_conversations and len(past_conversations) > 0:
-            past_conversations_section = "**과거 모든 채팅 세션의 관련 대화내역**:\n"
-            past_conversations_section += "이전 세션들에서 관련성이 높은 대화 내용들입니다. 사용자의 과거 질문과 상담 이력을 참고하여 연속성 있는 상담을 제공하세요.\n\n"
+            past_parts = [_PAST_CONVERSATIONS_HEADER]
             
             for i, past_conv in enumerate(past_conversations[:3], 1):  # 최대 3개 과거 대화 세션
                 try:
@@ -575,36 +682,30 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
                     relevance_score = past_conv.get("relevance_score", 0)
                     message_count = past_conv.get("message_count", 0)
                     
-                    past_conversations_section += f"###  **과거 세션 {i}** (관련도: {relevance_score:.2f})\n"
+                    past_parts.append(f"###  **과거 세션 {i}** (관련도: {relevance_score:.2f})\n")
                     if created_at:
-                        past_conversations_section += f"**세션 날짜**: {created_at[:10]}\n"
-                    past_conversations_section += f"**메시지 수**: {message_count}개\n"
+                        past_parts.append(f"**세션 날짜**: {created_at[:10]}\n")
+                    past_parts.append(f"**메시지 수**: {message_count}개\n")
                     
                     if summary and summary.strip():
-                        past_conversations_section += f"**대화 요약**: {summary}\n"
+                        past_parts.append(f"**대화 요약**: {summary}\n")
                     
                     if content_snippet and content_snippet.strip():
-                        past_conversations_section += f"**주요 내용**: {content_snippet}\n"
+                        past_parts.append(f"**주요 내용**: {content_snippet}\n")
                     
-                    past_conversations_section += "\n"
+                    past_parts.append("\n")
                     
                 except Exception as e:
                     self.logger.warning(f"과거 대화 내역 파싱 오류: {e}")
                     continue
             
-            past_conversations_section += "\n** 과거 대화 활용 가이드:**\n"
-            past_conversations_section += "- 사용자가 '이전에', '전에', '과거에' 등의 표현을 사용하면 위 과거 대화 내용을 구체적으로 언급\n"
-            past_conversations_section += "- '이전에 비슷한 질문을 해주셨었는데요...' 식으로 자연스럽게 연결\n"
-            past_conversations_section += "- 과거 상담 내용과 현재 질문을 연결하여 발전적인 조언 제공\n"
-            past_conversations_section += "- 사용자의 성장 과정이나 관심사의 변화를 파악하여 개인화된 상담 진행\n"
-            past_conversations_section += "- 과거 대화 요약과 주요 내용을 바탕으로 구체적이고 맥락 있는 답변 제공\n"
+            past_parts.append(_PAST_CONVERSATIONS_GUIDE)
             
-            context_sections.append(past_conversations_section)
+            context_sections.append("".join(past_parts))
         
         # 📰 뉴스 데이터 정보 추가
         if news_data and len(news_data) > 0:
-            news_section = "**최신 업계 뉴스 및 트렌드 정보**:\n"
-            news_section += "업계 최신 소식과 채용 트렌드 정보입니다. 사용자 질문과 관련된 경우 자연스럽게 활용해주세요.\n\n"
+            news_parts = [_NEWS_SECTION_HEADER]
             
             for i, news in enumerate(news_data[:3], 1):  # 최대 3개 뉴스
                 try:
@@ -616,35 +717,28 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
                     source = news.get("source", "")
                     similarity_score = news.get("similarity_score", 0)
                     
-                    news_section += f"### **뉴스 {i}** (관련도: {similarity_score:.2f})\n"
-                    news_section += f"**제목**: {title}\n"
+                    news_parts.append(f"### **뉴스 {i}** (관련도: {similarity_score:.2f})\n")
+                    news_parts.append(f"**제목**: {title}\n")
                     if domain:
-                        news_section += f"**도메인**: {domain}\n"
+                        news_parts.append(f"**도메인**: {domain}\n")
                     if category:
-                        news_section += f"**카테고리**: {category}\n"
+                        news_parts.append(f"**카테고리**: {category}\n")
                     if published_date:
-                        news_section += f"**발행일**: {published_date}\n"
+                        news_parts.append(f"**발행일**: {published_date}\n")
                     if source:
-                        news_section += f"**출처**: {source}\n"
+                        news_parts.append(f"**출처**: {source}\n")
                     if content:
-                        news_section += f"**내용**: {content}\n"
+                        news_parts.append(f"**내용**: {content}\n")
                     
-                    news_section += "\n"
+                    news_parts.append("\n")
                     
                 except Exception as e:
                     self.logger.warning(f"뉴스 데이터 파싱 오류: {e}")
                     continue
             
-            news_section += "\n** 뉴스 활용 가이드:**\n"
-            news_section += "- 업계 트렌드나 채용 시장 질문 시 '최근 뉴스를 보니까...' 식으로 자연스럽게 인용\n"
-            news_section += "- 출처와 발행일을 간단히 언급하여 신뢰성 확보 ('3월 테크뉴스에 따르면...')\n"
-            news_section += "- 뉴스 내용을 단순 나열하지 말고 사용자 상황에 맞는 실용적 조언과 연결\n"
-            news_section += "- AI, 금융, 반도체, 제조 등 도메인별 전문 정보 제공\n"
-            news_section += "- 채용 트렌드, 연봉 정보, 필요 기술 등을 구체적으로 활용\n"
-            news_section += "- **최신/트렌드 질문 시**: 뉴스 데이터를 가장 우선적으로 활용하여 현재 상황 설명\n"
-            news_section += "- **구체적 인용**: '○○ 뉴스에서 보도된 바에 따르면...' 식으로 정확한 출처 명시\n"
+            news_parts.append(_NEWS_SECTION_GUIDE)
             
-            context_sections.append(news_section)
+            context_sections.append("".join(news_parts))
         
         # 질문 유형 분석 (성능 최적화)
         career_keywords = ['커리어', '진로', '목표', '방향', '계획', '비전', '미래', '회사', '조직']
@@ -676,8 +770,8 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
         # 커리어 관련 질문인 경우 회사 비전 정보 추가
         if is_career_question:
             # Retriever에서 회사 비전 컨텍스트 가져오기
-            from .retriever import CareerEnsembleRetrieverAgent
-            retriever = CareerEnsembleRetrieverAgent()
+            from .retriever import get_career_retriever_agent
+            retriever = get_career_retriever_agent()
             company_vision_section = retriever.get_company_vision_context()
             if company_vision_section.strip():
                 context_sections.append(company_vision_section)
@@ -921,19 +1015,23 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
         # 이스케이프 문자 처리
         final_content = final_content.replace('\\n', '\n').replace('\\t', '\t').replace('\\r', '\r')
         
+        # 제목/본문/마무리 조각을 모아 마지막에 한 번만 결합 (긴 응답을 매번 복사하지 않도록)
+        content_parts = [final_content]
+        
         # 사용자 이름이 포함되지 않았다면 추가
         if user_name and user_name not in final_content:
             title = formatted_response.get("title", "커리어 컨설팅 결과")
-            final_content = f"# {user_name}님을 위한 {title}\n\n{final_content}"
+            content_parts.insert(0, f"# {user_name}님을 위한 {title}\n\n")
         
         # 마무리 메시지 추가
-        call_to_action = formatted_response.get("call_to_action", 
-                                               "추가 질문이 있으시면 언제든 말씀해 주세요.")
-        # 이스케이프 문자 처리
-        call_to_action = call_to_action.replace('\\n', '\n').replace('\\t', '\t').replace('\\r', '\r')
-        
         if not final_content.endswith("---"):
-            final_content += f"\n\n---\n*{call_to_action}*"
+            call_to_action = formatted_response.get("call_to_action", 
+                                                   "추가 질문이 있으시면 언제든 말씀해 주세요.")
+            # 이스케이프 문자 처리
+            call_to_action = call_to_action.replace('\\n', '\n').replace('\\t', '\t').replace('\\r', '\r')
+            content_parts.append(f"\n\n---\n*{call_to_action}*")
+        
+        final_content = "".join(content_parts)
         
         return {
             "formatted_content": final_content,
@@ -1080,23 +1178,13 @@ Application PM으로의 성장 경로에 대해 궁금하시군요. 좋은 목
             # 경력 레벨
             experience_level = metadata.get('experience_level', '')
             if experience_level:
-                level_mapping = {
-                    'junior': '주니어',
-                    'mid-level': '중급',
-                    'senior': '시니어',
-                    'expert': '전문가'
-                }
-                level_kr = level_mapping.get(experience_level, experience_level)
+                level_kr = _EXPERIENCE_LEVEL_KR.get(experience_level, experience_level)
                 additional_info.append(f"** 경력 레벨:** {level_kr}")
             
             # 커리어 연속성
             career_continuity = metadata.get('career_continuity', '')
             if career_continuity:
-                continuity_mapping = {
-                    'continuous': '연속적',
-                    'with_gaps': '단절 있음'
-                }
-                continuity_kr = continuity_mapping.get(career_continuity, career_continuity)
+                continuity_kr = _CAREER_CONTINUITY_KR.get(career_continuity, career_continuity)
                 additional_info.append(f"** 커리어 연속성:** {continuity_kr}")
             
             # 프로젝트 규모 다양성
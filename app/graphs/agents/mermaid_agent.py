@@ -125,7 +125,7 @@ class MermaidDiagramAgent:
         """
         
         try:
-            print(" Mermaid 다이어그램 생성 시작...")
+            self.logger.debug("Mermaid 다이어그램 생성 시작...")
             
             # OpenAI 클라이언트 초기화
             self._initialize_openai_client()
@@ -142,17 +142,15 @@ class MermaidDiagramAgent:
             cleaned_code = self._clean_and_validate_mermaid(mermaid_code)
             
             if cleaned_code:
-                print(f"Mermaid 다이어그램 생성 완료 ({len(cleaned_code)}자)")
+                self.logger.debug("Mermaid 다이어그램 생성 완료 (%s자)", len(cleaned_code))
                 self.logger.info("Mermaid 다이어그램 생성 성공")
             else:
-                print("Mermaid 다이어그램 생성 실패")
                 self.logger.warning("Mermaid 다이어그램 생성 실패")
             
             return cleaned_code
             
         except Exception as e:
             self.logger.error(f"Mermaid 다이어그램 생성 중 오류: {e}")
-            print(f"다이어그램 생성 오류: {e}")
             return ""
 
     def _prepare_context(self, 
@@ -221,21 +219,25 @@ class MermaidDiagramAgent:
             if not raw_code or not raw_code.strip():
                 return ""
             
-            # ```mermaid 블록에서 코드 추출
-            mermaid_pattern = r'```mermaid\s*\n(.*?)\n```'
-            match = re.search(mermaid_pattern, raw_code, re.DOTALL)
-            
-            if match:
-                code = match.group(1).strip()
+            # 코드 펜스가 없으면 정규식 검색 없이 전체 텍스트 사용
+            if '```' not in raw_code:
+                code = raw_code.strip()
             else:
-                # 일반 코드 블록 확인
-                code_pattern = r'```\s*\n(.*?)\n```'
-                match = re.search(code_pattern, raw_code, re.DOTALL)
+                # ```mermaid 블록에서 코드 추출
+                mermaid_pattern = r'```mermaid\s*\n(.*?)\n```'
+                match = re.search(mermaid_pattern, raw_code, re.DOTALL)
+                
                 if match:
                     code = match.group(1).strip()
                 else:
-                    # 코드 블록이 없으면 전체 텍스트 사용
-                    code = raw_code.strip()
+                    # 일반 코드 블록 확인
+                    code_pattern = r'```\s*\n(.*?)\n```'
+                    match = re.search(code_pattern, raw_code, re.DOTALL)
+                    if match:
+                        code = match.group(1).strip()
+                    else:
+                        # 코드 블록이 없으면 전체 텍스트 사용
+                        code = raw_code.strip()
             
             # 기본 검증: Mermaid 키워드 포함 여부
             mermaid_keywords = [
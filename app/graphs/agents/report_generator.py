@@ -7,136 +7,58 @@
 *
 """
 
+import asyncio
 import os
+import re
 import logging
-import markdown
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional
+try:
+    from markdown_it import MarkdownIt
+except ImportError:  # markdown-it-py가 없으면 python-markdown으로만 변환
+    MarkdownIt = None
+if TYPE_CHECKING:  # python-markdown은 실제 사용 시점에만 import (타입 표기용)
+    import markdown
 
+from app.utils.html_logger import get_output_dir
 
-class ReportGeneratorAgent:
+
+@lru_cache(maxsize=1)
+def _get_markdown_it() -> "MarkdownIt":
     """
-     관리자 전용 HTML 보고서 생성 에이전트
-    
-    상담 품질 관리를 위해 상담 내용을 체계적으로 정리한
-    HTML 보고서를 생성하는 관리자 전용 에이전트입니다.
+    보고서용 markdown-it 변환기 (최초 호출 시 한 번만 구성)
+
+    단일 패스 토크나이저로 python-markdown보다 빠르며, render()는 호출마다 상태를 새로 만들어
+    변환 스레드 간 공유가 가능합니다. Mermaid div 등 원시 HTML은 그대로 통과시킵니다.
     """
-    
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-    
-    def should_generate_report(self, user_question: str, user_data: Dict[str, Any]) -> bool:
-        """
-         관리자 설정: 보고서 생성 필요 여부 판단
-        
-        관리자가 설정한 조건에 따라 HTML 보고서 생성 여부를 결정합니다.
-        현재는 모든 상담에 대해 보고서를 생성하도록 설정되어 있습니다.
-        
-        Args:
-            user_question: 사용자 질문
-            user_data: 사용자 프로필 정보
-            
-        Returns:
-            bool: 보고서 생성 필요 여부
-        """
-        return True #  관리자 설정: 현재 모든 상담에 대해 보고서 생성 (관리자용)
+    return MarkdownIt("commonmark", {"html": True}).enable("table")
 
-        #  관리자 설정 예시 (현재 비활성화됨):
-        # 보고서 생성 키워드들
-        report_keywords = [
-            "보고서", "report", "리포트", "문서", "저장", "다운로드", 
-            "파일", "html", "정리", "요약서", "분석서", "결과서"
-        ]
-        
-        question_lower = user_question.lower()
-        
-        # 키워드 매칭 확인
-        for keyword in report_keywords:
-            if keyword in question_lower:
-                self.logger.info(f"보고서 생성 키워드 감지: '{keyword}'")
-                return True
-        
-        # 질문이 길고 상세한 분석을 요청하는 경우 (100자 이상)
-        if len(user_question) > 100:
-            self.logger.info("상세한 질문으로 보고서 생성 추천")
-            return True
-            
-        return False
-    
-    def generate_html_report(self, 
-                           final_response: Dict[str, Any], 
-                           user_data: Dict[str, Any],
-                           state: Dict[str, Any]) -> Optional[str]:
-        """ 관리자 전용: HTML 보고서 파일 생성"""
-        try:
-            self.logger.info("HTML 보고서 생성 시작")
-            
-            # 마크다운 내용을 HTML로 변환
-            markdown_content = final_response.get("formatted_content", "")
-            
-            # 커리어 상담인 경우 message 키 사용
-            if not markdown_content and final_response.get("message"):
-                markdown_content = final_response.get("message", "")
-            
-            # 빈 내용인 경우 보고서 생성하지 않음
-            if not markdown_content or len(markdown_content.strip()) < 10:
-                self.logger.warning("보고서 내용이 너무 짧아 생성을 건너뜁니다.")
-                return None
-                
-            html_content = self._convert_markdown_to_html(markdown_content)
-            
-            # 파일명 생성
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            user_name = user_data.get("name", "user")
-            user_name = user_name.replace(" ", "_") if user_name else "user"
-            file_name = f"{user_name}_{timestamp}"
-            
-            # output 디렉토리 생성
-            output_dir = os.path.join(os.getcwd(), "output")
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # HTML 파일 경로
-            html_path = os.path.join(output_dir, f"{file_name}.html")
-            
-            # HTML 파일 작성
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
-            
-            self.logger.info(f"HTML 보고서 생성 완료: {html_path}")
-            return html_path
-            
-        except Exception as e:
-            self.logger.error(f"HTML 보고서 생성 실패: {e}")
-            return None
-    
-    def _convert_markdown_to_html(self, markdown_text: str) -> str:
-        """마크다운 텍스트를 HTML로 변환 (Mermaid 다이어그램 지원)"""
-        try:
-            # Mermaid 다이어그램 코드 블록을 HTML div로 변환
-            mermaid_html = self._process_mermaid_blocks(markdown_text)
-            
-            # 기본 마크다운 변환
-            html = markdown.markdown(
-                mermaid_html,
-                extensions=['tables', 'fenced_code', 'codehilite'],
-                extension_configs={
-                    'codehilite': {
-                        'css_class': 'highlight'
-                    }
-                }
-            )
-            
-            # Mermaid가 포함되어 있는지 확인
-            has_mermaid = 'class="mermaid"' in html
-            
-            # 완전한 HTML 문서로 감싸기
-            full_html = f"""<!DOCTYPE html>
+
+# ```mermaid 코드 블록 (보고서마다 패턴을 다시 찾지 않도록 미리 컴파일)
+_MERMAID_BLOCK_PATTERN = re.compile(r'```mermaid\s*\n(.*?)\n```', re.DOTALL)
+
+# 변환된 Mermaid div 블록 / markdown-it 변환 중 div를 대신하는 자리표시자
+# (commonmark는 HTML 블록을 첫 빈 줄에서 끝내므로 빈 줄이 있는 다이어그램이 코드 블록으로 깨짐)
+_MERMAID_DIV_PATTERN = re.compile(r'<div class="mermaid">\n.*?\n</div>', re.DOTALL)
+_MERMAID_PLACEHOLDER = "gnavi-mermaid-block-{}"
+
+
+def _replace_mermaid_block(match: re.Match) -> str:
+    """Mermaid 코드 블록을 Mermaid.js가 렌더링할 수 있는 HTML div로 변환"""
+    return f'<div class="mermaid">\n{match.group(1).strip()}\n</div>'
+
+
+# 보고서 HTML 문서 골격 (모듈 로드 시 한 번만 생성, CSS 중괄호는 str.format용으로 이스케이프)
+_HTML_REPORT_TEMPLATE = """<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>G.Navi AI 커리어 컨설팅 보고서</title>
-    {self._get_mermaid_scripts() if has_mermaid else ""}
+    {mermaid_scripts}
     <style>
         body {{
             font-family: 'Noto Sans KR', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
@@ -260,48 +182,248 @@ class ReportGeneratorAgent:
 </head>
 <body>
     <div class="container">
-        {html}
+        {body}
         <div class="timestamp">
-            보고서 생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}
+            보고서 생성일시: {generated_at}
         </div>
     </div>
-    {self._get_mermaid_init_script() if has_mermaid else ""}
+    {mermaid_init_script}
 </body>
 </html>"""
-            
-            return full_html
-            
-        except Exception as e:
-            self.logger.error(f"마크다운 HTML 변환 실패: {e}")
-            # 실패 시 기본 HTML 반환
-            return f"""<!DOCTYPE html>
+
+# 골격의 고정 구간을 미리 UTF-8로 인코딩해 둔 조각 (보고서마다 본문/생성일시 등 가변 부분만 인코딩)
+# 순서: 머리 | (Mermaid 스크립트) | 본문 앞 | (본문) | 생성일시 앞 | (생성일시) | 초기화 스크립트 앞 | (초기화 스크립트) | 꼬리
+_HTML_REPORT_CHUNKS = tuple(
+    chunk.encode("utf-8")
+    for chunk in _HTML_REPORT_TEMPLATE.format(
+        mermaid_scripts="\0", body="\0", generated_at="\0", mermaid_init_script="\0"
+    ).split("\0")
+)
+
+# 마크다운 변환 실패 시 사용하는 최소 HTML 문서
+_HTML_ERROR_TEMPLATE = """<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
     <title>G.Navi AI 보고서</title>
 </head>
 <body>
-    <pre>{markdown_text}</pre>
+    <pre>{body}</pre>
 </body>
 </html>"""
+
+
+# 보고서 변환/파일 쓰기 전용 스레드 - 이벤트 루프를 막지 않고 완료를 기다림
+# (작업자 1개로 제출 순서대로 기록됨)
+_report_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+
+
+def _write_report_file(html_path: str, html_bytes: bytes) -> str:
+    """HTML 보고서 파일 기록 (report-writer 스레드에서 실행)"""
+    # 이미 인코딩된 문서를 바이너리 모드로 한 번에 기록
+    # (텍스트 계층의 인코더/버퍼를 거치지 않아 보고서당 write 호출이 1회)
+    with open(html_path, "wb", buffering=0) as f:
+        view = memoryview(html_bytes)
+        while view:  # 일반 파일은 보통 1회로 끝나지만 부분 쓰기에 대비
+            view = view[f.write(view):]
+    return html_path
+
+
+class ReportGeneratorAgent:
+    """
+     관리자 전용 HTML 보고서 생성 에이전트
     
-    def _process_mermaid_blocks(self, markdown_text: str) -> str:
-        """마크다운에서 Mermaid 코드 블록을 HTML div로 변환"""
+    상담 품질 관리를 위해 상담 내용을 체계적으로 정리한
+    HTML 보고서를 생성하는 관리자 전용 에이전트입니다.
+    """
+    
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        # 마크다운 변환기는 스레드별로 한 번만 생성하여 재사용 (Markdown 인스턴스는 스레드 간 공유 불가)
+        self._markdown_local = threading.local()
+    
+    def _get_markdown(self, markdown_text: str) -> "markdown.Markdown":
+        """
+        현재 스레드의 마크다운 변환기 반환 (확장/처리기 구성은 조합별 최초 1회만 수행하고 이후 reset()으로 재사용)
+        
+        본문에 표(|)나 코드 펜스(```, ~~~)가 없으면 해당 확장을 빼서 불필요한 처리 단계를 건너뜁니다.
+        """
+        extensions = []
+        if "|" in markdown_text:
+            extensions.append('tables')
+        if "```" in markdown_text or "~~~" in markdown_text:
+            extensions += ['fenced_code', 'codehilite']
+        extensions = tuple(extensions)
+        
+        converters = getattr(self._markdown_local, "converters", None)
+        if converters is None:
+            converters = self._markdown_local.converters = {}
+        md = converters.get(extensions)
+        if md is None:
+            # python-markdown은 markdown-it을 쓸 수 없을 때만 필요하므로 첫 사용 시점에 import
+            # (확장 모듈 로딩을 서버 기동 시점에서 제외)
+            import markdown
+            md = markdown.Markdown(
+                extensions=list(extensions),
+                extension_configs={
+                    'codehilite': {
+                        'css_class': 'highlight'
+                    }
+                } if 'codehilite' in extensions else {}
+            )
+            converters[extensions] = md
+        return md.reset()
+    
+    def should_generate_report(self, user_question: str, user_data: Dict[str, Any]) -> bool:
+        """
+         관리자 설정: 보고서 생성 필요 여부 판단
+        
+        관리자가 설정한 조건에 따라 HTML 보고서 생성 여부를 결정합니다.
+        현재는 모든 상담에 대해 보고서를 생성하도록 설정되어 있습니다.
+        
+        Args:
+            user_question: 사용자 질문
+            user_data: 사용자 프로필 정보
+            
+        Returns:
+            bool: 보고서 생성 필요 여부
+        """
+        return True #  관리자 설정: 현재 모든 상담에 대해 보고서 생성 (관리자용)
+
+        #  관리자 설정 예시 (현재 비활성화됨):
+        # 보고서 생성 키워드들
+        report_keywords = [
+            "보고서", "report", "리포트", "문서", "저장", "다운로드", 
+            "파일", "html", "정리", "요약서", "분석서", "결과서"
+        ]
+        
+        question_lower = user_question.lower()
+        
+        # 키워드 매칭 확인
+        for keyword in report_keywords:
+            if keyword in question_lower:
+                self.logger.info(f"보고서 생성 키워드 감지: '{keyword}'")
+                return True
+        
+        # 질문이 길고 상세한 분석을 요청하는 경우 (100자 이상)
+        if len(user_question) > 100:
+            self.logger.info("상세한 질문으로 보고서 생성 추천")
+            return True
+            
+        return False
+    
+    async def generate_html_report(self, 
+                           final_response: Dict[str, Any], 
+                           user_data: Dict[str, Any],
+                           state: Dict[str, Any]) -> Optional[str]:
+        """ 관리자 전용: HTML 보고서 파일 생성"""
         try:
-            import re
+            self.logger.info("HTML 보고서 생성 시작")
             
-            # ```mermaid 코드 블록을 찾아서 div로 변환
-            pattern = r'```mermaid\s*\n(.*?)\n```'
+            # 마크다운 내용을 HTML로 변환
+            markdown_content = final_response.get("formatted_content", "")
+            
+            # 커리어 상담인 경우 message 키 사용
+            if not markdown_content and final_response.get("message"):
+                markdown_content = final_response.get("message", "")
+            
+            # 빈 내용인 경우 보고서 생성하지 않음
+            if not markdown_content or len(markdown_content.strip()) < 10:
+                self.logger.warning("보고서 내용이 너무 짧아 생성을 건너뜁니다.")
+                return None
+                
+            # 파일명 생성
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            user_name = user_data.get("name", "user")
+            user_name = user_name.replace(" ", "_") if user_name else "user"
+            file_name = f"{user_name}_{timestamp}"
+            
+            # HTML 파일 경로 (output 디렉토리는 최초 1회만 생성)
+            html_path = os.path.join(get_output_dir(), f"{file_name}.html")
+            
+            # 마크다운 변환과 파일 쓰기는 전용 스레드에서 실행하고 완료(또는 실패)까지 기다림
+            await asyncio.wrap_future(
+                _report_writer.submit(self._render_and_write_report, html_path, markdown_content)
+            )
+            
+            self.logger.info(f"HTML 보고서 생성 완료: {html_path}")
+            return html_path
             
-            def replace_mermaid(match):
-                mermaid_code = match.group(1).strip()
-                # HTML div로 변환 (Mermaid.js가 렌더링할 수 있도록)
-                return f'<div class="mermaid">\n{mermaid_code}\n</div>'
+        except Exception as e:
+            self.logger.error(f"HTML 보고서 생성 실패: {e}")
+            return None
+    
+    def _render_and_write_report(self, html_path: str, markdown_content: str) -> str:
+        """마크다운 → HTML 변환 후 파일 기록 (report-writer 스레드에서 실행)"""
+        return _write_report_file(html_path, self._convert_markdown_to_html(markdown_content))
+    
+    def _convert_markdown_to_html(self, markdown_text: str) -> bytes:
+        """마크다운 텍스트를 UTF-8로 인코딩된 HTML 문서로 변환 (Mermaid 다이어그램 지원)"""
+        try:
+            # Mermaid 다이어그램 코드 블록을 HTML div로 변환
+            mermaid_html = self._process_mermaid_blocks(markdown_text)
+            
+            # 기본 마크다운 변환
+            html = self._render_markdown(mermaid_html)
+            
+            # Mermaid가 포함되어 있는지 확인
+            has_mermaid = 'class="mermaid"' in html
             
-            # 정규표현식으로 변환
-            processed_text = re.sub(pattern, replace_mermaid, markdown_text, flags=re.DOTALL)
+            # 완전한 HTML 문서로 감싸기 (고정 구간은 미리 인코딩된 조각 사용, 가변 부분만 인코딩)
+            head, after_scripts, after_body, after_timestamp, tail = _HTML_REPORT_CHUNKS
+            return b"".join((
+                head,
+                self._get_mermaid_scripts().encode("utf-8") if has_mermaid else b"",
+                after_scripts,
+                html.encode("utf-8"),
+                after_body,
+                datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분').encode("utf-8"),
+                after_timestamp,
+                self._get_mermaid_init_script().encode("utf-8") if has_mermaid else b"",
+                tail,
+            ))
             
-            return processed_text
+        except Exception as e:
+            self.logger.error(f"마크다운 HTML 변환 실패: {e}")
+            # 실패 시 기본 HTML 반환
+            return _HTML_ERROR_TEMPLATE.format(body=markdown_text).encode("utf-8")
+    
+    def _render_markdown(self, markdown_text: str) -> str:
+        """마크다운 본문을 HTML로 변환 (markdown-it 우선, 실패하거나 미설치 시 python-markdown 사용)"""
+        if MarkdownIt is not None:
+            try:
+                return self._render_markdown_it(markdown_text)
+            except Exception as e:
+                self.logger.warning(f"markdown-it 변환 실패, python-markdown으로 대체: {e}")
+        return self._get_markdown(markdown_text).convert(markdown_text)
+    
+    def _render_markdown_it(self, markdown_text: str) -> str:
+        """markdown-it 변환 - Mermaid div는 자리표시자로 바꿔 변환한 뒤 원시 HTML 그대로 복원"""
+        mermaid_blocks = []
+        
+        def _stash_mermaid_block(match: re.Match) -> str:
+            mermaid_blocks.append(match.group(0))
+            return f"\n\n{_MERMAID_PLACEHOLDER.format(len(mermaid_blocks) - 1)}\n\n"
+        
+        if 'class="mermaid"' in markdown_text:
+            markdown_text = _MERMAID_DIV_PATTERN.sub(_stash_mermaid_block, markdown_text)
+        
+        html = _get_markdown_it().render(markdown_text)
+        for index, block in enumerate(mermaid_blocks):
+            placeholder = _MERMAID_PLACEHOLDER.format(index)
+            paragraph = f"<p>{placeholder}</p>"
+            html = html.replace(paragraph if paragraph in html else placeholder, block, 1)
+        return html
+    
+    def _process_mermaid_blocks(self, markdown_text: str) -> str:
+        """마크다운에서 Mermaid 코드 블록을 HTML div로 변환"""
+        try:
+            # Mermaid 블록이 없는 보고서는 정규식 치환 없이 그대로 사용
+            if "```mermaid" not in markdown_text:
+                return markdown_text
+            
+            # ```mermaid 코드 블록을 찾아서 div로 변환
+            return _MERMAID_BLOCK_PATTERN.sub(_replace_mermaid_block, markdown_text)
             
         except Exception as e:
             self.logger.warning(f"Mermaid 블록 처리 실패: {e}")
@@ -25,11 +25,15 @@
 """
 
 import os
+import asyncio
 import json
 import re
 import requests
 import logging
+import threading
 import chromadb
+import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Any
 from langchain_community.vectorstores import Chroma
 from langchain_openai import OpenAIEmbeddings
@@ -169,6 +173,53 @@ PathConfig._init_paths()
 
 # ==================== 📂 경로 설정 끝 ====================
 
+class _PrecomputedBM25Index:
+    """
+    BM25 사전 계산 인덱스
+    
+    rank_bm25(BM25Okapi)는 질의마다 쿼리 토큰별로 전체 문서의 단어 빈도를 파이썬 루프로
+    다시 읽어 점수를 계산합니다. 인덱스 생성 시 단어별 (문서 번호, BM25 점수) 포스팅을
+    한 번만 계산해 두고, 질의 시에는 쿼리 토큰의 포스팅만 numpy로 누적합니다.
+    점수 계산식과 상위 n개 선택 방식은 BM25Retriever와 동일하므로 결과도 같습니다.
+    """
+
+    def __init__(self, bm25_retriever: BM25Retriever):
+        vectorizer = bm25_retriever.vectorizer
+        self.docs = bm25_retriever.docs
+        self.preprocess_func = bm25_retriever.preprocess_func
+        
+        k1, b = vectorizer.k1, vectorizer.b
+        doc_len_norm = k1 * (1 - b + b * np.array(vectorizer.doc_len) / vectorizer.avgdl)
+        
+        # 단어별 (문서 번호, 단어 빈도) 수집
+        term_docs: Dict[str, tuple] = {}
+        for doc_idx, frequencies in enumerate(vectorizer.doc_freqs):
+            for term, freq in frequencies.items():
+                doc_indices, freqs = term_docs.setdefault(term, ([], []))
+                doc_indices.append(doc_idx)
+                freqs.append(freq)
+        
+        # 단어별 BM25 점수 사전 계산 (BM25Okapi.get_scores와 같은 식)
+        self.postings = {}
+        for term, (doc_indices, freqs) in term_docs.items():
+            doc_indices = np.array(doc_indices)
+            q_freq = np.array(freqs)
+            idf = vectorizer.idf.get(term) or 0
+            scores = idf * (q_freq * (k1 + 1) / (q_freq + doc_len_norm[doc_indices]))
+            self.postings[term] = (doc_indices, scores)
+
+    def search(self, query: str, n: int) -> List[Document]:
+        """쿼리와 BM25 점수가 높은 상위 n개 문서 반환"""
+        scores = np.zeros(len(self.docs))
+        for term in self.preprocess_func(query):
+            posting = self.postings.get(term)
+            if posting is not None:
+                doc_indices, term_scores = posting
+                scores[doc_indices] += term_scores
+        top_n = np.argsort(scores)[::-1][:n]
+        return [self.docs[i] for i in top_n]
+
+
 class CareerEnsembleRetrieverAgent:
     """
     커리어 앙상블 리트리버 에이전트
@@ -241,6 +292,10 @@ class CareerEnsembleRetrieverAgent:
         
         self.vectorstore = None
         self.ensemble_retriever = None
+        # 앙상블 구성 리트리버 (aretrieve에서 개별적으로 동시 실행)
+        self.embedding_retriever = None
+        self.bm25_retriever = None
+        self.bm25_index = None
         
         # 교육과정 관련 경로 설정 (기존 속성 방식 사용)
         if not self.is_k8s:
@@ -256,6 +311,9 @@ class CareerEnsembleRetrieverAgent:
         self.education_vectorstore = None
         self.skill_education_mapping = None
         self.course_deduplication_index = None
+        # 지연 로딩 잠금 (싱글톤을 여러 요청 스레드가 공유하므로 최초 로딩이 동시에 두 번 실행되지 않도록)
+        self._education_resources_lock = threading.Lock()
+        self._original_course_data_lock = threading.Lock()
         
         self._load_vectorstore_and_retriever()
 
@@ -292,12 +350,15 @@ class CareerEnsembleRetrieverAgent:
             self.logger.warning(f"BM25용 career_docs.json 로드 실패: {e} - 경로: {docs_path}")
         
         # 앙상블 리트리버 구성
+        self.embedding_retriever = embedding_retriever
         retrievers = [embedding_retriever]
         weights = [1.0]
         if all_docs:
             bm25_retriever = BM25Retriever.from_documents(all_docs)
             bm25_retriever.k = 3  # BM25도 3개로 제한
             retrievers.append(bm25_retriever)
+            self.bm25_retriever = bm25_retriever
+            self.bm25_index = _PrecomputedBM25Index(bm25_retriever)
             weights = [0.3, 0.7]  # K8s ChromaDB: 30%, BM25: 70%
         
         self.ensemble_retriever = EnsembleRetriever(
@@ -332,12 +393,15 @@ class CareerEnsembleRetrieverAgent:
         except Exception as e:
             self.logger.warning(f"BM25용 career_docs.json 로드 실패: {e} - 경로: {docs_path}")
         
+        self.embedding_retriever = embedding_retriever
         retrievers = [embedding_retriever]
         weights = [1.0]
         if all_docs:
             bm25_retriever = BM25Retriever.from_documents(all_docs)
             bm25_retriever.k = 2  # BM25도 2개로 제한
             retrievers.append(bm25_retriever)
+            self.bm25_retriever = bm25_retriever
+            self.bm25_index = _PrecomputedBM25Index(bm25_retriever)
             weights = [0.3, 0.7]
         self.ensemble_retriever = EnsembleRetriever(
             retrievers=retrievers,
@@ -357,64 +421,89 @@ class CareerEnsembleRetrieverAgent:
         # 동적으로 k 값 설정
         search_k = max(k * 2, 10)  # 요청된 개수의 2배 또는 최소 10개
         
-        # Chroma 벡터스토어에서 결과 검색
-        embedding_docs = self.vectorstore.similarity_seaerch(query, k=search_k)
-        print(f"DEBUG - 임베딩 검색 결과: {len(embedding_docs)}개")
+        embedding_docs = self._search_embedding_docs(query, search_k)
+        bm25_docs = self._search_bm25_docs(query, search_k)
         
-        # BM25 검색도 더 많은 결과 반환
-        bm25_docs = []
-        if hasattr(self.ensemble_retriever, 'retrievers') and len(self.ensemble_retriever.retrievers) > 1:
-            try:
-                # BM25 리트리버의 k 값을 동적으로 설정
-                bm25_retriever = self.ensemble_retriever.retrievers[1]
-                original_k = bm25_retriever.k
-                bm25_retriever.k = search_k
-                bm25_docs = bm25_retriever.invoke(query)
-                bm25_retriever.k = original_k  # 원래 값으로 복원
-                print(f"DEBUG - BM25 검색 결과: {len(bm25_docs)}개")
-            except Exception as e:
-                print(f"BM25 검색 실패: {e}")
+        all_docs = self._fuse_with_rrf(embedding_docs, bm25_docs)
+        return self._finalize_retrieved_docs(query, all_docs, k)
+
+    async def aretrieve(self, query: str, k: int = 3):
+        """
+        앙상블 리트리버 비동기 검색
         
-        # 두 검색 결과를 RRF 알고리즘으로 가중치 결합
-        doc_scores = {} 
-        RRF_CONSTANT = 60
+        임베딩 검색(OpenAI 임베딩 호출 + Chroma 조회, I/O 대기)과 BM25 검색(CPU 연산)을
+        asyncio.gather로 동시에 실행하여 검색 지연을 두 검색 중 긴 쪽 수준으로 줄입니다.
+        결합/필터링 로직은 retrieve()와 동일합니다.
+        """
+        print(f" [커리어 사례 검색] 시작 - '{query}'")
+        
+        if not self.ensemble_retriever:
+            print("[커리어 사례 검색] 앙상블 리트리버가 없음")
+            return []
+        
+        search_k = max(k * 2, 10)  # 요청된 개수의 2배 또는 최소 10개
+        
+        embedding_docs, bm25_docs = await asyncio.gather(
+            asyncio.to_thread(self._search_embedding_docs, query, search_k),
+            asyncio.to_thread(self._search_bm25_docs, query, search_k),
+        )
+        
+        all_docs = self._fuse_with_rrf(embedding_docs, bm25_docs)
+        return self._finalize_retrieved_docs(query, all_docs, k)
 
-        # 임베딩 결과 (가중치 0.3)
-        for rank, doc in enumerate(embedding_docs):
-            content_hash = hash(doc.page_content)
-            rrf_score = 1.0 / (rank + RRF_CONSTANT)
-            weighted_score = rrf_score * 0.3  # Vector Search 가중치
+    def _search_embedding_docs(self, query: str, search_k: int) -> List[Document]:
+        """Chroma 벡터스토어에서 임베딩 유사도 검색"""
+        embedding_docs = self.vectorstore.similarity_search(query, k=search_k)
+        print(f"DEBUG - 임베딩 검색 결과: {len(embedding_docs)}개")
+        return embedding_docs
 
-            if content_hash in doc_scores:
-                # 이미 있는 문서면 점수 누적 (여러 retriever에서 나온 경우)
-                doc_scores[content_hash] = (
-                    doc_scores[content_hash][0] + weighted_score,
-                    doc_scores[content_hash][1]
-                )
-            else:
-                doc_scores[content_hash] = (weighted_score, doc)
+    def _search_bm25_docs(self, query: str, search_k: int) -> List[Document]:
+        """
+        BM25 검색 (요청 개수만큼)
+        
+        공유 리트리버의 k 값을 바꾸지 않고 사전 계산된 BM25 인덱스에서 직접 상위 문서를
+        조회하므로 여러 요청이 동시에 검색해도 안전합니다.
+        """
+        if not self.bm25_index:
+            return []
+        try:
+            bm25_docs = self.bm25_index.search(query, search_k)
+            print(f"DEBUG - BM25 검색 결과: {len(bm25_docs)}개")
+            return bm25_docs
+        except Exception as e:
+            print(f"BM25 검색 실패: {e}")
+            return []
+
+    def _fuse_with_rrf(self, embedding_docs: List[Document], bm25_docs: List[Document]) -> List[Document]:
+        """두 검색 결과를 RRF 알고리즘으로 가중치 결합 (score = Σ weight / (60 + rank))"""
+        doc_scores = {} 
+        RRF_CONSTANT = 60
 
-        # BM25 결과 (가중치 0.7)
-        for rank, doc in enumerate(bm25_docs):
-            content_hash = hash(doc.page_content)
-            rrf_score = 1.0 / (rank + RRF_CONSTANT)
-            weighted_score = rrf_score * 0.7  # BM25 가중치
+        # 임베딩 결과 (가중치 0.3), BM25 결과 (가중치 0.7)
+        for docs, weight in ((embedding_docs, 0.3), (bm25_docs, 0.7)):
+            for rank, doc in enumerate(docs):
+                content_hash = hash(doc.page_content)
+                rrf_score = 1.0 / (rank + RRF_CONSTANT)
+                weighted_score = rrf_score * weight
 
-            if content_hash in doc_scores:
-                # 이미 있는 문서면 점수 누적
-                doc_scores[content_hash] = (
-                    doc_scores[content_hash][0] + weighted_score,
-                    doc_scores[content_hash][1]
-                )
-            else:
-                doc_scores[content_hash] = (weighted_score, doc)
+                if content_hash in doc_scores:
+                    # 이미 있는 문서면 점수 누적 (여러 retriever에서 나온 경우)
+                    doc_scores[content_hash] = (
+                        doc_scores[content_hash][0] + weighted_score,
+                        doc_scores[content_hash][1]
+                    )
+                else:
+                    doc_scores[content_hash] = (weighted_score, doc)
 
         # 점수 순으로 정렬하여 최종 문서 리스트 생성
         sorted_docs = sorted(doc_scores.values(), key=lambda x: x[0], reverse=True)
         all_docs = [doc for score, doc in sorted_docs]
 
         print(f"DEBUG - RRF 결합 결과: {len(all_docs)}개 (중복 제거됨)")
-        
+        return all_docs
+
+    def _finalize_retrieved_docs(self, query: str, all_docs: List[Document], k: int) -> List[Document]:
+        """RRF 결합 결과에 연도 필터링과 회사 비전 정보를 적용하여 최종 k개 반환"""
         # 최근 키워드 감지 및 연도 추출
         recent_keywords = ['최근', '최신', 'recent', '요즘', '지금', '현재', '새로운', '신규', '트렌드']
         is_recent_query = any(keyword in query.lower() for keyword in recent_keywords)
@@ -645,13 +734,18 @@ class CareerEnsembleRetrieverAgent:
         return max(years) if years else None
 
     def _load_education_resources(self):
-        """교육과정 리소스 지연 로딩"""
-        if self.education_vectorstore is None:
-            self._initialize_education_vectorstore()
-        if self.skill_education_mapping is None:
-            self._load_skill_education_mapping()
-        if self.course_deduplication_index is None:
-            self._load_deduplication_index()
+        """교육과정 리소스 지연 로딩 (스레드 안전)"""
+        if (self.education_vectorstore is not None
+                and self.skill_education_mapping is not None
+                and self.course_deduplication_index is not None):
+            return
+        with self._education_resources_lock:
+            if self.education_vectorstore is None:
+                self._initialize_education_vectorstore()
+            if self.skill_education_mapping is None:
+                self._load_skill_education_mapping()
+            if self.course_deduplication_index is None:
+                self._load_deduplication_index()
     
     def _initialize_education_vectorstore(self):
         """교육과정 VectorDB 초기화 (환경별 분기)"""
@@ -780,8 +874,8 @@ class CareerEnsembleRetrieverAgent:
         # 의도 분석에서 목표 스킬 추출
         target_skills = intent_analysis.get("career_history", [])
         
-        # 검색할 스킬 목록 생성
-        search_skills = list(set(current_skills + target_skills))
+        # 검색할 스킬 목록 생성 (순서를 유지하며 중복 제거 - 실행마다 과정 순서가 달라지지 않도록)
+        search_skills = list(dict.fromkeys(current_skills + target_skills))
         
         for skill_code in search_skills:
             if skill_code in self.skill_education_mapping:
@@ -824,7 +918,7 @@ class CareerEnsembleRetrieverAgent:
                 if "skills" in career:
                     skills.extend(career["skills"])
         
-        return list(set(skills))
+        return list(dict.fromkeys(skills))
     
     def _semantic_course_search(self, query: str, filtered_courses: List[Dict], max_results: int = 15) -> List[Dict]:
         """VectorDB를 활용한 의미적 검색 (VectorDB가 없으면 JSON에서 검색) - 지정된 개수까지 검색"""
@@ -1206,26 +1300,29 @@ class CareerEnsembleRetrieverAgent:
         return path
 
     def _load_original_course_data(self):
-        """원본 교육과정 상세 데이터 로드 (기존 속성 방식 사용)"""
-        if not hasattr(self, 'original_mysuni_data'):
-            try:
-                mysuni_path = PathConfig.MYSUNI_DETAILED
-                with open(mysuni_path, "r", encoding="utf-8") as f:
-                    self.original_mysuni_data = json.load(f)
-                self.logger.info(f"mySUNI 원본 데이터 로드 완료: {len(self.original_mysuni_data)}개 - 경로: {mysuni_path}")
-            except FileNotFoundError:
-                self.logger.warning(f"mySUNI 원본 데이터 파일을 찾을 수 없습니다. - 경로: {PathConfig.MYSUNI_DETAILED}")
-                self.original_mysuni_data = []
+        """원본 교육과정 상세 데이터 로드 (기존 속성 방식 사용, 스레드 안전)"""
+        if hasattr(self, 'original_mysuni_data') and hasattr(self, 'original_college_data'):
+            return
+        with self._original_course_data_lock:
+            if not hasattr(self, 'original_mysuni_data'):
+                try:
+                    mysuni_path = PathConfig.MYSUNI_DETAILED
+                    with open(mysuni_path, "r", encoding="utf-8") as f:
+                        self.original_mysuni_data = json.load(f)
+                    self.logger.info(f"mySUNI 원본 데이터 로드 완료: {len(self.original_mysuni_data)}개 - 경로: {mysuni_path}")
+                except FileNotFoundError:
+                    self.logger.warning(f"mySUNI 원본 데이터 파일을 찾을 수 없습니다. - 경로: {PathConfig.MYSUNI_DETAILED}")
+                    self.original_mysuni_data = []
                 
-        if not hasattr(self, 'original_college_data'):
-            try:
-                college_path = PathConfig.COLLEGE_DETAILED
-                with open(college_path, "r", encoding="utf-8") as f:
-                    self.original_college_data = json.load(f)
-                self.logger.info(f"College 원본 데이터 로드 완료: {len(self.original_college_data)}개 - 경로: {college_path}")
-            except FileNotFoundError:
-                self.logger.warning(f"College 원본 데이터 파일을 찾을 수 없습니다. - 경로: {PathConfig.COLLEGE_DETAILED}")
-                self.original_college_data = []
+            if not hasattr(self, 'original_college_data'):
+                try:
+                    college_path = PathConfig.COLLEGE_DETAILED
+                    with open(college_path, "r", encoding="utf-8") as f:
+                        self.original_college_data = json.load(f)
+                    self.logger.info(f"College 원본 데이터 로드 완료: {len(self.original_college_data)}개 - 경로: {college_path}")
+                except FileNotFoundError:
+                    self.logger.warning(f"College 원본 데이터 파일을 찾을 수 없습니다. - 경로: {PathConfig.COLLEGE_DETAILED}")
+                    self.original_college_data = []
 
     def _enrich_course_with_original_data(self, course: Dict) -> Dict:
         """VectorDB 검색 결과를 원본 데이터의 상세 정보로 보강"""
@@ -1403,6 +1500,17 @@ class CareerEnsembleRetrieverAgent:
             return ""
 
 
+@lru_cache()
+def get_career_retriever_agent() -> CareerEnsembleRetrieverAgent:
+    """
+    CareerEnsembleRetrieverAgent 싱글톤
+    
+    생성 시 Chroma 연결, career_docs.json 로드, BM25 인덱스 구축이 수행되므로
+    프로세스 전체에서 하나만 생성하여 모든 노드가 공유합니다. (앱 시작 시 lifespan에서 미리 생성)
+    """
+    return CareerEnsembleRetrieverAgent()
+
+
 class NewsRetrieverAgent:
     """
     뉴스 검색 에이전트
@@ -58,7 +58,7 @@ from typing import Dict, Any
 
 from app.config.settings import settings
 from app.graphs.state import ChatState
-from app.graphs.agents.retriever import CareerEnsembleRetrieverAgent as Retriever
+from app.graphs.agents.retriever import get_career_retriever_agent
 from app.graphs.agents.analyzer import IntentAnalysisAgent as Analyzer
 from app.graphs.agents.formatter import ResponseFormattingAgent as Formatter
 
@@ -107,7 +107,7 @@ class ChatGraphBuilder:
         self.session_store = {}  # conversation_id -> {"user_info": ..., "metadata": ...} 형태로 세션 정보 저장
         
         # G.Navi 에이전트들 초기화
-        self.career_retriever_agent = Retriever()  # 커리어 검색 에이전트 생성
+        self.career_retriever_agent = get_career_retriever_agent()  # 커리어 검색 에이전트 (싱글톤 공유)
         self.intent_analysis_agent = Analyzer()  # 의도 분석 에이전트 생성
         self.response_formatting_agent = Formatter()  # 응답 포맷팅 에이전트 생성
         
@@ -4,9 +4,9 @@
 기존 노드 대신 Agent를 직접 활용하여 간결한 구조로 변경
 """
 
-import os
 import json
 from typing import Dict, Any
+from app.config.openai_config import OPENAI_CONFIG
 from app.graphs.state import ChatState
 from app.utils.html_logger import save_career_response_to_html
 
@@ -19,29 +19,28 @@ class CareerPositioningNode:
     def __init__(self, graph_builder):
         self.graph_builder = graph_builder
         # Agent들을 직접 사용
-        from app.graphs.agents.analyzer import IntentAnalysisAgent
-        from app.graphs.agents.retriever import CareerEnsembleRetrieverAgent
+        from app.graphs.agents.analyzer import get_intent_analysis_agent
+        from app.graphs.agents.retriever import get_career_retriever_agent
         from app.graphs.agents.formatter import ResponseFormattingAgent
         from app.graphs.agents.mermaid_agent import MermaidDiagramAgent
         
-        self.intent_agent = IntentAnalysisAgent()
-        self.retriever_agent = CareerEnsembleRetrieverAgent()
+        self.intent_agent = get_intent_analysis_agent()  # 의도 분석 노드와 같은 인스턴스 공유
+        self.retriever_agent = get_career_retriever_agent()  # 다른 노드와 같은 인스턴스 공유
         self.formatter_agent = ResponseFormattingAgent()
         self.mermaid_agent = MermaidDiagramAgent()
     
     async def _generate_ai_career_analysis(self, merged_user_data: dict, retrieved_data: dict) -> Dict[str, Any]:
         """AI를 활용한 개인 맞춤형 커리어 분석 및 방향성 제안"""
         try:
-            from openai import AsyncOpenAI
-            
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = OPENAI_CONFIG.api_key
             if not api_key:
                 return {
                     "message": "AI 분석 기능이 현재 이용 불가합니다.",
                     "career_paths": []
                 }
             
-            client = AsyncOpenAI(api_key=api_key)
+            from app.core.dependencies import get_service_container
+            client = get_service_container().openai_client  # 공유 클라이언트 (커넥션 풀 재사용)
             
             # 회사 비전 컨텍스트 가져오기
             company_vision_context = ""
@@ -278,7 +277,7 @@ AI 분석 결과 (커리어 방향성):
         
         # 3. Agent 기반 데이터 검색
         try:
-            search_results = self.retriever_agent.retrieve(
+            search_results = await self.retriever_agent.aretrieve(
                 query=f"커리어 포지셔닝 {merged_user_data.get('domain', '')} {' '.join(merged_user_data.get('skills', []))}",
                 k=20
             )
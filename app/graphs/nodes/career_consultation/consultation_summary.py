@@ -4,8 +4,8 @@
 AI 기반 개인화된 동기부여 메시지 생성
 """
 
-import os
 from typing import Dict, Any
+from app.config.openai_config import OPENAI_CONFIG
 from app.graphs.state import ChatState
 from app.utils.html_logger import save_career_response_to_html
 from app.graphs.agents.mermaid_agent import MermaidDiagramAgent
@@ -23,9 +23,7 @@ class ConsultationSummaryNode:
     async def _generate_consultation_summary(self, merged_user_data: dict, selected_path: dict, consultation_context: dict, processing_log: list, state: ChatState) -> str:
         """AI 기반 상담 요약 및 격려 메시지 생성 (맞춤형 전략, 학습 로드맵 포함)"""
         try:
-            from openai import AsyncOpenAI
-            
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = OPENAI_CONFIG.api_key
             if not api_key:
                 return f"""## 상담 요약
 
@@ -36,7 +34,8 @@ class ConsultationSummaryNode:
 
 체계적인 계획을 바탕으로 꾸준히 실행해나가시면 반드시 목표를 달성하실 수 있습니다. 응원합니다!"""
             
-            client = AsyncOpenAI(api_key=api_key)
+            from app.core.dependencies import get_service_container
+            client = get_service_container().openai_client  # 공유 클라이언트 (커넥션 풀 재사용)
             
             skills_str = ", ".join(merged_user_data.get('skills', ['정보 없음']))
             path_name = selected_path.get('name', '선택된 경로')
@@ -4,8 +4,8 @@
 AI 기반 맞춤형 학습 계획 생성 (사내 교육과정 추천 포함)
 """
 
-import os
 from typing import Dict, Any
+from app.config.openai_config import OPENAI_CONFIG
 from app.graphs.state import ChatState
 from app.utils.html_logger import save_career_response_to_html
 
@@ -23,16 +23,15 @@ class LearningRoadmapNode:
     async def _generate_ai_learning_roadmap(self, merged_user_data: dict, selected_path: dict, user_goals: str, education_data: dict) -> Dict[str, Any]:
         """AI 기반 개인 맞춤형 학습 로드맵 생성"""
         try:
-            from openai import AsyncOpenAI
-            
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = OPENAI_CONFIG.api_key
             if not api_key:
                 return {
                     "message": "학습 로드맵 생성 기능이 현재 이용 불가합니다.",
                     "learning_resources": {}
                 }
             
-            client = AsyncOpenAI(api_key=api_key)
+            from app.core.dependencies import get_service_container
+            client = get_service_container().openai_client  # 공유 클라이언트 (커넥션 풀 재사용)
             
             path_name = selected_path.get('name', '선택된 경로')
             
@@ -330,7 +329,7 @@ class LearningRoadmapNode:
             
             # 데이터 검색 노드 호출
             print(" DEBUG - data_retrieval_node.retrieve_additional_data_node 호출 중...")
-            state = self.data_retrieval_node.retrieve_additional_data_node(state)
+            state = await self.data_retrieval_node.retrieve_additional_data_node(state)
             print(" DEBUG - data_retrieval_node 호출 완료")
             
             # 원래 쿼리 복원
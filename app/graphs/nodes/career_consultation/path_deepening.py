@@ -5,8 +5,8 @@
 AI 기반 개인 맞춤형 전략 분석 포함
 """
 
-import os
 from typing import Dict, Any
+from app.config.openai_config import OPENAI_CONFIG
 from app.graphs.state import ChatState
 from app.utils.html_logger import save_career_response_to_html
 
@@ -19,20 +19,19 @@ class PathDeepeningNode:
     def __init__(self, graph_builder):
         self.graph_builder = graph_builder
         # Agent를 직접 사용
-        from app.graphs.agents.retriever import CareerEnsembleRetrieverAgent, NewsRetrieverAgent
-        self.retriever_agent = CareerEnsembleRetrieverAgent()
+        from app.graphs.agents.retriever import get_career_retriever_agent, NewsRetrieverAgent
+        self.retriever_agent = get_career_retriever_agent()  # 다른 노드와 같은 인스턴스 공유
         self.news_agent = NewsRetrieverAgent()  # 뉴스 검색 전용 에이전트 추가
     
     async def _generate_ai_action_plan(self, merged_user_data: dict, selected_path: dict, user_goals: str, retrieved_data: dict, path_selection_context: dict = None) -> str:
         """AI 기반 사내 데이터를 활용한 액션 플랜 및 멘토 추천 생성"""
         try:
-            from openai import AsyncOpenAI
-            
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = OPENAI_CONFIG.api_key
             if not api_key:
                 return "AI 분석 기능이 현재 이용 불가합니다."
             
-            client = AsyncOpenAI(api_key=api_key)
+            from app.core.dependencies import get_service_container
+            client = get_service_container().openai_client  # 공유 클라이언트 (커넥션 풀 재사용)
             
             # 회사 비전 컨텍스트 가져오기
             company_vision_context = ""
@@ -5,8 +5,8 @@
 AI 기반 개인 맞춤형 질문 생성 포함
 """
 
-import os
 from typing import Dict, Any
+from app.config.openai_config import OPENAI_CONFIG
 from app.graphs.state import ChatState
 from app.utils.html_logger import save_career_response_to_html
 
@@ -22,13 +22,12 @@ class PathSelectionNode:
     async def _generate_path_selection_response(self, merged_user_data: dict, selected_path: dict) -> str:
         """선택한 경로에 대한 AI 기반 간결한 확인 및 목표 설정 질문 생성"""
         try:
-            from openai import AsyncOpenAI
-            
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = OPENAI_CONFIG.api_key
             if not api_key:
                 return "경로 선택을 확인했습니다. 구체적인 목표를 설정해보겠습니다."
             
-            client = AsyncOpenAI(api_key=api_key)
+            from app.core.dependencies import get_service_container
+            client = get_service_container().openai_client  # 공유 클라이언트 (커넥션 풀 재사용)
             
             skills_str = ", ".join(merged_user_data.get('skills', ['정보 없음']))
             path_name = selected_path.get('name', '선택된 경로')
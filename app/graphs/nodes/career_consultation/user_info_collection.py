@@ -5,8 +5,8 @@
 AI 기반 개인화된 질문 생성
 """
 
-import os
 from typing import Dict, Any, List
+from app.config.openai_config import OPENAI_CONFIG
 from app.graphs.state import ChatState
 from app.utils.html_logger import save_career_response_to_html
 
@@ -22,13 +22,12 @@ class UserInfoCollectionNode:
     async def _generate_personalized_question(self, field: str, user_name: str, context: str = "") -> str:
         """AI 기반 개인화된 정보 수집 질문 생성"""
         try:
-            from openai import AsyncOpenAI
-            
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = OPENAI_CONFIG.api_key
             if not api_key:
                 return self._get_info_request_message(field, user_name, is_first_request=True)
             
-            client = AsyncOpenAI(api_key=api_key)
+            from app.core.dependencies import get_service_container
+            client = get_service_container().openai_client  # 공유 클라이언트 (커넥션 풀 재사용)
             
             field_descriptions = {
                 'level': '경력 레벨 정보 (CL1~CL5)',
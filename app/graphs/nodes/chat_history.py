@@ -11,6 +11,7 @@ import logging
 from datetime import datetime
 from typing import List, Dict
 from app.graphs.state import ChatState
+from app.utils.timing import record_step_time
 
 
 class ChatHistoryNode:
@@ -38,16 +39,16 @@ class ChatHistoryNode:
         Returns:
             ChatState: 통합된 대화 내역이 포함된 상태
         """
+        # 메시지 검증 실패 시 처리 건너뛰기 (시간 측정 전에 바로 반환)
+        if state.get("workflow_status") == "validation_failed":
+            self.logger.debug("[1단계] 메시지 검증 실패로 처리 건너뛰기")
+            return state
+        
         import time
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         
         try:
-            # 메시지 검증 실패 시 처리 건너뛰기
-            if state.get("workflow_status") == "validation_failed":
-                print(f"[1단계] 메시지 검증 실패로 처리 건너뛰기")
-                return state
-                
-            print(f"\n[1단계] 현재 세션 대화내역 관리 시작...")
+            self.logger.debug("[1단계] 현재 세션 대화내역 관리 시작...")
             self.logger.info("=== 1단계: 현재 세션 대화내역 관리 ===")
             
             # SpringBoot에서 전달받은 이전 메시지를 current_session_messages에 통합
@@ -91,11 +92,12 @@ class ChatHistoryNode:
             else:
                 self.logger.info("SpringBoot에서 전달받은 이전 메시지 없음")
             
-            # 현재 사용자 질문을 대화 내역에 추가
+            # 현재 사용자 질문을 대화 내역에 추가 (타임스탬프는 요청 단위로 한 번만 생성된 값 사용)
+            request_timestamp = state.get("request_timestamp") or datetime.now().isoformat()
             current_user_message = {
                 "role": "user",
                 "content": state["user_question"],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": request_timestamp
             }
             state["current_session_messages"].append(current_user_message)
             self.logger.info(f"현재 사용자 메시지 추가: {state['user_question'][:100]}...")
@@ -114,60 +116,36 @@ class ChatHistoryNode:
                         role="user",
                         content=state["user_question"],
                         metadata={
-                            "timestamp": datetime.now().isoformat(),
+                            "timestamp": request_timestamp,
                             "source": "chat_history_node"
                         }
                     )
-                    print(f"ConversationHistoryManager에 사용자 질문 추가: {session_id}")
+                    self.logger.debug("ConversationHistoryManager에 사용자 질문 추가: %s", session_id)
                 else:
-                    print(f"session_id가 없어 ConversationHistoryManager에 추가하지 못함")
+                    self.logger.debug("session_id가 없어 ConversationHistoryManager에 추가하지 못함")
             except Exception as e:
-                print(f"ConversationHistoryManager에 사용자 질문 추가 실패: {e}")
+                self.logger.warning("ConversationHistoryManager에 사용자 질문 추가 실패: %s", e)
             
             state["processing_log"].append(f"현재 세션 대화 내역 관리 완료: {len(state['current_session_messages'])}개")
             
             # 처리 시간 계산 및 로그
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:
-                time_display = f"{step_time:.3f}초"
+            time_display = record_step_time(state, start_time, "1단계 처리 시간")
             
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"1단계 처리 시간: {time_display}")
-            state["processing_log"] = processing_log
-            
-            print(f"[1단계] 현재 세션 대화내역 관리 완료")
-            print(f"복원된 메시지: {len(state['current_session_messages'])-1}개, 현재 추가: 1개")
-            print(f"[1단계] 처리 시간: {time_display}")
+            self.logger.debug("[1단계] 현재 세션 대화내역 관리 완료")
+            self.logger.debug("복원된 메시지: %s개, 현재 추가: 1개", len(state['current_session_messages'])-1)
+            self.logger.debug("[1단계] 처리 시간: %s", time_display)
             
             self.logger.info(f"현재 세션 대화 내역 관리 완료")
             
         except Exception as e:
             # 오류 발생 시에도 처리 시간 기록
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:
-                time_display = f"{step_time:.3f}초"
-                
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"1단계 처리 시간 (오류): {time_display}")
-            state["processing_log"] = processing_log
+            time_display = record_step_time(state, start_time, "1단계 처리 시간 (오류)")
             
             error_msg = f"현재 세션 대화 내역 관리 실패: {e}"
             self.logger.error(error_msg)
             state["error_messages"].append(error_msg)
             
-            print(f"[1단계] 대화내역 관리 오류: {time_display} (오류: {e})")
+            self.logger.debug("[1단계] 대화내역 관리 오류: %s (오류: %s)", time_display, e)
             
             # 오류가 있어도 현재 대화는 유지
             if "current_session_messages" not in state:
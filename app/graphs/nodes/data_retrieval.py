@@ -7,10 +7,30 @@
 *
 """
 
+import asyncio
 import logging
+import re
+import threading
 from datetime import datetime
 from app.graphs.state import ChatState
-from app.graphs.agents.retriever import CareerEnsembleRetrieverAgent
+from app.graphs.agents.retriever import get_career_retriever_agent
+from app.utils.timing import record_step_time
+
+# 교육과정 관련 키워드 (더 넓은 범위)
+_EDUCATION_KEYWORDS = (
+    "교육", "과정", "학습", "스킬", "배우", "공부", "강의", "수업", "커리큘럼", "교육과정",
+    "추천", "개발", "향상", "성장", "능력", "역량", "전문성", "경력", "취업", "이직",
+    "AI", "데이터", "프로그래밍", "개발자", "분석", "머신러닝", "프로젝트"
+)
+# AI/기술 관련 쿼리도 교육과정 추천 대상에 포함
+_AI_TECH_KEYWORDS = ("AI", "인공지능", "데이터분석", "머신러닝", "딥러닝", "프로그래밍", "개발", "코딩")
+# 두 키워드 목록을 하나의 정규식으로 결합 (요청마다 키워드별 부분 문자열 검색을 반복하지 않도록)
+_EDUCATION_QUERY_PATTERN = re.compile("|".join(map(re.escape, dict.fromkeys(_EDUCATION_KEYWORDS + _AI_TECH_KEYWORDS))))
+
+# '비슷한 연차' 관련 질의 표현
+_SIMILAR_EXPERIENCE_PATTERN = re.compile("|".join(map(re.escape, (
+    "비슷한 연차", "동일 연차", "내 연차", "비슷한 경력", "비슷한 CL", "비슷한 경험자"
+))))
 
 
 class DataRetrievalNode:
@@ -29,17 +49,19 @@ class DataRetrievalNode:
     """
 
     def __init__(self):
-        self.career_retriever_agent = CareerEnsembleRetrieverAgent()
+        self.career_retriever_agent = get_career_retriever_agent()  # 프로세스 전체에서 공유
         self.logger = logging.getLogger(__name__)
         
-        # 뉴스 검색 에이전트 초기화 (지연 로딩)
+        # 뉴스 검색 에이전트 초기화 (지연 로딩 - 뉴스 검색은 요청 스레드에서 동시에 실행되므로 잠금으로 한 번만 생성)
         self.news_retriever_agent = None
+        self._news_retriever_lock = threading.Lock()
 
-    def retrieve_additional_data_node(self, state: ChatState) -> ChatState:
+    async def retrieve_additional_data_node(self, state: ChatState) -> ChatState:
         """
         3단계: 추가 데이터 검색 (커리어 사례 + 교육과정 + 뉴스 데이터 + 과거 대화)
         
-        의도 분석에서 추출된 키워드를 사용하여 다음 데이터를 Vector Store에서 검색합니다:
+        의도 분석에서 추출된 키워드를 사용하여 다음 데이터를 Vector Store에서 검색합니다.
+        서로 독립적인 커리어 사례/교육과정/뉴스 검색은 동시에 실행합니다:
         - 관련 커리어 사례 (성공 사례 및 전환 경험)
         - 개인화된 교육과정 (학습 경로 포함)
         - 최신 뉴스 데이터 (산업 동향 및 관련 정보)
@@ -51,70 +73,32 @@ class DataRetrievalNode:
         Returns:
             ChatState: 검색된 모든 데이터가 포함된 상태
         """
+        # 메시지 검증 실패 시 처리 건너뛰기 (시간 측정 전에 바로 반환)
+        if state.get("workflow_status") == "validation_failed":  # 검증 실패 상태 확인
+            self.logger.debug("[3단계] 메시지 검증 실패로 처리 건너뛰기")
+            return state
+        
         import time
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         
         try:  # 데이터 검색 처리 시작
-            # 메시지 검증 실패 시 처리 건너뛰기
-            if state.get("workflow_status") == "validation_failed":  # 검증 실패 상태 확인
-                print(f"[3단계] 메시지 검증 실패로 처리 건너뛰기")
-                return state
-                
-            print(f"\n[3단계] 추가 데이터 검색 시작...")
+            self.logger.debug("[3단계] 추가 데이터 검색 시작...")
             self.logger.info("=== 3단계: 추가 데이터 검색 (커리어 + 교육과정 + 뉴스 + 과거대화) ===")
             
             intent_analysis = state.get("intent_analysis", {})  # 의도 분석 결과 조회
             user_question = state.get("user_question", "")  # 사용자 질문 조회
             
-            # 1. 과거 대화 내역 검색 (개인화)
-            past_conversations = self._search_past_conversations(state)  # 과거 대화 검색 호출
-            
-            # 2. 커리어 사례 검색 (성공 사례)
-            user_data = state.get("user_data", {})
-            user_experience = user_data.get("experience")
-            # '비슷한 연차' 관련 질의 감지
-            similar_exp_keywords = ["비슷한 연차", "동일 연차", "내 연차", "비슷한 경력", "비슷한 CL", "비슷한 경험자"]
-            is_similar_exp_query = any(kw in user_question for kw in similar_exp_keywords)
-            # 2. 커리어 사례 검색 (성공 사례)
-            career_keywords = intent_analysis.get("career_history", [])  # 커리어 키워드 추출
-            if not career_keywords:  # 키워드가 없는 경우
-                career_keywords = [user_question]  # 사용자 질문을 키워드로 사용
-            career_query = " ".join(career_keywords[:2])  # 상위 2개 키워드를 쿼리로 조합
-            career_search_count = state.get("career_search_count", 2)
-            print(f"DEBUG - 커리어 검색 요청: k={career_search_count}, query='{career_query}'")
-            career_cases = self.career_retriever_agent.retrieve(career_query, k=career_search_count*2 if is_similar_exp_query else career_search_count)
-            # 연차 필터링: 비슷한 연차 질의일 때만
-            if is_similar_exp_query and user_experience:
-                filtered_cases = []
-                for case in career_cases:
-                    metadata = getattr(case, 'metadata', {})
-                    case_exp = metadata.get('experience')
-                    if case_exp and case_exp == user_experience:
-                        filtered_cases.append(case)
-                # 필터링된 결과가 있으면 우선 사용, 없으면 기존 방식 fallback
-                if filtered_cases:
-                    career_cases = filtered_cases[:career_search_count]
-                else:
-                    career_cases = career_cases[:career_search_count]
-            else:
-                career_cases = career_cases[:career_search_count]
+            # 1. 과거 대화 내역 검색 (개인화) - 2단계에서 미리 검색된 결과가 있으면 재사용
+            past_conversations = state.get("past_conversations")
+            if past_conversations is None:
+                past_conversations = self._search_past_conversations(state)  # 과거 대화 검색 호출
             
-            # 각 검색 결과의 메타데이터 확인
-            for i, case in enumerate(career_cases):  # 검색 결과 순회
-                metadata = getattr(case, 'metadata', {})  # 메타데이터 조회
-                employee_id = metadata.get('employee_id', 'Unknown')  # 직원 ID 조회
-                print(f" DEBUG - 결과 {i+1}: Employee {employee_id}")
-            # end for (검색 결과 순회)
-            
-            if len(career_cases) < career_search_count:  # 검색 결과가 요청보다 적은 경우
-                print(f"WARNING - 요청한 {career_search_count}개보다 적은 {len(career_cases)}개만 검색됨")
-                print(f"WARNING - Vector Store에 저장된 데이터가 부족하거나 검색 쿼리와 유사도가 낮은 것으로 추정")
-            
-            # 3. 교육과정 검색 (학습 경로)
-            education_results = self._search_education_courses(state, intent_analysis)  # 교육과정 검색 호출
-            
-            # 4. 뉴스 데이터 검색 (최신 동향)
-            news_results = self._get_news_results(state, intent_analysis)  # 뉴스 데이터 검색 호출
+            # 2~4. 커리어 사례 / 교육과정 / 뉴스 검색 - 서로 독립적인 Vector Store 검색이므로 동시에 실행
+            (career_cases, career_search_count, career_query), education_results, news_results = await asyncio.gather(
+                self._search_career_cases(state, intent_analysis, user_question),
+                asyncio.to_thread(self._search_education_courses, state, intent_analysis),
+                asyncio.to_thread(self._get_news_results, state, intent_analysis),
+            )
             
             # 상태 업데이트
             state["past_conversations"] = past_conversations
@@ -130,24 +114,12 @@ class DataRetrievalNode:
             )
             
             # 처리 시간 계산 및 로그
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:  # 마이크로초 단위인 경우
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:  # 밀리초 단위인 경우
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:  # 초 단위인 경우
-                time_display = f"{step_time:.3f}초"
+            time_display = record_step_time(state, start_time, "3단계 처리 시간")
             
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"3단계 처리 시간: {time_display}")
-            state["processing_log"] = processing_log
-            
-            print(f"[3단계] 추가 데이터 검색 완료")
-            print(f"커리어 사례: {len(career_cases)}개 (요청 개수: {career_search_count}), 교육과정: {len(education_results.get('recommended_courses', []))}개, 뉴스: {len(news_results)}개, 과거 대화: {len(past_conversations)}개")
-            print(f"검색 쿼리: {career_query[:50]}...")
-            print(f"[3단계] 처리 시간: {time_display}")
+            self.logger.debug("[3단계] 추가 데이터 검색 완료")
+            self.logger.debug("커리어 사례: %s개 (요청 개수: %s), 교육과정: %s개, 뉴스: %s개, 과거 대화: %s개", len(career_cases), career_search_count, len(education_results.get('recommended_courses', [])), len(news_results), len(past_conversations))
+            self.logger.debug("검색 쿼리: %s...", career_query[:50])
+            self.logger.debug("[3단계] 처리 시간: %s", time_display)
             
             self.logger.info(
                 f"커리어 사례 {len(career_cases)}개 (요청 개수: {career_search_count}), "
@@ -158,19 +130,7 @@ class DataRetrievalNode:
             
         except Exception as e:
             # 오류 발생 시에도 처리 시간 기록
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:
-                time_display = f"{step_time:.3f}초"
-                
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"3단계 처리 시간 (오류): {time_display}")
-            state["processing_log"] = processing_log
+            time_display = record_step_time(state, start_time, "3단계 처리 시간 (오류)")
             
             error_msg = f"데이터 검색 실패: {e}"
             self.logger.error(error_msg)
@@ -180,10 +140,58 @@ class DataRetrievalNode:
             state["past_conversations"] = []
             state["news_data"] = []
             
-            print(f"[3단계] 데이터 검색 오류: {time_display} (오류: {e})")
+            self.logger.debug("[3단계] 데이터 검색 오류: %s (오류: %s)", time_display, e)
         
         return state
     
+    async def _search_career_cases(self, state: ChatState, intent_analysis: dict, user_question: str) -> tuple:
+        """
+        커리어 사례 검색 (성공 사례) - 비슷한 연차 질의면 연차 기준으로 필터링
+        
+        Returns:
+            tuple: (커리어 사례 목록, 요청 검색 개수, 검색 쿼리)
+        """
+        user_data = state.get("user_data", {})
+        user_experience = user_data.get("experience")
+        # '비슷한 연차' 관련 질의 감지
+        is_similar_exp_query = _SIMILAR_EXPERIENCE_PATTERN.search(user_question) is not None
+        career_keywords = intent_analysis.get("career_history", [])  # 커리어 키워드 추출
+        if not career_keywords:  # 키워드가 없는 경우
+            career_keywords = [user_question]  # 사용자 질문을 키워드로 사용
+        career_query = " ".join(career_keywords[:2])  # 상위 2개 키워드를 쿼리로 조합
+        career_search_count = state.get("career_search_count", 2)
+        self.logger.debug("커리어 검색 요청: k=%s, query='%s'", career_search_count, career_query)
+        career_cases = await self.career_retriever_agent.aretrieve(career_query, k=career_search_count*2 if is_similar_exp_query else career_search_count)
+        # 연차 필터링: 비슷한 연차 질의일 때만
+        if is_similar_exp_query and user_experience:
+            filtered_cases = []
+            for case in career_cases:
+                metadata = getattr(case, 'metadata', {})
+                case_exp = metadata.get('experience')
+                if case_exp and case_exp == user_experience:
+                    filtered_cases.append(case)
+            # 필터링된 결과가 있으면 우선 사용, 없으면 기존 방식 fallback
+            if filtered_cases:
+                career_cases = filtered_cases[:career_search_count]
+            else:
+                career_cases = career_cases[:career_search_count]
+        else:
+            career_cases = career_cases[:career_search_count]
+        
+        # 각 검색 결과의 메타데이터 확인
+        if self.logger.isEnabledFor(logging.DEBUG):  # 결과별 로그는 DEBUG 레벨에서만 순회
+            for i, case in enumerate(career_cases):  # 검색 결과 순회
+                metadata = getattr(case, 'metadata', {})  # 메타데이터 조회
+                employee_id = metadata.get('employee_id', 'Unknown')  # 직원 ID 조회
+                self.logger.debug("결과 %s: Employee %s", i+1, employee_id)
+            # end for (검색 결과 순회)
+        
+        if len(career_cases) < career_search_count:  # 검색 결과가 요청보다 적은 경우
+            self.logger.warning("요청한 %s개보다 적은 %s개만 검색됨", career_search_count, len(career_cases))
+            self.logger.warning("Vector Store에 저장된 데이터가 부족하거나 검색 쿼리와 유사도가 낮은 것으로 추정")
+        
+        return career_cases, career_search_count, career_query
+    
     def _search_education_courses(self, state: ChatState, intent_analysis: dict) -> dict:
         """
          교육과정 검색 및 추천 로직
@@ -203,19 +211,9 @@ class DataRetrievalNode:
         user_data = state.get("user_data", {})
         user_question = state.get("user_question", "")
         
-        # 교육과정 관련 키워드 감지 (더 넓은 범위)
-        education_keywords = [
-            "교육", "과정", "학습", "스킬", "배우", "공부", "강의", "수업", "커리큘럼", "교육과정",
-            "추천", "개발", "향상", "성장", "능력", "역량", "전문성", "경력", "취업", "이직",
-            "AI", "데이터", "프로그래밍", "개발자", "분석", "머신러닝", "프로젝트"
-        ]
-        
-        # AI/기술 관련 쿼리도 교육과정 추천 대상에 포함
-        ai_tech_keywords = ["AI", "인공지능", "데이터분석", "머신러닝", "딥러닝", "프로그래밍", "개발", "코딩"]
-        
+        # 교육과정/AI·기술 관련 키워드 감지 (미리 컴파일한 정규식으로 질문을 한 번만 스캔)
         is_education_query = (
-            any(keyword in user_question for keyword in education_keywords) or
-            any(keyword in user_question for keyword in ai_tech_keywords) or
+            _EDUCATION_QUERY_PATTERN.search(user_question) is not None or
             intent_analysis.get("intent") == "course_recommendation"
         )
         
@@ -236,7 +234,7 @@ class DataRetrievalNode:
             )
             
             self.logger.info(f"교육과정 검색 완료: {len(education_results.get('recommended_courses', []))}개 (요청 개수: {education_search_count})")
-            print(f"DEBUG - 교육과정 검색 완료: {len(education_results.get('recommended_courses', []))}개 (요청 개수: {education_search_count})")
+            self.logger.debug("교육과정 검색 완료: %s개 (요청 개수: %s)", len(education_results.get('recommended_courses', [])), education_search_count)
             return education_results
             
         except Exception as e:
@@ -294,9 +292,9 @@ class DataRetrievalNode:
                 return []
             
             # 3단계: 사용자별 VectorDB에서 의미 기반 검색 실행
-            from app.utils.session_vectordb_builder import session_vectordb_builder
+            from app.utils.session_vectordb_builder import get_session_vectordb_builder
             
-            search_results = session_vectordb_builder.search_user_sessions(
+            search_results = get_session_vectordb_builder().search_user_sessions(
                 member_id=str(member_id),    # 사용자별 VectorDB 식별자
                 query=user_question,         # 현재 질문을 검색 쿼리로 사용
                 k=3                         # 상위 3개 결과만 (과도한 컨텍스트 방지)
@@ -363,12 +361,14 @@ class DataRetrievalNode:
         try:
             # 1단계: 뉴스 검색 에이전트 지연 로딩 (메모리 효율성)
             if self.news_retriever_agent is None:
-                try:
-                    from app.graphs.agents.retriever import NewsRetrieverAgent
-                    self.news_retriever_agent = NewsRetrieverAgent()
-                except ImportError as e:
-                    self.logger.warning(f"뉴스 검색 에이전트를 로드할 수 없습니다: {e}")
-                    return []
+                with self._news_retriever_lock:
+                    if self.news_retriever_agent is None:
+                        try:
+                            from app.graphs.agents.retriever import NewsRetrieverAgent
+                            self.news_retriever_agent = NewsRetrieverAgent()
+                        except ImportError as e:
+                            self.logger.warning(f"뉴스 검색 에이전트를 로드할 수 없습니다: {e}")
+                            return []
             
             # 2단계: 검색 쿼리 준비
             user_question = state.get("user_question", "")
@@ -9,7 +9,20 @@
 
 from typing import Dict, Any
 import logging
+import re
 from app.graphs.state import ChatState
+from app.utils.timing import record_step_time
+
+# 응답 마무리 부분(G.Navi 멘트, 구분선, 맺음말) 탐지 - 줄 앞 공백은 무시
+_CLOSING_PATTERN = re.compile(r"^[^\S\n]*(?:\*G\.Navi|---)|응원합니다|궁금한", re.MULTILINE)
+
+# 응답에 삽입하는 다이어그램 섹션 (고정 부분은 모듈 로드 시 한 번만 생성)
+_DIAGRAM_SECTION_TEMPLATE = (
+    "\n\n---\n\n"
+    "```mermaid\n{}\n```\n\n"
+    "*위 다이어그램은 설명 내용을 구조적으로 시각화한 것입니다.*\n\n"
+    "---\n"
+)
 
 
 class DiagramGenerationNode:
@@ -36,16 +49,16 @@ class DiagramGenerationNode:
         Returns:
             ChatState: 다이어그램과 최종 응답이 통합된 상태
         """
+        # 메시지 검증 실패 시 처리 건너뛰기 (시간 측정 전에 바로 반환)
+        if state.get("workflow_status") == "validation_failed":
+            self.logger.debug("[5단계] 메시지 검증 실패로 처리 건너뛰기")
+            return state
+        
         import time
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()  # 정수 나노초 (공통 시간 표시 헬퍼와 동일 단위)
         
         try:
-            # 메시지 검증 실패 시 처리 건너뛰기
-            if state.get("workflow_status") == "validation_failed":
-                print(f"[5단계] 메시지 검증 실패로 처리 건너뛰기")
-                return state
-                
-            print(f"\n[5단계] 다이어그램 생성 및 통합 시작...")
+            self.logger.debug("[5단계] 다이어그램 생성 및 통합 시작...")
             
             # 필요한 데이터 추출
             formatted_response = state.get("formatted_response", {})
@@ -63,63 +76,39 @@ class DiagramGenerationNode:
             
             # 포맷된 콘텐츠가 없으면 다이어그램 생성 건너뛰기
             if not formatted_content or not formatted_content.strip():
-                print("[다이어그램 생성] 포맷된 콘텐츠가 없어 생성 건너뛰기")
+                self.logger.debug("[다이어그램 생성] 포맷된 콘텐츠가 없어 생성 건너뛰기")
                 state["mermaid_diagram"] = ""
                 state["diagram_generated"] = False
                 # 다이어그램 없이 원본 응답을 FE용 최종 응답으로 설정
                 state["final_response"] = formatted_response
-                print("[다이어그램 생성] 원본 응답을 FE용 최종 응답으로 설정")
+                self.logger.debug("[다이어그램 생성] 원본 응답을 FE용 최종 응답으로 설정")
                 
                 # 처리 시간 기록
-                end_time = time.perf_counter()
-                step_time = end_time - start_time
-                
-                if step_time < 0.001:
-                    time_display = f"{step_time * 1000000:.0f}μs"
-                elif step_time < 0.01:
-                    time_display = f"{step_time * 1000:.1f}ms"
-                else:
-                    time_display = f"{step_time:.3f}초"
-                
-                processing_log = state.get("processing_log", [])
-                processing_log.append(f"5단계 처리 시간: {time_display}")
-                state["processing_log"] = processing_log
+                time_display = record_step_time(state, start_time, "5단계 처리 시간")
                 
-                print(f"[5단계] 다이어그램 없음 처리 완료: {time_display}")
+                self.logger.debug("[5단계] 다이어그램 없음 처리 완료: %s", time_display)
                 return state
             
             # 다이어그램 생성이 의미있는지 판단
             if not self._should_generate_diagram(formatted_content, user_question):
-                print("[다이어그램 생성] 생성 필요하지 않은 내용으로 판단")
+                self.logger.debug("[다이어그램 생성] 생성 필요하지 않은 내용으로 판단")
                 state["mermaid_diagram"] = ""
                 state["diagram_generated"] = False
                 # 다이어그램 없이 원본 응답을 FE용 최종 응답으로 설정
                 state["final_response"] = formatted_response
-                print("[다이어그램 생성] 원본 응답을 FE용 최종 응답으로 설정")
+                self.logger.debug("[다이어그램 생성] 원본 응답을 FE용 최종 응답으로 설정")
                 
                 # 처리 시간 기록
-                end_time = time.perf_counter()
-                step_time = end_time - start_time
-                
-                if step_time < 0.001:
-                    time_display = f"{step_time * 1000000:.0f}μs"
-                elif step_time < 0.01:
-                    time_display = f"{step_time * 1000:.1f}ms"
-                else:
-                    time_display = f"{step_time:.3f}초"
+                time_display = record_step_time(state, start_time, "5단계 처리 시간")
                 
-                processing_log = state.get("processing_log", [])
-                processing_log.append(f"5단계 처리 시간: {time_display}")
-                state["processing_log"] = processing_log
-                
-                print(f"[5단계] 다이어그램 생성 불필요 처리 완료: {time_display}")
+                self.logger.debug("[5단계] 다이어그램 생성 불필요 처리 완료: %s", time_display)
                 return state
             
             # Mermaid 에이전트 import (순환 import 방지를 위해 지연 import)
             from app.graphs.agents.mermaid_agent import MermaidDiagramAgent
             
             # 다이어그램 생성
-            print("[다이어그램 생성] Mermaid 다이어그램 생성 중...")
+            self.logger.debug("[다이어그램 생성] Mermaid 다이어그램 생성 중...")
             mermaid_agent = MermaidDiagramAgent()
             mermaid_code = mermaid_agent.generate_diagram(
                 formatted_content=formatted_content,
@@ -133,69 +122,45 @@ class DiagramGenerationNode:
             state["diagram_generated"] = bool(mermaid_code and mermaid_code.strip())
             
             # 다이어그램 생성 여부와 관계없이 FE용 최종 응답 생성
-            print("[다이어그램 생성] FE용 최종 응답 통합 중...")
+            self.logger.debug("[다이어그램 생성] FE용 최종 응답 통합 중...")
             final_response = self._integrate_diagram_to_response(
                 formatted_response, mermaid_code, state["diagram_generated"]
             )
             state["final_response"] = final_response
             
             # 처리 시간 계산 및 로그
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:
-                time_display = f"{step_time:.3f}초"
-            
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"5단계 처리 시간: {time_display}")
-            state["processing_log"] = processing_log
+            time_display = record_step_time(state, start_time, "5단계 처리 시간")
             
             #  MessageProcessor를 위한 bot_message 설정 (5단계에서 최종 설정)
             final_response = state.get("final_response", {})
             if isinstance(final_response, dict) and final_response.get("formatted_content"):
                 state["bot_message"] = final_response["formatted_content"]
-                print("[5단계] bot_message 설정 완료 (사용자 응답 준비)")
+                self.logger.debug("[5단계] bot_message 설정 완료 (사용자 응답 준비)")
             else:
                 # 폴백: 기본 메시지
                 state["bot_message"] = "응답 처리가 완료되었습니다."
-                print("[5단계] bot_message 폴백 설정")
+                self.logger.debug("[5단계] bot_message 폴백 설정")
             
             if state["diagram_generated"]:
-                print(f"[5단계] 다이어그램 생성 및 통합 완료")
-                print(f"다이어그램 길이: {len(mermaid_code)}자")
-                print(f"FE 응답 통합: 완료")
-                print(f"[5단계] 처리 시간: {time_display}")
+                self.logger.debug("[5단계] 다이어그램 생성 및 통합 완료")
+                self.logger.debug("다이어그램 길이: %s자", len(mermaid_code))
+                self.logger.debug("FE 응답 통합: 완료")
+                self.logger.debug("[5단계] 처리 시간: %s", time_display)
                 self.logger.info("Mermaid 다이어그램 생성 및 FE용 최종 응답 통합 성공")
             else:
-                print(f"[5단계] 다이어그램 없는 응답 완료")
-                print(f"FE 응답 통합: 원본 사용")
-                print(f"[5단계] 처리 시간: {time_display}")
+                self.logger.debug("[5단계] 다이어그램 없는 응답 완료")
+                self.logger.debug("FE 응답 통합: 원본 사용")
+                self.logger.debug("[5단계] 처리 시간: %s", time_display)
                 self.logger.info("다이어그램 없는 FE용 최종 응답 생성 완료")
                 
             return state
             
         except Exception as e:
             # 오류 발생 시에도 처리 시간 기록
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:
-                time_display = f"{step_time:.3f}초"
-                
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"5단계 처리 시간 (오류): {time_display}")
-            state["processing_log"] = processing_log
+            time_display = record_step_time(state, start_time, "5단계 처리 시간 (오류)")
             
             self.logger.error(f"다이어그램 생성 노드 오류: {e}")
-            print(f"[5단계] 다이어그램 생성 오류: {time_display} (오류: {e})")
+            self.logger.debug("[5단계] 다이어그램 생성 오류: %s (오류: %s)", time_display, e)
             
             # 오류 시 빈 다이어그램으로 설정하지만 FE용 최종 응답은 생성
             state["mermaid_diagram"] = ""
@@ -208,13 +173,13 @@ class DiagramGenerationNode:
             # 💫 오류 시에도 bot_message 설정 (5단계에서 최종 설정)
             if isinstance(formatted_response, dict) and formatted_response.get("formatted_content"):
                 state["bot_message"] = formatted_response["formatted_content"]
-                print(" [5단계] 오류 시 bot_message 설정 완료")
+                self.logger.debug("[5단계] 오류 시 bot_message 설정 완료")
             else:
                 # 완전 폴백: 오류 메시지
                 state["bot_message"] = f"죄송합니다. 다이어그램 생성 중 오류가 발생했지만 응답은 준비되었습니다."
-                print("  [5단계] 오류 시 bot_message 완전 폴백 설정")
+                self.logger.debug("[5단계] 오류 시 bot_message 완전 폴백 설정")
             
-            print(" [다이어그램 생성] 오류로 인해 다이어그램 없는 응답 사용")
+            self.logger.debug("[다이어그램 생성] 오류로 인해 다이어그램 없는 응답 사용")
             
             return state
     
@@ -287,6 +252,10 @@ class DiagramGenerationNode:
         - 생성된 다이어그램을 마크다운 응답에 자동 통합
         - FE에게 전달할 완성된 최종 응답 생성
         
+        **주의:** 전달받은 formatted_response 딕셔너리를 복사 없이 그대로 갱신합니다.
+        4단계에서 같은 딕셔너리를 formatted_response와 final_response 양쪽에 저장하므로,
+        통합 후에는 state["formatted_response"]에도 다이어그램이 포함됩니다.
+        
         Args:
             formatted_response: 포맷터에서 생성된 응답
             mermaid_diagram: 생성된 Mermaid 다이어그램 코드
@@ -296,65 +265,59 @@ class DiagramGenerationNode:
             Dict[str, Any]: 다이어그램이 통합된 FE용 최종 응답
         """
         
+        # 복사 없이 원본 응답을 그대로 갱신 (변경되는 세 필드만 보관해 두었다가 실패 시 복원)
+        final_response = formatted_response if formatted_response else {}
+        previous_fields = (
+            final_response.get("formatted_content"),
+            final_response.get("has_diagram"),
+            final_response.get("diagram_type"),
+        )
+        
         try:
-            # 응답 복사
-            final_response = formatted_response.copy() if formatted_response else {}
-            
             # 다이어그램이 생성되지 않았으면 원본 응답 반환
             if not diagram_generated or not mermaid_diagram or not mermaid_diagram.strip():
-                print("다이어그램 없음 → 원본 응답 사용")
+                self.logger.debug("다이어그램 없음 → 원본 응답 사용")
                 return final_response
             
             # 포맷된 콘텐츠 추출
             formatted_content = final_response.get("formatted_content", "")
             if not formatted_content:
-                print("포맷된 콘텐츠가 없어 다이어그램 통합 불가")
+                self.logger.debug("포맷된 콘텐츠가 없어 다이어그램 통합 불가")
                 return final_response
             
             # 다이어그램 섹션 생성
-            diagram_section = f"""
-
----
-
-```mermaid
-{mermaid_diagram.strip()}
-```
-
-*위 다이어그램은 설명 내용을 구조적으로 시각화한 것입니다.*
-
----
-"""
-            
-            # 마무리 부분(G.Navi 멘트 등) 찾아서 그 앞에 다이어그램 삽입
-            lines = formatted_content.split('\n')
-            insert_index = len(lines)
-            
-            # 역순으로 검색하여 마무리 부분 찾기
-            for i in range(len(lines) - 1, -1, -1):
-                line = lines[i].strip()
-                if (line.startswith('*G.Navi') or line.startswith('---') or 
-                    '응원합니다' in line or '궁금한' in line):
-                    insert_index = i
-                    break
-            
-            # 다이어그램 삽입
-            if insert_index < len(lines):
-                lines.insert(insert_index, diagram_section)
+            diagram_section = _DIAGRAM_SECTION_TEMPLATE.format(mermaid_diagram.strip())
+            
+            # 마무리 부분(G.Navi 멘트 등) 중 마지막 것을 찾아 그 줄 앞에 다이어그램 삽입
+            # 줄 단위 분할/재결합 없이 원본 문자열에서 한 번에 검색
+            last_match = None
+            for last_match in _CLOSING_PATTERN.finditer(formatted_content):
+                pass
+            
+            # 다이어그램 삽입 (마무리 부분이 없으면 맨 끝에 추가)
+            if last_match is not None:
+                line_start = formatted_content.rfind('\n', 0, last_match.start()) + 1
+                integrated = f"{formatted_content[:line_start]}{diagram_section}\n{formatted_content[line_start:]}"
             else:
-                lines.append(diagram_section)
+                integrated = f"{formatted_content}\n{diagram_section}"
             
             # 통합된 콘텐츠 저장
-            final_response["formatted_content"] = '\n'.join(lines)
+            final_response["formatted_content"] = integrated
             final_response["has_diagram"] = True
             final_response["diagram_type"] = "mermaid"
             
-            print(f"FE용 최종 응답에 다이어그램 통합 완료 ({len(mermaid_diagram)}자)")
+            self.logger.debug("FE용 최종 응답에 다이어그램 통합 완료 (%s자)", len(mermaid_diagram))
             self.logger.info("Mermaid 다이어그램이 FE용 최종 응답에 통합됨")
             
             return final_response
             
         except Exception as e:
             self.logger.warning(f"다이어그램 통합 실패: {e}")
-            print(f"다이어그램 통합 실패: {e}")
-            # 실패 시 원본 응답 반환
-            return formatted_response if formatted_response else {}
\ No newline at end of file
+            self.logger.debug("다이어그램 통합 실패: %s", e)
+            # 실패 시 변경한 필드를 되돌려 원본 응답 반환
+            for key, value in zip(("formatted_content", "has_diagram", "diagram_type"), previous_fields):
+                if value is None:
+                    final_response.pop(key, None)
+                else:
+                    final_response[key] = value
+            return final_response
\ No newline at end of file
@@ -1,7 +1,35 @@
+import asyncio
+import copy
 import logging
+import time
 from datetime import datetime
+from typing import Dict, List, Tuple
+
+from cachetools import TTLCache
 from app.graphs.state import ChatState
-from app.graphs.agents.analyzer import IntentAnalysisAgent
+from app.graphs.agents.analyzer import get_intent_analysis_agent
+from app.utils.timing import record_step_time
+
+# CL 레벨 → 연차 매핑 (import 시 한 번만 생성)
+_LEVEL_MAPPING = {
+    "CL1": "1~3년",
+    "CL2": "4~6년",
+    "CL3": "7~9년",
+    "CL4": "10~12년",
+    "CL5": "13년 이상"
+}
+
+# 같은 대화방에서 같은 질문을 다시 보낸 경우(재시도, 중복 전송) LLM 호출을 생략하기 위한 의도 분석 결과 캐시
+_INTENT_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=300)
+# 진행 중인 의도 분석 (동시에 들어온 중복 요청은 같은 LLM 호출 결과를 공유)
+_INTENT_IN_FLIGHT: Dict[Tuple[str, str, str], asyncio.Task] = {}
+
+
+def _on_intent_analysis_done(cache_key, task: asyncio.Task) -> None:
+    """의도 분석 완료 처리 - 진행 중 목록에서 제거하고 성공한 결과만 캐시"""
+    _INTENT_IN_FLIGHT.pop(cache_key, None)
+    if not task.cancelled() and task.exception() is None:
+        _INTENT_CACHE[cache_key] = task.result()
 
 
 class IntentAnalysisNode:
@@ -14,30 +42,60 @@ class IntentAnalysisNode:
 
     def __init__(self, graph_builder_instance):
         self.graph_builder = graph_builder_instance
-        self.intent_analysis_agent = IntentAnalysisAgent()
+        self.intent_analysis_agent = get_intent_analysis_agent()  # 요청 간 상태가 없으므로 공유 인스턴스 사용
         self.logger = logging.getLogger(__name__)
 
     def _map_level_to_experience(self, level: str) -> str:
         """
         CL 레벨을 연차 정보로 매핑한다.
         """
-        level_mapping = {
-            "CL1": "1~3년",
-            "CL2": "4~6년",
-            "CL3": "7~9년",
-            "CL4": "10~12년",
-            "CL5": "13년 이상"
-        }
-        if level and level.upper() in level_mapping:
-            return level_mapping[level.upper()]
-        return "정보 없음"
+        return _LEVEL_MAPPING.get(level.upper(), "정보 없음") if level else "정보 없음"
+
+    def _intent_cache_key(self, session_id: str, user_question: str, chat_history: List[Dict]) -> Tuple[str, str, str]:
+        """
+        의도 분석 캐시 키 - (대화방, 질문, 대화 요약)
+        
+        1단계에서 추가된 현재 질문과, 같은 질문을 다시 보낸 경우 남아 있는 직전 시도의
+        (user, assistant) 쌍은 요약에서 제외하여 재전송 요청이 첫 요청과 같은 키를 갖도록 한다.
+        """
+        question = user_question.strip()
+        end = len(chat_history)
+        while end > 0:
+            last = chat_history[end - 1]
+            if last.get("role") == "user" and last.get("content", "").strip() == question:
+                end -= 1  # 현재 질문 또는 응답 없이 끝난 직전 시도
+            elif (end >= 2 and last.get("role") == "assistant"
+                  and chat_history[end - 2].get("role") == "user"
+                  and chat_history[end - 2].get("content", "").strip() == question):
+                end -= 2  # 같은 질문에 대한 직전 시도의 질문/응답 쌍
+            else:
+                break
+        chat_summary = self.intent_analysis_agent._summarize_chat_history(chat_history[:end])
+        return session_id, question, chat_summary
 
-    def analyze_intent_node(self, state: ChatState) -> ChatState:
+    def _start_intent_analysis(self, cache_key, user_question: str, user_data, chat_history) -> asyncio.Task:
+        """의도 분석 LLM 호출 시작 - 같은 키의 분석이 진행 중이면 그 작업을 그대로 반환"""
+        task = _INTENT_IN_FLIGHT.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self.intent_analysis_agent.aanalyze_intent_and_context(  # 의도 분석 에이전트 호출
+                user_question=user_question,
+                user_data=user_data,
+                chat_history=chat_history
+            ))
+            _INTENT_IN_FLIGHT[cache_key] = task
+            task.add_done_callback(lambda done: _on_intent_analysis_done(cache_key, done))
+        else:
+            self.logger.debug("[2단계] 진행 중인 동일 의도 분석 결과 공유")
+        return task
+
+    async def analyze_intent_node(self, state: ChatState) -> ChatState:
         """
          2단계: 사용자 의도 분석 및 상황 이해
         
         사용자 질문과 대화 맥락을 분석하여 의도를 파악하고,
         다음 단계의 데이터 검색에 필요한 키워드를 추출합니다.
+        의도 분석 LLM 호출과 서로 독립적인 과거 대화 VectorDB 검색을
+        asyncio.gather로 동시에 실행하고, 결과는 키 단위로 상태에 병합합니다.
         
         Args:
             state: 현재 워크플로우 상태
@@ -45,16 +103,14 @@ class IntentAnalysisNode:
         Returns:
             ChatState: 의도 분석 결과가 포함된 상태
         """
-        import time
-        start_time = time.perf_counter()
+        # 메시지 검증 실패 시 처리 건너뛰기 (시간 측정 전에 바로 반환)
+        if state.get("workflow_status") == "validation_failed":  # 검증 실패 상태 확인
+            self.logger.debug("[2단계] 메시지 검증 실패로 처리 건너뛰기")
+            return state
+        
+        start_time = time.perf_counter_ns()
         
         try:  # 의도 분석 처리 시작
-            # 메시지 검증 실패 시 처리 건너뛰기
-            if state.get("workflow_status") == "validation_failed":  # 검증 실패 상태 확인
-                print(f"[2단계] 메시지 검증 실패로 처리 건너뛰기")
-                return state
-                
-            print(f"[2단계] 의도 분석 및 상황 이해 시작...")
             self.logger.info("=== 2단계: 의도 분석 및 상황 이해 ===")
             
             # 세션 정보에서 사용자 데이터 가져오기
@@ -65,56 +121,60 @@ class IntentAnalysisNode:
                 if level and 'experience' not in user_data:
                     user_data['experience'] = self._map_level_to_experience(level)
             
-            intent_analysis = self.intent_analysis_agent.analyze_intent_and_context(  # 의도 분석 에이전트 호출
-                user_question=state.get("user_question", ""),
-                user_data=user_data,
-                chat_history=state.get("current_session_messages", [])
-            )
+            user_question = state.get("user_question", "")
+            chat_history = state.get("current_session_messages", [])
+            
+            # 같은 대화방에서 같은 질문의 재요청(재시도, 중복 전송)이면 캐시된 분석 결과 사용
+            cache_key = self._intent_cache_key(state.get("session_id", ""), user_question, chat_history)
+            cached_intent = _INTENT_CACHE.get(cache_key)
+            
+            # 의도 분석(LLM)과 과거 대화 검색(VectorDB)은 서로의 결과에 의존하지 않으므로 동시 실행
+            tasks = {
+                "past_conversations": asyncio.to_thread(
+                    self.graph_builder.data_retrieval_node._search_past_conversations, state
+                ),
+            }
+            if cached_intent is None:
+                # shield: 이 요청이 취소되어도 같은 분석을 기다리는 다른 요청에는 영향 없음
+                tasks["intent_analysis"] = asyncio.shield(
+                    self._start_intent_analysis(cache_key, user_question, user_data, chat_history)
+                )
+            results = dict(zip(tasks.keys(), await asyncio.gather(*tasks.values(), return_exceptions=True)))
+            
+            # 과거 대화 검색 실패 시 3단계에서 다시 검색하도록 None 유지
+            past_conversations = results["past_conversations"]
+            state["past_conversations"] = None if isinstance(past_conversations, BaseException) else past_conversations
+            
+            if cached_intent is not None:
+                self.logger.debug("[2단계] 의도 분석 캐시 적중 - LLM 호출 생략")
+                intent_analysis = copy.deepcopy(cached_intent)
+                state["processing_log"].append("의도 분석 캐시 적중")
+            else:
+                intent_analysis = results["intent_analysis"]
+                if isinstance(intent_analysis, BaseException):
+                    raise intent_analysis
+                # 캐시/동시 요청과 공유되는 결과이므로 상태에는 복사본 저장
+                intent_analysis = copy.deepcopy(intent_analysis)
             
             state["intent_analysis"] = intent_analysis
             state["processing_log"].append("의도 분석 및 상황 이해 완료")
             
             # 처리 시간 계산 및 로그
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:  # 마이크로초 단위인 경우
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:  # 밀리초 단위인 경우
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:  # 초 단위인 경우
-                time_display = f"{step_time:.3f}초"
-            
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"2단계 처리 시간: {time_display}")
-            state["processing_log"] = processing_log
+            time_display = record_step_time(state, start_time, "2단계 처리 시간")
             
             # 분석 결과 요약
             intent_type = intent_analysis.get("intent", "일반 상담")  # 의도 타입 추출
             career_keywords = intent_analysis.get("career_history", [])  # 커리어 키워드 추출
             
-            print(f"[2단계] 의도 분석 및 상황 이해 완료")
-            print(f"분석된 의도: {intent_type}")
-            print(f"키워드 추출: {len(career_keywords)}개")
-            print(f"[2단계] 처리 시간: {time_display}")
-            
-            self.logger.info("의도 분석 및 상황 이해 완료")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "2단계 의도 분석 및 상황 이해 완료 | intent=%s keywords=%d time=%s",
+                    intent_type, len(career_keywords), time_display
+                )
             
         except Exception as e:  # 예외 처리
             # 오류 발생 시에도 처리 시간 기록
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:  # 마이크로초 단위인 경우
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:  # 밀리초 단위인 경우
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:  # 초 단위인 경우
-                time_display = f"{step_time:.3f}초"
-                
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"2단계 처리 시간 (오류): {time_display}")
-            state["processing_log"] = processing_log
+            time_display = record_step_time(state, start_time, "2단계 처리 시간 (오류)")
             
             error_msg = f"의도 분석 실패: {e}"
             self.logger.error(error_msg)
@@ -123,7 +183,5 @@ class IntentAnalysisNode:
                 "error": str(e),
                 "career_history": []
             }
-            
-            print(f"[2단계] 의도 분석 오류: {time_display} (오류: {e})")
         
         return state
\ No newline at end of file
@@ -8,9 +8,55 @@
 """
 # 0️⃣ 메시지 검증 및 상태 초기화 노드
 
+import re
 import time
 import logging
+from collections import Counter
 from app.graphs.state import ChatState
+from app.utils.timing import format_elapsed, record_step_time
+
+# 욕설/부적절한 표현 목록 (import 시 한 번만 생성)
+_INAPPROPRIATE_WORDS: tuple = (
+    # 일반 욕설
+    "ㅅㅂ", "ㅂㅅ", "ㅁㅊ", "시발", "씨발", "병신", "개새끼", "새끼", 
+    "미친", "미쳤", "또라이", "놈", "창년", "걸레", "쓰레기",
+    "개자식", "개놈", "개년", "개뚱", "바카", "멍청이", "등신",
+    "바보", "똥", "개똥", "fuck", "shit", "damn", "bitch",
+
+    # 성적 표현
+    "섹스", "sex", "야동", "porn", "딜도", "자위", "오나니",
+    "발정", "변태", "색녀", "색남", "엣치", "야해", "음란",
+
+    # 차별적 표현
+    "장애인", "정신병자", "장애자", "벙어리", "반신불수", "절름발이",
+    "애미", "애비", "지랄", "꺼져", "죽어", "뒤져", "망해",
+
+    # 자음 조합 욕설
+    "ㅄ", "ㅅㄲ", "ㅆㅂ", "ㅈㄹ", "ㅗㅜㅑ", "ㅁㅊ", "ㅂㅅ"
+)
+
+# 금칙어 목록을 하나의 정규식으로 미리 컴파일 (메시지당 단일 패스 스캔, 대소문자 무시)
+_INAPPROPRIATE_PATTERN = re.compile(
+    "|".join(re.escape(word) for word in _INAPPROPRIATE_WORDS), re.IGNORECASE
+)
+
+# 같은 문자 5회 이상 연속 반복 (줄바꿈 포함)
+_REPEATED_CHAR_PATTERN = re.compile(r"(.)\1{4}", re.DOTALL)
+
+# message_check_node가 채우는 상태 필드 기본값
+_STATE_DEFAULTS = {
+    "intent_analysis": {},
+    "career_cases": [],
+    "education_courses": {},
+    "formatted_response": {},
+    "mermaid_diagram": "",
+    "diagram_generated": False,
+    "final_response": {},
+    "user_data": {},
+    "processing_log": [],
+    "error_messages": [],
+    "total_processing_time": 0.0,
+}
 
 
 class MessageCheckNode:
@@ -28,10 +74,10 @@ class MessageCheckNode:
 
     def create_node(self):
         """메시지 검증 및 상태 초기화 노드 생성"""
-        async def message_check_node(state: ChatState) -> ChatState:
-            start_time = time.perf_counter()
+        def message_check_node(state: ChatState) -> ChatState:
+            start_time = time.perf_counter_ns()
             
-            print("\n [0단계] 메시지 검증 및 상태 초기화 시작...")
+            self.logger.debug("[0단계] 메시지 검증 및 상태 초기화 시작...")
             
             # 1. 메시지 검증
             user_question = state.get("user_question", "")
@@ -39,18 +85,9 @@ class MessageCheckNode:
             
             if not validation_result["is_valid"]:
                 # 처리 시간 기록 (오류 시에도)
-                end_time = time.perf_counter()
-                step_time = end_time - start_time
-                
-                if step_time < 0.001:
-                    time_display = f"{step_time * 1000000:.0f}μs"
-                elif step_time < 0.01:
-                    time_display = f"{step_time * 1000:.1f}ms"
-                else:
-                    time_display = f"{step_time:.3f}초"
+                time_display = format_elapsed(start_time)
                 
-                print(f"[0단계] 메시지 검증 실패: {validation_result['error']}")
-                print(f"[0단계] 처리 시간: {time_display}")
+                self.logger.debug("[0단계] 메시지 검증 실패: %s (처리 시간: %s)", validation_result['error'], time_display)
                 
                 # 최소한의 상태 초기화 (오류 응답용)
                 state.setdefault("processing_log", [])
@@ -76,39 +113,21 @@ class MessageCheckNode:
                 
                 return state
             
-            print(f"[0단계] 메시지 검증 성공: {len(user_question)}자")
+            self.logger.debug("[0단계] 메시지 검증 성공: %d자", len(user_question))
             
             # 상태 초기화 (MemorySaver 복원 데이터 보존 - current_session_messages 제외)
             # Note: current_session_messages는 MemorySaver에서 복원되므로 초기화하지 않음
-            state.setdefault("intent_analysis", {})
-            state.setdefault("career_cases", [])
-            state.setdefault("education_courses", {})
-            state.setdefault("formatted_response", {})
-            state.setdefault("mermaid_diagram", "")
-            state.setdefault("diagram_generated", False)
-            state.setdefault("final_response", {})
-            state.setdefault("user_data", {})
-            state.setdefault("processing_log", [])
-            state.setdefault("error_messages", [])
-            state.setdefault("total_processing_time", 0.0)
+            # 누락된 필드만 한 번에 채움 (list/dict 기본값은 상태 간 공유되지 않도록 복사)
+            missing = _STATE_DEFAULTS.keys() - state.keys()
+            state.update({
+                key: _STATE_DEFAULTS[key].copy() if isinstance(_STATE_DEFAULTS[key], (list, dict)) else _STATE_DEFAULTS[key]
+                for key in missing
+            })
             
             # 처리 시간 계산
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            
-            if step_time < 0.001:
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:
-                time_display = f"{step_time:.3f}초"
-            
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"0단계 처리 시간: {time_display}")
-            state["processing_log"] = processing_log
+            time_display = record_step_time(state, start_time, "0단계 처리 시간")
             
-            print(f"상태 초기화 완료: {len(state.keys())}개 필드")
-            print(f"[0단계] 처리 시간: {time_display}")
+            self.logger.debug("상태 초기화 완료: %d개 필드 (처리 시간: %s)", len(state), time_display)
             
             return state
         
@@ -146,49 +165,27 @@ class MessageCheckNode:
             }
         
         # 5. 욕설/부적절한 내용 검증
-        inappropriate_words = [
-            # 일반 욕설
-            "ㅅㅂ", "ㅂㅅ", "ㅁㅊ", "시발", "씨발", "병신", "개새끼", "새끼", 
-            "미친", "미쳤", "또라이", "놈", "창년", "걸레", "쓰레기",
-            "개자식", "개놈", "개년", "개뚱", "바카", "멍청이", "등신",
-            "바보", "똥", "개똥", "fuck", "shit", "damn", "bitch",
-            
-            # 성적 표현
-            "섹스", "sex", "야동", "porn", "딜도", "자위", "오나니",
-            "발정", "변태", "색녀", "색남", "엣치", "야해", "음란",
-            
-            # 차별적 표현
-            "장애인", "정신병자", "장애자", "벙어리", "반신불수", "절름발이",
-            "애미", "애비", "지랄", "꺼져", "죽어", "뒤져", "망해",
-            
-            # 자음 조합 욕설
-            "ㅄ", "ㅅㄲ", "ㅆㅂ", "ㅈㄹ", "ㅗㅜㅑ", "ㅁㅊ", "ㅂㅅ"
-        ]
-        
-        # 대소문자 구분 없이 검사
-        message_lower = user_question.lower()
-        for word in inappropriate_words:
-            if word in message_lower:
-                return {
-                    "is_valid": False,
-                    "error": "부적절한 내용이 포함되어 있습니다. 정중한 언어로 질문해주세요."
-                }
+        # 대소문자 구분 없이 검사 (IGNORECASE 정규식이므로 lower() 복사본 불필요)
+        if _INAPPROPRIATE_PATTERN.search(user_question):
+            return {
+                "is_valid": False,
+                "error": "부적절한 내용이 포함되어 있습니다. 정중한 언어로 질문해주세요."
+            }
         
         return {"is_valid": True, "error": None}
     
     def _is_spam_message(self, message: str) -> bool:
         """스팸 메시지 여부 확인"""
         
-        # 같은 문자가 연속으로 5번 이상 반복
-        for i in range(len(message) - 4):
-            if len(set(message[i:i+5])) == 1:
-                return True
+        # 같은 문자가 연속으로 5번 이상 반복 (정규식 엔진에서 한 번에 스캔)
+        if _REPEATED_CHAR_PATTERN.search(message):
+            return True
         
-        # 같은 단어가 3번 이상 반복
+        # 같은 단어가 3번 이상 반복 (Counter로 한 번에 집계)
         words = message.split()
         if len(words) >= 3:
-            for word in set(words):
-                if words.count(word) >= 3 and len(word) > 1:
-                    return True
+            counts = Counter(word for word in words if len(word) > 1)
+            if counts and max(counts.values()) >= 3:
+                return True
         
         return False
\ No newline at end of file
@@ -1,12 +1,81 @@
 # app/graphs/nodes/openai_response_node.py
 
-import os
-from typing import List, Dict, Any
+import asyncio
+import hashlib
+import io
+import logging
+import re
+import httpx
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+from langchain_core.runnables import RunnableConfig
+from app.config.openai_config import OPENAI_CONFIG
 from app.graphs.state import ChatState
 
-async def process(state: ChatState) -> ChatState:
-    """OpenAI를 활용한 응답 생성 노드 - 의존성 주입 방식"""
-    print("OpenAI Response Node (의존성 주입): 응답 생성 시작")
+logger = logging.getLogger(__name__)
+
+# 모든 요청에서 바이트 단위로 동일한 시스템 프롬프트 앞부분 (OpenAI 프롬프트 캐시 적중용)
+# 사용자별/턴별로 바뀌는 내용(_build_profile_prompt + _history_suffix)은 별도 system 메시지로 뒤에 붙인다.
+_STATIC_SYSTEM_PREFIX = """당신은 SK AX 사내 커리어패스 전문 상담사 "G.Navi"입니다.
+
+응답 가이드라인:
+1. 친근하고 전문적인 톤 유지
+2. 커리어패스, 기술 성장, 프로젝트 경험과 관련된 구체적인 조언 제공
+3. 한국어로 응답
+4. **이전 대화 내용을 적극적으로 참고하여 연속성 있는 상담 진행**
+5. 사용자가 이전 질문이나 대화를 언급할 때는 구체적으로 대답해주세요
+6. 필요시 구체적인 질문으로 더 깊이 있는 상담 유도
+7. 사용자의 현재 상황과 목표를 고려한 개인화된 조언
+8. 응답은 2-4문장으로 간결하되 유용한 내용 포함"""
+
+# 동시 Chat Completions 호출 수 (공유 클라이언트의 keep-alive 커넥션 수와 동일)
+_MAX_CONCURRENT_COMPLETIONS = 32
+_completion_slots = asyncio.Semaphore(_MAX_CONCURRENT_COMPLETIONS)
+
+# 스트리밍 호출 타임아웃 - 청크 간 대기 30초, 연결 5초
+_STREAM_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# 이전 대화 요청 키워드 - 하나의 정규식으로 미리 컴파일 (메시지당 단일 패스 스캔)
+_HISTORY_KEYWORDS = (
+    "이전", "전에", "앞서", "과거", "예전",
+    "질문했던", "말했던", "얘기했던", "상담했던",
+    "대화", "히스토리", "내역", "기록",
+    "무엇을", "뭘", "어떤", "언제"
+)
+_HISTORY_KEYWORD_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in _HISTORY_KEYWORDS), re.IGNORECASE
+)
+
+# 서비스 컨테이너 / 히스토리 매니저 (최초 사용 시 한 번만 조회 - 순환 import 방지를 위해 지연 로딩)
+_container = None
+_history_manager = None
+
+
+def _get_container():
+    """ServiceContainer 싱글톤을 모듈 수준에 캐시"""
+    global _container
+    if _container is None:
+        from app.core.dependencies import get_service_container
+        _container = get_service_container()
+    return _container
+
+
+def _get_history_manager():
+    """ConversationHistoryManager 싱글톤을 모듈 수준에 캐시"""
+    global _history_manager
+    if _history_manager is None:
+        _history_manager = _get_container().history_manager
+    return _history_manager
+
+
+async def process(state: ChatState, config: Optional[RunnableConfig] = None) -> ChatState:
+    """
+    OpenAI를 활용한 응답 생성 노드 - 의존성 주입 방식
+    
+    스트리밍 소비자는 config["configurable"]["stream_queue"]로 asyncio.Queue를 전달합니다.
+    (큐는 런타임 객체이므로 MemorySaver가 체크포인트하는 state에는 넣지 않음)
+    """
+    logger.debug("OpenAI Response Node (의존성 주입): 응답 생성 시작")
     
     message_text = state.get("message_text", "")
     user_info = state.get("user_info", {})
@@ -14,160 +83,225 @@ async def process(state: ChatState) -> ChatState:
     member_id = state.get("member_id", "")
     conversation_id = state.get("conversation_id", "")
     
+    # 스트리밍 소비자가 있으면 응답 조각을 전달할 큐 (None이 스트림 종료 신호)
+    stream_queue = ((config or {}).get("configurable") or {}).get("stream_queue")
+    stream_closed = False
+    
     # OpenAI API 키 확인
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = OPENAI_CONFIG.api_key
     
     if not api_key:
-        print("OpenAI API 키가 없습니다. 기본 응답을 사용합니다.")
+        logger.warning("OpenAI API 키가 없습니다. 기본 응답을 사용합니다.")
         bot_message = f"안녕하세요 {user_name}님! OpenAI API 키가 설정되지 않아 기본 응답을 드립니다: '{message_text}'"
         state["bot_message"] = bot_message
+        if stream_queue is not None:
+            stream_queue.put_nowait(bot_message)
+            stream_queue.put_nowait(None)
         return state
     
     try:
-        from openai import AsyncOpenAI
+        # 공유 OpenAI 클라이언트(ServiceContainer 싱글톤) 및 캐시된 설정 사용
+        client = _get_container().openai_client
+        model = OPENAI_CONFIG.model
+        max_tokens = OPENAI_CONFIG.max_tokens
+        temperature = OPENAI_CONFIG.temperature
         
-        # OpenAI 클라이언트 초기화
-        client = AsyncOpenAI(api_key=api_key)
-        model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
-        max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", "1000"))
-        temperature = float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
+        logger.debug("OpenAI API 호출 중... (모델: %s)", model)
         
-        print(f"OpenAI API 호출 중... (모델: {model})")
+        # 의존성 주입을 통한 대화 히스토리 매니저 얻기 (모듈 수준에서 한 번만 조회)
+        container = _get_container()
+        history_manager = _get_history_manager()
         
-        # 의존성 주입을 통한 대화 히스토리 매니저 얻기
-        from app.core.dependencies import get_service_container
-        container = get_service_container()
-        history_manager = container.history_manager
-        
-        conversation_history = history_manager.get_history(conversation_id)
+        # 최근 턴 수와 토큰 예산 안의 히스토리만 전송 (오래된 메시지부터 제외)
+        conversation_history = history_manager.get_history_within_budget(
+            conversation_id, OPENAI_CONFIG.history_token_budget, OPENAI_CONFIG.history_max_turns
+        )
         
-        print(f"대화 히스토리: {len(conversation_history)}개 이전 메시지")
-        if conversation_history:
-            print(f"히스토리 미리보기:")
+        logger.debug("대화 히스토리: %d개 이전 메시지", len(conversation_history))
+        if conversation_history and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("히스토리 미리보기:")
             for i, msg in enumerate(conversation_history[-3:], 1):  # 최근 3개만 미리보기
                 role = msg.get("role", "unknown")
                 content = msg.get("content", "")[:50]
-                print(f"  {i}. [{role}] {content}...")
+                logger.debug("  %d. [%s] %s...", i, role, content)
         
         # 이전 대화 요약 요청인지 확인
         is_history_request = _is_asking_for_history(message_text)
         
-        # 시스템 프롬프트 구성 (대화 히스토리 정보 포함)
-        system_prompt = _build_system_prompt(user_name, member_id, user_info, len(conversation_history), is_history_request)
+        # 시스템 프롬프트 구성 - 대화 내내 같은 사용자 정보 부분(캐시) + 턴마다 바뀌는 히스토리 안내
+        profile_prompt = _build_profile_prompt(user_name, member_id, *_project_profile(user_info))
+        system_prompt = profile_prompt + _history_suffix(len(conversation_history), is_history_request)
+        
+        # 시맨틱 캐시 조회 - 같은 대화방의 의미상 동일한 질문은 이전 응답 재사용
+        # (이전 대화 요약 요청은 히스토리에 따라 답이 달라지므로 캐시하지 않음)
+        # 캐시 지문: 사용자 정보 프롬프트 해시 - 사용자/프로젝트 정보가 바뀌면 재사용하지 않음
+        response_cache = container.response_cache
+        cache_fingerprint = _prompt_fingerprint(profile_prompt)
+        question_embedding = None
+        if not is_history_request:
+            try:
+                question_embedding = await container.embedding_service.embed(client, message_text)
+                cached_message = response_cache.lookup(conversation_id, question_embedding, cache_fingerprint)
+            except Exception as e:
+                logger.warning("시맨틱 캐시 조회 실패 (무시하고 진행): %s", e)
+                cached_message = None
+            
+            if cached_message is not None:
+                logger.debug("시맨틱 캐시 적중: OpenAI 응답 생성 생략")
+                history_manager.add_messages_bulk(conversation_id, [
+                    ("user", message_text, {"member_id": member_id, "user_name": user_name}),
+                    ("assistant", cached_message, {"model": model, "cached": True})
+                ])
+                state["bot_message"] = cached_message
+                if stream_queue is not None:
+                    stream_queue.put_nowait(cached_message)
+                    stream_queue.put_nowait(None)
+                logger.debug("OpenAI Response Node 완료")
+                return state
         
         # 메시지 구성 (시스템 + 대화 히스토리 + 현재 메시지)
         messages = _build_messages_for_openai(system_prompt, conversation_history, message_text)
         
-        print(f"대화 히스토리: {len(conversation_history)}개 이전 메시지")
-        print(f"OpenAI 전송 메시지 수: {len(messages)}")
+        logger.debug("OpenAI 전송 메시지 수: %d", len(messages))
         
-        # OpenAI API 호출
-        response = await client.chat.completions.create(
-            model=model,
-            messages=messages,
-            max_tokens=max_tokens,
-            temperature=temperature
-        )
+        # OpenAI API 스트리밍 호출 - 토큰이 도착하는 대로 stream_queue(있는 경우)로 전달
+        # 동시 호출 수를 커넥션 풀 크기로 제한 - 초과 요청은 새 연결을 만들지 않고 대기
+        # 짧은 타임아웃은 스트리밍 호출에만 요청 단위로 적용 (공유 클라이언트는 SDK 기본값 유지 - 긴 비스트리밍 호출 보호)
+        async with _completion_slots:
+            stream = await client.with_options(timeout=_STREAM_TIMEOUT).chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+        
+            buffer = io.StringIO()
+            usage = None
+            try:
+                async for chunk in stream:
+                    if chunk.usage is not None:  # 마지막 청크에만 토큰 사용량 포함
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        buffer.write(delta)
+                        if stream_queue is not None:
+                            stream_queue.put_nowait(delta)
+            finally:
+                if stream_queue is not None:
+                    stream_queue.put_nowait(None)  # 스트림 종료 신호
+                stream_closed = True
+        
+        # 누적된 응답 확정
+        bot_message = buffer.getvalue().strip()
+        total_tokens = usage.total_tokens if usage is not None else None
         
-        # 응답 추출
-        bot_message = response.choices[0].message.content.strip()
+        logger.debug("OpenAI 응답 생성 완료: %.100s...", bot_message)  # 잘라내기도 로그 출력 시에만 수행
+        if usage is not None:
+            logger.debug(
+                "토큰 사용량 - 입력: %d, 출력: %d, 총: %d",
+                usage.prompt_tokens, usage.completion_tokens, usage.total_tokens
+            )
         
-        print(f"OpenAI 응답 생성 완료: {bot_message[:100]}...")
-        print(f"토큰 사용량 - 입력: {response.usage.prompt_tokens}, 출력: {response.usage.completion_tokens}, 총: {response.usage.total_tokens}")
+        # 시맨틱 캐시에 응답 저장
+        if question_embedding is not None:
+            response_cache.add(conversation_id, question_embedding, bot_message, cache_fingerprint)
         
-        # 대화 히스토리에 현재 대화 저장
-        history_manager.add_message(conversation_id, "user", message_text, {
-            "member_id": member_id,
-            "user_name": user_name
-        })
-        history_manager.add_message(conversation_id, "assistant", bot_message, {
-            "model": model,
-            "tokens_used": response.usage.total_tokens
-        })
+        # 대화 히스토리에 현재 대화 저장 (user-assistant 한 턴을 한 번에 추가)
+        history_manager.add_messages_bulk(conversation_id, [
+            ("user", message_text, {"member_id": member_id, "user_name": user_name}),
+            ("assistant", bot_message, {"model": model, "tokens_used": total_tokens})
+        ])
         
         state["bot_message"] = bot_message
         
     except Exception as e:
-        print(f"OpenAI API 호출 실패: {e}")
-        import traceback
-        print(f"상세 에러: {traceback.format_exc()}")
+        # 스택 트레이스는 DEBUG 레벨에서만 첨부 (포맷팅은 핸들러가 출력할 때만 수행)
+        logger.error("OpenAI API 호출 실패: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         # 폴백 응답
         fallback_message = f"죄송합니다 {user_name}님. 일시적인 오류로 응답 생성에 실패했습니다. '{message_text}'에 대해 다시 말씀해 주시겠어요?"
         state["bot_message"] = fallback_message
+        if stream_queue is not None and not stream_closed:
+            stream_queue.put_nowait(fallback_message)
+            stream_queue.put_nowait(None)
         
         # 실패한 경우에도 사용자 메시지는 히스토리에 저장
-        from app.core.dependencies import get_service_container
-        container = get_service_container()
-        history_manager = container.history_manager
-        
-        history_manager.add_message(conversation_id, "user", message_text, {
-            "member_id": member_id,
-            "user_name": user_name
-        })
-        history_manager.add_message(conversation_id, "assistant", fallback_message, {
-            "error": str(e),
-            "fallback": True
-        })
+        _get_history_manager().add_messages_bulk(conversation_id, [
+            ("user", message_text, {"member_id": member_id, "user_name": user_name}),
+            ("assistant", fallback_message, {"error": str(e), "fallback": True})
+        ])
     
-    print(f"OpenAI Response Node 완료")
+    logger.debug("OpenAI Response Node 완료")
     return state
 
 
-def _build_system_prompt(user_name: str, member_id: str, user_info: Dict[str, Any], history_count: int = 0, is_history_request: bool = False) -> str:
-    """시스템 프롬프트 구성"""
+def _project_profile(user_info: Dict[str, Any]) -> tuple:
+    """
+    프롬프트에 들어가는 프로젝트 정보를 해시 가능한 형태로 추출
     
-    # 사용자 프로젝트 정보 간략히 포함
+    (프로젝트 수, 도메인 튜플, 역할 튜플) - 도메인/역할은 프로젝트 순서대로 중복 없이 담아
+    같은 입력에는 항상 같은 값을 만듭니다.
+    """
+    # 최근 3개 프로젝트를 한 번만 순회하며 도메인/역할을 함께 수집 (dict 키로 순서 유지 + 중복 제거)
     projects = user_info.get("projects", [])
+    domains, roles = {}, {}
+    for project in projects[:3]:
+        domain = project.get("domain")
+        role = project.get("role")
+        if domain:
+            domains[domain] = None
+        if role:
+            roles[role] = None
+    return len(projects), tuple(domains), tuple(roles)
+
+
+@lru_cache(maxsize=1024)
+def _build_profile_prompt(user_name: str, member_id: str, project_count: int, domains: tuple, roles: tuple) -> str:
+    """
+    사용자 정보 시스템 프롬프트 생성 (캐시)
+    
+    고정 페르소나/가이드라인(_STATIC_SYSTEM_PREFIX) 뒤에 붙는 사용자별 부분으로,
+    대화 내내 바뀌지 않으므로 (사용자, 프로젝트 정보) 기준으로 캐시합니다.
+    턴마다 바뀌는 히스토리 안내는 _history_suffix로 분리되어 캐시 키에 포함되지 않습니다.
+    """
+    
+    # 사용자 프로젝트 정보 간략히 포함
     project_summary = ""
-    if projects:
-        project_count = len(projects)
-        domains = list(set([p.get("domain", "") for p in projects[:3] if p.get("domain")]))
-        roles = list(set([p.get("role", "") for p in projects[:3] if p.get("role")]))
-        
+    if project_count:
         project_summary = f"\n- 총 {project_count}개 프로젝트 경험"
         if domains:
             project_summary += f"\n- 주요 도메인: {', '.join(domains)}"
         if roles:
             project_summary += f"\n- 주요 역할: {', '.join(roles)}"
     
-    # 대화 히스토리 정보 추가
-    history_info = ""
-    if history_count > 0:
-        history_info = f"\n\n이전 대화 내역: {history_count}개 메시지가 있습니다. 이전 대화 내용을 참고하여 연속성 있는 상담을 진행해주세요."
-        
-        if is_history_request:
-            history_info += f"\n\n**특별 지시**: 사용자가 이전 대화 내용에 대해 질문하고 있습니다. 이전 대화 내역을 구체적으로 요약하여 제공해주세요."
-    
-    system_prompt = f"""당신은 SK AX 사내 커리어패스 전문 상담사 "G.Navi"입니다.
-
-사용자 정보:
+    return f"""사용자 정보:
 - 이름: {user_name}
-- 회원ID: {member_id}{project_summary}{history_info}
+- 회원ID: {member_id}{project_summary}"""
 
-응답 가이드라인:
-1. 친근하고 전문적인 톤 유지
-2. 커리어패스, 기술 성장, 프로젝트 경험과 관련된 구체적인 조언 제공
-3. 한국어로 응답
-4. **이전 대화 내용을 적극적으로 참고하여 연속성 있는 상담 진행**
-5. 사용자가 이전 질문이나 대화를 언급할 때는 구체적으로 대답해주세요
-6. 필요시 구체적인 질문으로 더 깊이 있는 상담 유도
-7. 사용자의 현재 상황과 목표를 고려한 개인화된 조언
-8. 응답은 2-4문장으로 간결하되 유용한 내용 포함"""
 
-    return system_prompt
+@lru_cache(maxsize=1024)
+def _prompt_fingerprint(profile_prompt: str) -> str:
+    """시맨틱 캐시 지문 - 사용자 정보 프롬프트의 SHA-1 앞 16자리"""
+    return hashlib.sha1(profile_prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def _history_suffix(history_count: int, is_history_request: bool) -> str:
+    """대화 히스토리 안내 문구 (턴마다 달라지는 부분)"""
+    if history_count <= 0:
+        return ""
+    
+    history_info = f"\n\n이전 대화 내역: {history_count}개 메시지가 있습니다. 이전 대화 내용을 참고하여 연속성 있는 상담을 진행해주세요."
+    if is_history_request:
+        history_info += "\n\n**특별 지시**: 사용자가 이전 대화 내용에 대해 질문하고 있습니다. 이전 대화 내역을 구체적으로 요약하여 제공해주세요."
+    return history_info
 
 
 def _is_asking_for_history(message: str) -> bool:
     """사용자가 이전 대화 내역을 요청하는지 확인"""
-    history_keywords = [
-        "이전", "전에", "앞서", "과거", "예전",
-        "질문했던", "말했던", "얘기했던", "상담했던",
-        "대화", "히스토리", "내역", "기록",
-        "무엇을", "뭘", "어떤", "언제"
-    ]
-    
-    message_lower = message.lower()
-    return any(keyword in message_lower for keyword in history_keywords)
+    return _HISTORY_KEYWORD_PATTERN.search(message) is not None
 
 
 def _build_messages_for_openai(
@@ -177,20 +311,11 @@ def _build_messages_for_openai(
 ) -> List[Dict[str, str]]:
     """OpenAI API용 메시지 구성"""
     
-    messages = [{"role": "system", "content": system_prompt}]
-    
-    # 이전 대화 히스토리 추가
-    messages.extend(conversation_history)
-    
-    # 현재 사용자 메시지 추가
-    messages.append({"role": "user", "content": current_message})
-    
-    return messages
-
-
-# 하위 호환성을 위한 함수 (DEPRECATED)
-def get_history_manager():
-    """DEPRECATED: app.core.dependencies.get_history_manager 사용"""
-    from app.core.dependencies import get_service_container
-    container = get_service_container()
-    return container.history_manager
\ No newline at end of file
+    # 고정 프리픽스 + 사용자별 시스템 프롬프트 + 이전 대화 히스토리 + 현재 사용자 메시지를
+    # 한 번에 구성 (리스트 재할당 없음). 변하지 않는 내용이 항상 맨 앞에 오도록 순서를 고정한다.
+    return [
+        {"role": "system", "content": _STATIC_SYSTEM_PREFIX},
+        {"role": "system", "content": system_prompt},
+        *conversation_history,
+        {"role": "user", "content": current_message}
+    ]
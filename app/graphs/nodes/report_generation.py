@@ -9,11 +9,13 @@
 
 import logging
 import time
-import os
 from typing import Dict, Any
 
 from app.graphs.state import ChatState
 from app.graphs.agents.report_generator import ReportGeneratorAgent
+from app.utils.timing import format_elapsed, record_step_time
+
+logger = logging.getLogger(__name__)
 
 
 class ReportGenerationNode:
@@ -32,10 +34,9 @@ class ReportGenerationNode:
     """
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
         self.report_generator = ReportGeneratorAgent()
     
-    def generate_report_node(self, state: ChatState) -> ChatState:
+    async def generate_report_node(self, state: ChatState) -> ChatState:
         """
         6단계: 관리자 전용 HTML 보고서 생성
         
@@ -57,44 +58,43 @@ class ReportGenerationNode:
         Returns:
             ChatState: 보고서 생성 결과가 포함된 상태
         """
-        start_time = time.perf_counter()  # 더 정밀한 시간 측정
+        # 메시지 검증 실패 시 처리 건너뛰기 (시간 측정 전에 바로 반환)
+        if state.get("workflow_status") == "validation_failed":
+            logger.debug("[6단계] 메시지 검증 실패로 처리 건너뛰기")
+            return state
+        
+        start_time = time.perf_counter_ns()  # 더 정밀한 시간 측정 (정수 나노초)
         
         try:
-            # 메시지 검증 실패 시 처리 건너뛰기
-            if state.get("workflow_status") == "validation_failed":
-                print(f"[6단계] 메시지 검증 실패로 처리 건너뛰기")
-                return state
-                
-            print(f"\n[6단계] HTML 보고서 생성 시작... (시작시간: {start_time})")
+            logger.debug("[6단계] HTML 보고서 생성 시작... (시작시간: %s)", start_time)
             
             # 기본 정보 추출
             user_question = state.get("user_question", "")
             final_response = state.get("final_response", {})
             user_data = state.get("user_data", {})
             
-            self.logger.info(f"HTML 보고서 생성 검토: {user_question[:50]}...")
+            logger.info("HTML 보고서 생성 검토: %.50s...", user_question)
             
             # 6단계에서 보고서 생성 여부 판단 (관리자 기능)
-            analysis_start = time.perf_counter()
+            analysis_start = time.perf_counter_ns()
             should_generate = self.report_generator.should_generate_report(
                 user_question, user_data
             )
-            analysis_time = time.perf_counter() - analysis_start
-            print(f"[관리자 기능] 보고서 필요성 판단 시간: {analysis_time * 1000:.1f}ms")
+            logger.debug("[관리자 기능] 보고서 필요성 판단 시간: %s", format_elapsed(analysis_start))
             
             if should_generate:
-                print("[관리자 기능] 보고서 생성 필요 → HTML 파일 생성 중...")
+                logger.debug("[관리자 기능] 보고서 생성 필요 → HTML 파일 생성 중...")
                 
                 # HTML 보고서 생성 시간 측정
-                generation_start = time.perf_counter()
-                report_path = self.report_generator.generate_html_report(
+                # 마크다운 변환과 파일 쓰기는 보고서 전용 스레드에서 진행 (파일 기록 완료 후 경로 반환)
+                generation_start = time.perf_counter_ns()
+                report_path = await self.report_generator.generate_html_report(
                     final_response, user_data, state
                 )
-                generation_time = time.perf_counter() - generation_start
-                print(f"[관리자 기능] HTML 보고서 생성 시간: {generation_time * 1000:.1f}ms")
+                logger.debug("[관리자 기능] HTML 보고서 생성 시간: %s", format_elapsed(generation_start))
                 
                 if report_path:
-                    print(f"[관리자 기능] 보고서 생성 완료: {report_path}")
+                    logger.debug("[관리자 기능] 보고서 생성 완료: %s", report_path)
                     
                     # 상태에 보고서 정보 추가
                     state["report_generated"] = True
@@ -102,61 +102,35 @@ class ReportGenerationNode:
                     
                     # FE용 최종 응답은 수정하지 않음 (이미 완성된 상태)
                     # 보고서 정보는 별도 필드로만 제공
-                    print("FE용 최종 응답은 이미 완성됨 → 보고서 정보만 추가")
+                    logger.debug("FE용 최종 응답은 이미 완성됨 → 보고서 정보만 추가")
                 else:
-                    print("[관리자 기능] 보고서 생성 실패")
+                    logger.debug("[관리자 기능] 보고서 생성 실패")
                     state["report_generated"] = False
                     state["report_error"] = "보고서 생성 중 오류가 발생했습니다."
             else:
-                print("[관리자 기능] 보고서 생성 불필요 → 건너뛰기")
+                logger.debug("[관리자 기능] 보고서 생성 불필요 → 건너뛰기")
                 state["report_generated"] = False
                 state["report_skip_reason"] = "사용자 요청에 보고서 생성 의도 없음"
             
             
             # 6단계 처리 시간 계산 및 로그 추가
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            processing_log = state.get("processing_log", [])
-            
-            # 시간 단위 결정 (다른 노드들과 일치)
-            if step_time < 0.001:  # 1ms 미만
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:  # 10ms 미만
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:
-                time_display = f"{step_time:.3f}초"
+            time_display = record_step_time(state, start_time, "6단계 처리 시간")
             
-            processing_log.append(f"6단계 처리 시간: {time_display}")
-            state["processing_log"] = processing_log
-            
-            print(f"[6단계] 관리자용 HTML 보고서 처리 완료: {time_display}")
-            self.logger.info(f"6단계 관리자용 HTML 보고서 완료: {time_display}")
-            print("[관리자 모드] 보고서 생성은 관리자 전용 기능입니다")
+            logger.debug("[6단계] 관리자용 HTML 보고서 처리 완료: %s", time_display)
+            logger.info("6단계 관리자용 HTML 보고서 완료: %s", time_display)
+            logger.debug("[관리자 모드] 보고서 생성은 관리자 전용 기능입니다")
             
             return state
             
         except Exception as e:
-            self.logger.error(f"보고서 생성 노드 오류: {e}")
+            logger.error("보고서 생성 노드 오류: %s", e)
             
             # 오류 발생 시에도 처리 시간 기록 (정밀도 향상)
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            processing_log = state.get("processing_log", [])
+            time_display = record_step_time(state, start_time, "6단계 처리 시간 (오류)")
             
-            # 시간 단위 결정 (다른 노드들과 일치)
-            if step_time < 0.001:  # 1ms 미만
-                time_display = f"{step_time * 1000000:.0f}μs"
-            elif step_time < 0.01:  # 10ms 미만
-                time_display = f"{step_time * 1000:.1f}ms"
-            else:
-                time_display = f"{step_time:.3f}초"
-                
-            processing_log.append(f"6단계 처리 시간 (오류): {time_display}")
-            state["processing_log"] = processing_log
-            
-            print(f"[6단계] 관리자용 HTML 보고서 오류: {time_display} (오류: {e})")
-            print("[관리자 모드] 보고서 오류는 사용자 응답에 영향 없음")
+            logger.debug("[6단계] 관리자용 HTML 보고서 오류: %s (오류: %s)", time_display, e)
+            logger.debug("[관리자 모드] 보고서 오류는 사용자 응답에 영향 없음")
             
             state["report_generated"] = False
             state["report_error"] = str(e)
-            return state
\ No newline at end of file
+            return state
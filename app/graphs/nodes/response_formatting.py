@@ -14,6 +14,9 @@ from typing import Annotated
 
 from app.graphs.state import ChatState
 from app.graphs.agents.formatter import ResponseFormattingAgent
+from app.utils.timing import fmt_ns, record_step_time
+
+logger = logging.getLogger(__name__)
 
 
 class ResponseFormattingNode:
@@ -26,7 +29,6 @@ class ResponseFormattingNode:
     Attributes:
         graph_builder: 그래프 빌더 인스턴스
         response_formatting_agent: 응답 포맷팅 에이전트
-        logger: 로깅 인스턴스
     """
 
     def __init__(self, graph_builder_instance: Any) -> None:
@@ -38,7 +40,6 @@ class ResponseFormattingNode:
         """
         self.graph_builder = graph_builder_instance
         self.response_formatting_agent = ResponseFormattingAgent()
-        self.logger: logging.Logger = logging.getLogger(__name__)
 
     def format_response_node(self, 
                            state: Annotated[ChatState, "현재 워크플로우 상태 (검색 결과 포함)"]
@@ -58,18 +59,18 @@ class ResponseFormattingNode:
         Raises:
             Exception: 응답 포맷팅 중 오류 발생 시
         """
+        # 메시지 검증 실패 시 처리 건너뛰기 (시간 측정 전에 바로 반환)
+        workflow_status: Optional[str] = state.get("workflow_status")
+        if workflow_status == "validation_failed":  # 검증 실패 상태 확인
+            logger.debug("[4단계] 메시지 검증 실패로 처리 건너뛰기")
+            return state
+        
         import time
-        start_time: float = time.perf_counter()
+        start_time: int = time.perf_counter_ns()
         
         try:  # 응답 포맷팅 처리 시작
-            # 메시지 검증 실패 시 처리 건너뛰기
-            workflow_status: Optional[str] = state.get("workflow_status")
-            if workflow_status == "validation_failed":  # 검증 실패 상태 확인
-                print(f"[4단계] 메시지 검증 실패로 처리 건너뛰기")
-                return state
-                
-            print(f"\n[4단계] 적응적 응답 포맷팅 시작...")
-            self.logger.info("=== 4단계: 적응적 응답 포맷팅 ===")
+            logger.debug("[4단계] 적응적 응답 포맷팅 시작...")
+            logger.info("=== 4단계: 적응적 응답 포맷팅 ===")
             
             # 성장 방향 상담인지 확인 (다이어그램은 5단계에서 별도 처리)
             user_question: str = state.get("user_question", "")  # 사용자 질문 조회
@@ -86,89 +87,64 @@ class ResponseFormattingNode:
             state["formatted_response"] = final_response  # 다이어그램 생성에서 사용
             state["final_response"] = final_response
             
-            processing_log: List[str] = state.get("processing_log", [])
+            # 처리 로그는 상태의 리스트에 바로 추가 (노드 안에서 한 번만 조회)
+            processing_log: List[str] = state.setdefault("processing_log", [])
             processing_log.append(f"적응적 응답 포맷팅 완료 (유형: {final_response['format_type']})")
-            state["processing_log"] = processing_log
             
             # AI 응답을 current_session_messages에 추가하여 MemorySaver가 저장하도록 함
-            current_session_messages: List[Dict[str, Any]] = state.get("current_session_messages", [])
-            if not current_session_messages:  # 세션 메시지가 없는 경우
-                current_session_messages = []  # 빈 리스트로 초기화
-                state["current_session_messages"] = current_session_messages
+            # (키가 없거나 None이면 빈 리스트로 초기화 - 기존 리스트는 그대로 이어 붙임)
+            current_session_messages: List[Dict[str, Any]] = state.get("current_session_messages")
+            if current_session_messages is None:
+                current_session_messages = state["current_session_messages"] = []
             
             assistant_message: Dict[str, Any] = {
                 "role": "assistant",
                 "content": final_response.get("formatted_content", ""),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": state.get("request_timestamp") or datetime.now().isoformat(),  # 요청 단위 타임스탬프 재사용
                 "format_type": final_response.get("format_type", "adaptive")
             }
             current_session_messages.append(assistant_message)
-            self.logger.info(f"AI 응답을 current_session_messages에 추가 (총 {len(current_session_messages)}개 메시지)")
-            
-            #  ConversationHistoryManager에도 AI 응답 추가 (세션 종료 시 VectorDB 구축을 위해)
-            try:
-                if hasattr(self.graph_builder, 'conversation_history_manager'):
-                    self.graph_builder.conversation_history_manager.add_ai_response(
-                        session_id=state.get("session_id", ""),
-                        content=final_response.get("formatted_content", ""),
-                        format_type=final_response.get("format_type", "adaptive")
-                    )
-            except Exception as e:
-                self.logger.warning(f"ConversationHistoryManager 응답 추가 실패: {e}")
+            logger.info("AI 응답을 current_session_messages에 추가 (총 %d개 메시지)", len(current_session_messages))
             
             # 4단계 완료 상세 로그 출력
             content_length: int = len(final_response.get("formatted_content", ""))  # 응답 길이 계산
             format_type: str = final_response.get("format_type", "adaptive")  # 포맷 타입 확인
             
             # 처리 시간 계산 및 로그
-            end_time: float = time.perf_counter()
-            step_time: float = end_time - start_time
-            time_display: str = f"{step_time*1000:.0f}ms" if step_time < 1 else f"{step_time:.2f}s"
+            time_display: str = record_step_time(state, start_time, "4단계 처리 시간")
             
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"4단계 처리 시간: {time_display}")
-            state["processing_log"] = processing_log
+            logger.debug("[4단계] 적응적 응답 포맷팅 완료")
+            logger.debug("응답 유형: %s, 길이: %s자", format_type, content_length)
+            logger.debug("[4단계] 처리 시간: %s", time_display)
             
-            print(f"[4단계] 적응적 응답 포맷팅 완료")
-            print(f"응답 유형: {format_type}, 길이: {content_length}자")
-            print(f"[4단계] 처리 시간: {time_display}")
-            
-            self.logger.info("적응적 응답 포맷팅 완료")
+            logger.info("적응적 응답 포맷팅 완료")
             
         except Exception as e:  # 예외 처리
             # 오류 발생 시에도 처리 시간 기록
-            end_time = time.perf_counter()
-            step_time = end_time - start_time
-            time_display = f"{step_time*1000:.0f}ms" if step_time < 1 else f"{step_time:.2f}s"
-                
-            processing_log = state.get("processing_log", [])
-            processing_log.append(f"4단계 처리 시간 (오류): {time_display}")
-            state["processing_log"] = processing_log
+            time_display = record_step_time(state, start_time, "4단계 처리 시간 (오류)")
             
             error_msg: str = f"응답 포맷팅 실패: {e}"
-            self.logger.error(error_msg)
+            logger.error(error_msg)
             
             error_messages: List[str] = state.get("error_messages", [])
             error_messages.append(error_msg)
             state["error_messages"] = error_messages
             state["final_response"] = {"error": str(e)}
             
-            print(f"[4단계] 적응적 응답 포맷팅 오류: {time_display} (오류: {e})")
+            logger.debug("[4단계] 적응적 응답 포맷팅 오류: %s (오류: %s)", time_display, e)
         
         # 총 처리 시간 계산
         try:
             workflow_start_time = state.get("workflow_start_time")
             if workflow_start_time:
                 total_time = time.perf_counter() - workflow_start_time
-                total_time_display = f"{total_time*1000:.0f}ms" if total_time < 1 else f"{total_time:.2f}s"
+                total_time_display = fmt_ns(round(total_time * 1e9))
                 
-                processing_log = state.get("processing_log", [])
-                processing_log.append(f"전체 워크플로우 처리 시간: {total_time_display}")
-                state["processing_log"] = processing_log
+                state.setdefault("processing_log", []).append(f"전체 워크플로우 처리 시간: {total_time_display}")
                 
-                print(f"⏱전체 워크플로우 처리 시간: {total_time_display}")
-                self.logger.info(f"전체 워크플로우 처리 시간: {total_time_display}")
+                logger.debug("⏱전체 워크플로우 처리 시간: %s", total_time_display)
+                logger.info("전체 워크플로우 처리 시간: %s", total_time_display)
         except Exception as e:
-            self.logger.warning(f"전체 처리 시간 계산 실패: {e}")
+            logger.warning("전체 처리 시간 계산 실패: %s", e)
         
         return state
@@ -29,6 +29,7 @@ class ChatState(TypedDict, total=False):  # total=False로 선택적 필드 허
     user_question: str                   # 사용자 질문
     user_data: Dict[str, Any]           # 사용자 프로필 데이터
     session_id: str                     # 세션 식별자
+    request_timestamp: str              # 요청 수신 시각 (ISO 형식, 요청마다 한 번 생성하여 메시지 타임스탬프로 공유)
     
     # === 대화 내역 관리 (MemorySaver가 관리) ===
     current_session_messages: List[Dict[str, str]]  # 현재 세션의 모든 대화 내역 (이전 메시지 + 현재 세션, role, content, timestamp)
@@ -41,7 +42,8 @@ class ChatState(TypedDict, total=False):  # total=False로 선택적 필드 허
     career_cases: List[Any]                         # 3단계: 커리어 사례 검색
     education_courses: Dict[str, Any]               # 3단계: 교육과정 추천 결과
     news_data: List[Dict[str, Any]]                 # 3단계: 뉴스 데이터 검색 결과
-    formatted_response: Dict[str, Any]              # 4단계: 포맷된 응답
+    past_conversations: Optional[List[Dict[str, Any]]]  # 2~3단계: 과거 세션 대화 검색 결과 (None이면 미검색)
+    formatted_response: Dict[str, Any]              # 4단계: 포맷된 응답 (final_response와 같은 객체 - 다이어그램 통합 후 함께 갱신됨)
     mermaid_diagram: str                            # 5단계: 생성된 Mermaid 다이어그램 코드
     diagram_generated: bool                         # 5단계: 다이어그램 생성 성공 여부
     final_response: Dict[str, Any]                  # 6단계: 최종 응답 (다이어그램 통합)
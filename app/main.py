@@ -20,19 +20,21 @@ from contextlib import asynccontextmanager
 from app.api.v1.api import api_router
 from app.config.settings import settings
 from dotenv import load_dotenv
+import asyncio
 import os
 
 # 환경변수 로드 (최상단에 위치)
 load_dotenv()
 
 from app.core.dependencies import get_service_container
+from app.graphs.agents.retriever import get_career_retriever_agent
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     앱 라이프사이클을 관리한다.
-    애플리케이션 시작 시 세션 자동 정리를 활성화하고,
+    애플리케이션 시작 시 커리어 리트리버를 미리 준비하고 세션 자동 정리를 활성화하며,
     종료 시 자동 정리를 중지합니다.
     
     @param app: FastAPI - FastAPI 애플리케이션 인스턴스
@@ -40,6 +42,13 @@ async def lifespan(app: FastAPI):
     # 시작 시
     print(" Career Path Chat API 시작...")  # 애플리케이션 시작 로그 출력
     
+    # 커리어 리트리버 미리 생성 (Chroma 연결 + BM25 인덱스 구축을 첫 요청 전에 완료)
+    try:  # 예외 처리 시작
+        await asyncio.to_thread(get_career_retriever_agent)  # 싱글톤 생성 (이벤트 루프 블로킹 방지)
+        print(" 커리어 리트리버 준비 완료")  # 성공 로그 출력
+    except Exception as e:  # 예외 발생 시
+        print(f" 커리어 리트리버 준비 실패: {e}")  # 실패 로그 출력
+    
     # 세션 자동 정리 시작
     try:  # 예외 처리 시작
         container = get_service_container()  # 서비스 컨테이너 조회
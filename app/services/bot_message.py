@@ -10,6 +10,8 @@
 from typing import Dict, Any
 import os
 
+from app.config.openai_config import OPENAI_CONFIG
+
 class BotMessageService:
     """
     봇 메시지 생성 서비스
@@ -23,10 +25,10 @@ class BotMessageService:
         """OpenAI 클라이언트 초기화"""
         try:
             from openai import AsyncOpenAI
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = OPENAI_CONFIG.api_key
             if api_key:
                 self.openai_client = AsyncOpenAI(api_key=api_key)
-                self.model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+                self.model = OPENAI_CONFIG.model
                 self.max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", "500"))
                 self.temperature = float(os.getenv("OPENAI_TEMPERATURE", "0.5"))
                 print("BotMessageService OpenAI 연결 완료")
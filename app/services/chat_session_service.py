@@ -183,9 +183,9 @@ class ChatSessionService:
             print(f" 전체 활성 세션 수: {len(all_sessions)}")
             print(f" 활성 세션 목록: {list(all_sessions.keys())}")
             
-            # 현재 세션의 히스토리 조회
-            history = history_manager.get_history(conversation_id)
+            # 현재 세션의 히스토리 조회 (한 번만 읽고 OpenAI 형식은 같은 데이터에서 생성)
             full_history = history_manager.get_history_with_metadata(conversation_id)
+            history = [{"role": msg["role"], "content": msg["content"]} for msg in full_history]
             
             print(f" 세션 {conversation_id} 상세 정보:")
             print(f"   OpenAI 형식 메시지: {len(history)}개")
@@ -7,9 +7,32 @@
 *
 """
 
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from app.config.openai_config import OPENAI_CONFIG
+
+
+@lru_cache()
+def _get_encoding():
+    """응답 모델용 tiktoken 인코더 (로드 성공 시에만 캐시 - 실패하면 예외를 그대로 올려 다음 호출에서 재시도)"""
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(OPENAI_CONFIG.model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _count_tokens(content: str) -> int:
+    """메시지 내용의 토큰 수 계산 (인코더 로드 실패 시 글자 수로 추정)"""
+    try:
+        encoding = _get_encoding()
+    except Exception as e:
+        print(f"tiktoken 인코더 로드 실패 (글자 수로 추정): {e}")
+        return len(content)
+    return len(encoding.encode(content))
+
 class ConversationHistoryManager:
     """
     세션별 대화 히스토리 관리 서비스
@@ -53,6 +76,30 @@ class ConversationHistoryManager:
         
         print(f"메시지 추가: {conversation_id} ({role}) - 총 {len(self.session_histories[conversation_id])}개")
     
+    def add_messages_bulk(self, conversation_id: str, entries: List[Tuple[str, str, Dict[str, Any]]]):
+        """
+        여러 메시지를 한 번에 추가 (user-assistant 한 턴 저장용)
+        
+        Args:
+            conversation_id: 대화방 ID
+            entries: (role, content, metadata) 튜플 목록
+        """
+        history = self.session_histories.setdefault(conversation_id, [])
+        timestamp = datetime.utcnow().isoformat()
+        for role, content, metadata in entries:
+            history.append({
+                "role": role,
+                "content": content,
+                "timestamp": timestamp,
+                "metadata": metadata or {}
+            })
+            
+            # 최대 메시지 수 제한 (add_message와 동일 - 가장 오래된 2개 메시지 제거)
+            if len(history) > self.max_messages:
+                del history[:2]
+        
+        print(f"메시지 {len(entries)}개 추가: {conversation_id} - 총 {len(history)}개")
+    
     def get_history(self, conversation_id: str) -> List[Dict[str, str]]:
         """
         OpenAI API 형식으로 대화 히스토리 반환
@@ -73,6 +120,34 @@ class ConversationHistoryManager:
         
         return openai_messages
     
+    def get_history_within_budget(self, conversation_id: str, token_budget: int, max_turns: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        토큰 예산 안에 들어가는 최근 대화 히스토리를 OpenAI API 형식으로 반환
+        
+        가장 최근 메시지부터 거꾸로 누적하여 예산을 넘기 직전까지만 포함합니다.
+        max_turns가 주어지면 최근 max_turns 턴(user+assistant 2개 메시지)까지만 포함합니다.
+        토큰 수는 저장 시점이 아닌 여기서 처음 필요할 때 계산하고 메시지에 기록해 재사용합니다.
+        """
+        messages = self.session_histories.get(conversation_id, [])
+        
+        used = 0
+        start = len(messages)
+        floor = max(0, start - max_turns * 2) if max_turns is not None else 0
+        while start > floor:
+            message = messages[start - 1]
+            tokens = message.get("tokens")
+            if tokens is None:
+                tokens = message["tokens"] = _count_tokens(message["content"])
+            if used + tokens > token_budget:
+                break
+            used += tokens
+            start -= 1
+        
+        return [
+            {"role": msg["role"], "content": msg["content"]}
+            for msg in messages[start:]
+        ]
+    
     def get_history_with_metadata(self, conversation_id: str) -> List[Dict[str, Any]]:
         """
         메타데이터 포함한 전체 히스토리 반환
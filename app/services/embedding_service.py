@@ -0,0 +1,76 @@
+# app/services/embedding_service.py
+"""
+* @className : EmbeddingService
+* @description : 임베딩 캐시 서비스 모듈
+*                OpenAI 임베딩 호출 결과를 텍스트 해시(SHA-256 앞 16자리) 기준으로
+*                캐시하여 같은 텍스트의 중복 임베딩 호출을 제거합니다.
+*                여러 텍스트는 캐시 미스만 모아 한 번의 API 호출로 처리합니다.
+*
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import List
+
+import numpy as np
+
+
+class EmbeddingService:
+    """
+    텍스트 해시 기반 임베딩 LRU 캐시
+    """
+
+    def __init__(self, model: str = "text-embedding-3-small", max_entries: int = 4096):
+        """
+        초기화
+        model: 임베딩 모델명
+        max_entries: 최대 캐시 항목 수 (가장 오래 사용되지 않은 항목부터 제거)
+        """
+        self.model = model
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        print(f"EmbeddingService 초기화 (모델: {model}, 최대 {max_entries}개)")
+
+    @staticmethod
+    def _key(text: str) -> str:
+        """캐시 키 - SHA-256 해시 앞 16자리"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+    async def embed(self, client, text: str) -> np.ndarray:
+        """단일 텍스트 임베딩"""
+        return (await self.embed_batch(client, [text]))[0]
+
+    async def embed_batch(self, client, texts: List[str]) -> List[np.ndarray]:
+        """
+        여러 텍스트 임베딩 - 캐시 미스만 한 번의 API 호출로 요청
+
+        Args:
+            client: AsyncOpenAI 클라이언트
+            texts: 임베딩할 텍스트 목록
+
+        Returns:
+            입력 순서와 같은 순서의 임베딩 목록 (fp16 numpy 배열, 파이썬 리스트 변환 없음)
+        """
+        keys = [self._key(text) for text in texts]
+
+        # 캐시 적중은 바로 사용하고, 미스 텍스트만 중복 없이 수집
+        vectors = {}
+        miss_texts = {}
+        for key, text in zip(keys, texts):
+            if key in vectors or key in miss_texts:
+                continue
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                vectors[key] = self._cache[key]
+            else:
+                miss_texts[key] = text
+
+        if miss_texts:
+            response = await client.embeddings.create(model=self.model, input=list(miss_texts.values()))
+            for key, item in zip(miss_texts.keys(), response.data):
+                # fp16으로 저장하여 캐시 메모리 사용량을 절반으로 줄임
+                vectors[key] = self._cache[key] = np.asarray(item.embedding, dtype=np.float16)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        return [vectors[key] for key in keys]
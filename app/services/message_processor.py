@@ -6,8 +6,9 @@
 *                메시지 전처리, 워크플로우 실행, 응답 후처리를 담당합니다.
 """
 
+import logging
+from datetime import datetime
 from typing import Dict, Any
-import traceback
 
 
 class MessageProcessor:
@@ -19,6 +20,7 @@ class MessageProcessor:
     """
     
     def __init__(self):
+        self.logger = logging.getLogger(__name__)
         print("MessageProcessor 초기화")
     
     async def process_message(
@@ -34,7 +36,7 @@ class MessageProcessor:
         LangGraph를 통한 메시지 처리
         """
         try:  # 메시지 처리 시작
-            print(f"MessageProcessor 메시지 처리 시작: {conversation_id} - {user_question[:50]}...")
+            self.logger.info("MessageProcessor 메시지 처리 시작: %s - %.50s...", conversation_id, user_question)
             
             # 입력 상태 구성
             input_state = self._build_input_state(  # 입력 상태 구성 호출
@@ -44,22 +46,22 @@ class MessageProcessor:
                 user_info=user_info
             )
             
-            print(f"MessageProcessor LangGraph 실행 시작")
+            self.logger.debug("MessageProcessor LangGraph 실행 시작")
             
             # LangGraph 실행
             result = await graph.ainvoke(input_state, config)  # LangGraph 실행 호출
             
-            print(f"MessageProcessor LangGraph 실행 완료")
+            self.logger.debug("MessageProcessor LangGraph 실행 완료")
             
             # 응답 추출 및 검증
             bot_message = self._extract_bot_message(result)  # 봇 메시지 추출 호출
             
-            print(f"MessageProcessor 최종 응답: {bot_message[:100]}...")
+            self.logger.debug("MessageProcessor 최종 응답: %.100s...", bot_message)
             return bot_message
             
         except Exception as e:  # 예외 처리
-            print(f"MessageProcessor 메시지 처리 실패: {e}")
-            print(f"MessageProcessor 상세 에러: {traceback.format_exc()}")
+            # 스택 트레이스 포맷팅은 로깅 핸들러에 맡김 (ERROR가 출력되는 경우에만 수행)
+            self.logger.exception("MessageProcessor 메시지 처리 실패: %s", e)
             return self._generate_error_message(str(e))  # 에러 메시지 생성 호출
     
     def _build_input_state(
@@ -75,11 +77,13 @@ class MessageProcessor:
             "user_question": message_text,
             "user_data": user_info,
             "session_id": conversation_id,
+            "request_timestamp": datetime.now().isoformat(),  # 요청 단위 타임스탬프 (노드들이 공유)
             # 추가 필드들 초기화 (current_session_messages 제외 - MemorySaver가 관리)
             # Note: current_session_messages는 MemorySaver에서 복원되므로 초기화하지 않음
             "intent_analysis": {},
             "career_cases": [],
             "education_courses": {},
+            "past_conversations": None,  # 이전 턴의 검색 결과 재사용 방지
             "formatted_response": {},
             "mermaid_diagram": "",
             "diagram_generated": False,
@@ -0,0 +1,111 @@
+# app/services/response_semantic_cache.py
+"""
+* @className : ResponseSemanticCache
+* @description : 응답 시맨틱 캐시 서비스 모듈
+*                같은 대화방에서 의미상 거의 같은 질문이 반복될 때
+*                이전 응답을 재사용하여 OpenAI 호출을 생략합니다.
+*                질문 임베딩(fp16 정규화 벡터)과 응답을 대화방별로 보관합니다.
+*
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from cachetools import TTLCache
+
+
+class ResponseSemanticCache:
+    """
+    대화방별 질문 임베딩 → 응답 캐시
+    """
+
+    def __init__(self, max_entries: int = 64, threshold: float = 0.92, ttl_seconds: int = 1800, max_conversations: int = 1024):
+        """
+        초기화
+        max_entries: 대화방별 최대 캐시 항목 수 (오래된 항목부터 제거)
+        threshold: 캐시 적중으로 판단할 최소 코사인 유사도
+        ttl_seconds: 캐시 항목 유효 시간 (오래된 조언 재사용 방지)
+        max_conversations: 캐시를 유지할 최대 대화방 수 (초과 시 가장 오래 갱신되지 않은 대화방부터 제거)
+        """
+        # 대화방별 (임베딩 행렬 [n, dim] fp16, 응답 목록, 컨텍스트 지문 목록, 만료 시각 배열)
+        # 조회 시 행렬을 다시 쌓지 않도록 유지
+        # 대화방 자체도 마지막 추가 후 TTL이 지나면(= 모든 항목 만료) 제거되어 메모리가 대화방 수에 비례해 늘지 않음
+        self.entries: Dict[str, Tuple[np.ndarray, List[str], List[str], np.ndarray]] = TTLCache(
+            maxsize=max_conversations, ttl=ttl_seconds
+        )
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        print(f"ResponseSemanticCache 초기화 (대화방별 최대 {max_entries}개, 대화방 최대 {max_conversations}개, 임계값 {threshold}, TTL {ttl_seconds}초)")
+
+    @staticmethod
+    def _normalize(embedding) -> Optional[np.ndarray]:
+        """임베딩을 단위 벡터로 정규화하고 fp16으로 저장 크기를 절반으로 줄임"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return (vector / norm).astype(np.float16)
+
+    def lookup(self, conversation_id: str, embedding, fingerprint: str = "") -> Optional[str]:
+        """
+        유사한 이전 질문의 응답 조회
+
+        Args:
+            conversation_id: 대화방 ID
+            embedding: 현재 질문 임베딩
+            fingerprint: 응답이 의존하는 컨텍스트(시스템 프롬프트 등)의 지문 - 같은 지문끼리만 재사용
+
+        Returns:
+            코사인 유사도가 임계값 이상인 가장 가까운 유효 응답, 없으면 None
+        """
+        cached = self.entries.get(conversation_id)
+        if not cached:
+            return None
+
+        query = self._normalize(embedding)
+        if query is None:
+            return None
+
+        # 정규화된 벡터끼리의 내적 = 코사인 유사도 (저장은 fp16, 누적은 fp32로 계산)
+        matrix, messages, fingerprints, expires_at = cached
+        scores = np.matmul(matrix, query, dtype=np.float32)
+
+        # 만료되었거나 컨텍스트가 다른 항목은 후보에서 제외
+        valid = expires_at > time.time()
+        valid &= np.fromiter((fp == fingerprint for fp in fingerprints), dtype=bool, count=len(fingerprints))
+        scores[~valid] = -1.0
+
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return messages[best]
+        return None
+
+    def add(self, conversation_id: str, embedding, bot_message: str, fingerprint: str = ""):
+        """질문 임베딩과 응답을 캐시에 추가"""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        now = time.time()
+        expires = now + self.ttl_seconds
+        cached = self.entries.get(conversation_id)
+        if cached is not None:
+            matrix, messages, fingerprints, expires_at = cached
+            # 만료된 항목은 제거하고, 남은 항목 중 최근 max_entries - 1개만 유지
+            alive = np.flatnonzero(expires_at > now)
+            alive = alive[max(0, len(alive) - self.max_entries + 1):]
+            matrix = np.vstack((matrix[alive], vector))
+            messages = [messages[i] for i in alive] + [bot_message]
+            fingerprints = [fingerprints[i] for i in alive] + [fingerprint]
+            expires_at = np.append(expires_at[alive], expires)
+        else:
+            matrix, messages, fingerprints, expires_at = (
+                vector[np.newaxis, :], [bot_message], [fingerprint], np.array([expires])
+            )
+        self.entries[conversation_id] = (matrix, messages, fingerprints, expires_at)
+
+    def clear(self, conversation_id: str):
+        """특정 대화방의 캐시 삭제"""
+        self.entries.pop(conversation_id, None)
@@ -32,7 +32,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
 # VectorDB 구축을 위한 import 추가
-from app.utils.session_vectordb_builder import session_vectordb_builder
+from app.utils.session_vectordb_builder import get_session_vectordb_builder
 
 
 class SessionManager:
@@ -188,7 +188,7 @@ class SessionManager:
                 }
                 
                 # SessionVectorDBBuilder를 통한 VectorDB 구축 실행
-                vectordb_success = await session_vectordb_builder.build_vector_db(
+                vectordb_success = await get_session_vectordb_builder().build_vector_db(
                     conversation_id=conversation_id,
                     member_id=str(member_id),          # 사용자별 VectorDB 분리
                     user_name=user_name,
@@ -475,7 +475,7 @@ class SessionManager:
                                 "last_active": last_active
                             }
                             
-                            vectordb_success = await session_vectordb_builder.build_vector_db(
+                            vectordb_success = await get_session_vectordb_builder().build_vector_db(
                                 conversation_id=conv_id,
                                 member_id=str(member_id),
                                 user_name=user_name,
@@ -5,10 +5,41 @@
 
 import os
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=1)
+def get_output_dir() -> str:
+    """output 디렉토리 경로 (최초 호출 시 한 번만 생성 - 상담 로그/보고서 저장마다 makedirs 시스템 콜 반복 방지)"""
+    output_dir = os.path.join(os.getcwd(), "output")
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+
+# HTML 파일 쓰기 전용 스레드 - 비동기 상담 노드의 이벤트 루프를 파일 쓰기로 막지 않음
+# (작업자 1개로 제출 순서대로 기록)
+_html_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="html-logger")
+
+
+def _write_html_file(filepath: str, html_content: str) -> str:
+    """HTML 파일 기록 (html-logger 스레드에서 실행) - 한 번에 인코딩하여 바이너리로 기록"""
+    with open(filepath, 'wb') as f:
+        f.write(html_content.encode('utf-8'))
+    return filepath
+
+
+def _on_html_written(future: Future) -> None:
+    """HTML 저장 완료 콜백"""
+    error = future.exception()
+    if error is not None:
+        print(f" HTML 저장 실패: {error}")
+    else:
+        print(f" 커리어 상담 응답 HTML 저장: {os.path.basename(future.result())}")
+
+
 def markdown_to_html(text: str) -> str:
     """간단한 Markdown을 HTML로 변환 (깔끔하고 읽기 쉬운 레이아웃)"""
     if not text:
@@ -243,9 +274,8 @@ def markdown_to_html(text: str) -> str:
 def save_career_response_to_html(stage: str, response_data: Dict[str, Any], session_id: str = "unknown"):
     """커리어 상담 응답을 HTML 파일로 저장 (Mermaid 다이어그램 포함)"""
     try:
-        # output 폴더 생성 (작업 디렉토리 기준)
-        output_dir = os.path.join(os.getcwd(), "output")
-        os.makedirs(output_dir, exist_ok=True)
+        # output 폴더 (작업 디렉토리 기준, 최초 1회만 생성)
+        output_dir = get_output_dir()
         
         # 파일명 생성
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -385,11 +415,8 @@ def save_career_response_to_html(stage: str, response_data: Dict[str, Any], sess
 </html>
         """
         
-        # 파일 저장
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        print(f" 커리어 상담 응답 HTML 저장: {filename}")
+        # 파일 저장은 전용 스레드에 맡기고 바로 반환 (결과는 완료 콜백에서 출력)
+        _html_writer.submit(_write_html_file, filepath, html_content).add_done_callback(_on_html_written)
     
     except Exception as e:
         print(f" HTML 저장 실패: {e}")
@@ -398,10 +425,8 @@ def save_career_response_to_html(stage: str, response_data: Dict[str, Any], sess
 def save_simple_log(stage: str, message: str, session_id: str = "unknown"):
     """간단한 텍스트 로그도 함께 저장 (백업용)"""
     try:
-        output_dir = os.path.join(os.getcwd(), "output")
-        os.makedirs(output_dir, exist_ok=True)
+        output_dir = get_output_dir()
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = os.path.join(output_dir, "career_consultation_log.txt")
         
         with open(log_file, 'a', encoding='utf-8') as f:
@@ -8,8 +8,9 @@
 """
 
 import os
-import json
+import orjson
 import asyncio
+from functools import lru_cache
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -24,6 +25,22 @@ from dotenv import load_dotenv
 # 환경변수 로드
 load_dotenv()
 
+# 메시지 role → 한국어 표기 매핑
+_ROLE_KR = {'user': '사용자', 'assistant': 'AI', 'system': '시스템'}
+
+# 포괄적인 불용어 리스트 - 한국어 조사, 일반적 표현, 시스템 메시지 등
+_COMMON_WORDS = frozenset({
+    # 한국어 조사/어미
+    '은', '는', '이', '가', '을', '를', '에', '의', '와', '과', '로', '으로', '에서', '부터', '까지',
+    # 일반적인 대화 표현
+    'AI', '사용자', '시스템', '안녕하세요', '님', '합니다', '입니다', '있습니다', '됩니다', 
+    '해주세요', '것', '수', '때', '등', '그', '저', '제', '거', '네', '요', '좀', '더', '정말',
+    '사실', '그런데', '그래서', '하지만', '만약', '혹시', '아마', '특히', '예를들어', '때문에',
+    # 시스템 특화 표현 (G.Navi 관련)
+    '오현진의', '오현진님!', 'Growth', 'Navigator에', 'G.Navi', '전문', '상담사인', '테스트사용자의',
+    '개발자가', '싶어요.', '안녕하세요!'
+})
+
 class SessionVectorDBBuilder:
     """
     🗃️ 사용자별 채팅 세션 대화내역 VectorDB 구축 및 관리 클래스
@@ -109,15 +126,8 @@ class SessionVectorDBBuilder:
             if isinstance(msg, dict):
                 role = msg.get('role', 'unknown')
                 content = msg.get('content', '')
-                
-                if role == 'user':
-                    text_parts.append(f"사용자: {content}")
-                elif role == 'assistant':
-                    text_parts.append(f"AI: {content}")
-                elif role == 'system':
-                    text_parts.append(f"시스템: {content}")
-                else:
-                    text_parts.append(f"{role}: {content}")
+                role_korean = _ROLE_KR.get(role, role)
+                text_parts.append(f"{role_korean}: {content}")
         
         return "\n".join(text_parts)
     
@@ -447,19 +457,6 @@ class SessionVectorDBBuilder:
             3. 중복 제거 및 길이 제한 (2글자 이상)
             4. 최종 5개 키워드 선별
         """
-        #  포괄적인 불용어 리스트 - 한국어 조사, 일반적 표현, 시스템 메시지 등
-        common_words = {
-            # 한국어 조사/어미
-            '은', '는', '이', '가', '을', '를', '에', '의', '와', '과', '로', '으로', '에서', '부터', '까지',
-            # 일반적인 대화 표현
-            'AI', '사용자', '시스템', '안녕하세요', '님', '합니다', '입니다', '있습니다', '됩니다', 
-            '해주세요', '것', '수', '때', '등', '그', '저', '제', '거', '네', '요', '좀', '더', '정말',
-            '사실', '그런데', '그래서', '하지만', '만약', '혹시', '아마', '특히', '예를들어', '때문에',
-            # 시스템 특화 표현 (G.Navi 관련)
-            '오현진의', '오현진님!', 'Growth', 'Navigator에', 'G.Navi', '전문', '상담사인', '테스트사용자의',
-            '개발자가', '싶어요.', '안녕하세요!'
-        }
-        
         #  단어 추출 및 기본 필터링
         import re
         words = re.findall(r'\b\w+\b', text)
@@ -468,7 +465,7 @@ class SessionVectorDBBuilder:
         filtered_keywords = []
         for word in words:
             if (len(word) > 1 and                    # 2글자 이상
-                word not in common_words and         # 불용어가 아님
+                word not in _COMMON_WORDS and        # 불용어가 아님
                 not word.isdigit() and               # 숫자가 아님
                 word not in filtered_keywords):      # 중복이 아님
                 filtered_keywords.append(word)
@@ -641,8 +638,7 @@ class SessionVectorDBBuilder:
             
             # 📖 기존 인덱스 로드 또는 새로 생성
             if index_file.exists():
-                with open(index_file, 'r', encoding='utf-8') as f:
-                    index_data = json.load(f)
+                index_data = orjson.loads(index_file.read_bytes())
             else:
                 index_data = {
                     "member_id": metadata["member_id"],
@@ -663,8 +659,8 @@ class SessionVectorDBBuilder:
             index_data["last_updated"] = datetime.utcnow().isoformat()
             index_data["total_sessions"] = len(index_data["sessions"])
             
-            with open(index_file, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, ensure_ascii=False, indent=2)
+            # orjson은 UTF-8 바이트를 바로 생성 (ensure_ascii=False와 동일한 출력)
+            index_file.write_bytes(orjson.dumps(index_data, option=orjson.OPT_INDENT_2))
             
             print(f"    세션 인덱스 업데이트 완료: {metadata['member_id']} - 총 {len(index_data['sessions'])}개 세션")
             
@@ -790,8 +786,7 @@ class SessionVectorDBBuilder:
                     "message": "저장된 세션이 없습니다"
                 }
             
-            with open(index_file, 'r', encoding='utf-8') as f:
-                index_data = json.load(f)
+            index_data = orjson.loads(index_file.read_bytes())
             
             #  통계 계산 및 최근 세션 정보 추출
             sessions = index_data.get("sessions", {})
@@ -831,4 +826,7 @@ class SessionVectorDBBuilder:
 
 
 # 🌍 전역 인스턴스 - 애플리케이션 전체에서 공유
-session_vectordb_builder = SessionVectorDBBuilder()
+# import 시점에 임베딩 클라이언트를 만들지 않도록 첫 사용 시 한 번만 생성
+@lru_cache(maxsize=1)
+def get_session_vectordb_builder() -> SessionVectorDBBuilder:
+    return SessionVectorDBBuilder()
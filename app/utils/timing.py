@@ -0,0 +1,45 @@
+# app/utils/timing.py
+"""
+* @className : Timing Utils
+* @description : 처리 시간 표시 유틸리티 모듈
+*                워크플로우 노드의 단계별 처리 시간을 μs / ms / 초 단위 문자열로 변환합니다.
+*                time.perf_counter_ns() 정수 값을 그대로 사용하여 부동소수점 변환을 줄입니다.
+*                단계 처리 시간은 processing_log 기록과 함께 total_processing_time(초)에 누적합니다.
+*
+"""
+
+import time
+
+
+def fmt_ns(delta_ns: int) -> str:
+    """
+    나노초 단위 경과 시간을 표시용 문자열로 변환
+
+    1ms 미만은 μs, 10ms 미만은 ms(소수 첫째 자리), 그 이상은 초(소수 셋째 자리)로 표시합니다.
+    """
+    if delta_ns < 1_000_000:  # 마이크로초 단위인 경우
+        return f"{delta_ns // 1000}μs"
+    if delta_ns < 10_000_000:  # 밀리초 단위인 경우
+        return f"{delta_ns / 1_000_000:.1f}ms"
+    return f"{delta_ns / 1_000_000_000:.3f}초"  # 초 단위인 경우
+
+
+def format_elapsed(start_ns: int) -> str:
+    """time.perf_counter_ns()로 기록한 시작 시점부터의 경과 시간 문자열"""
+    return fmt_ns(time.perf_counter_ns() - start_ns)
+
+
+def record_step_time(state: dict, start_ns: int, label: str) -> str:
+    """
+    단계 처리 시간을 processing_log와 total_processing_time에 기록
+
+    총 처리 시간은 로그 문자열을 다시 파싱하지 않도록 각 단계에서 초 단위로 바로 누적합니다.
+
+    Returns:
+        str: 표시용 처리 시간 문자열
+    """
+    step_ns = time.perf_counter_ns() - start_ns
+    time_display = fmt_ns(step_ns)
+    state.setdefault("processing_log", []).append(f"{label}: {time_display}")
+    state["total_processing_time"] = state.get("total_processing_time", 0.0) + step_ns / 1e9
+    return time_display